@@ -1,73 +1,109 @@
-import logging.config
+import atexit
+import logging
 import logging.handlers
 import os
 import pathlib
+import sys
+
+import structlog
+
+from eventum.logging.handlers import create_queue_sink
+from eventum.logging.processors import RateLimiter
 
 LOG_DIR = os.path.join(pathlib.Path.home(), '.eventum', 'logs')
 MiB = 1024 * 1024
 
+LOGGERS = (
+    'eventum_cli',
+    '__main__',
+    'eventum_core',
+    'eventum.plugins',
+    'eventum_content_manager',
+)
+
 
 def apply(
     stderr_level: int = logging.WARNING,
     file_level: int = logging.INFO,
-    log_filename: str = 'eventum.log'
+    log_filename: str = 'eventum.log',
+    rate_limit_interval: float = 10,
+    rate_limit_burst: int = 10,
+    queue_max_size: int = 10_000,
+    summary_interval: float = 60
 ):
     log_path = os.path.join(LOG_DIR, log_filename)
-    config = {
-        'version': 1,
-        'formatters': {
-            'file-formatter': {
-                'format': (
-                    '%(asctime)s %(name)s [%(levelname)s]: %(message)s'
-                )
-            },
-            'stderr-formatter': {
-                'format': (
-                    '%(name)s: %(message)s'
-                )
-            },
-        },
-        'handlers': {
-            'stderr': {
-                'level': logging._levelToName[stderr_level],
-                'formatter': 'stderr-formatter',
-                'class': 'logging.StreamHandler',
-                'stream': 'ext://sys.stderr'
-            },
-            'file': {
-                'level': logging._levelToName[file_level],
-                'formatter': 'file-formatter',
-                'class': 'logging.handlers.RotatingFileHandler',
-                'filename': log_path,
-                'maxBytes': 5 * MiB,
-                'backupCount': 10
-            }
-        },
-        'loggers': {
-            'eventum_cli': {
-                'handlers': ['file', 'stderr'],
-                'level': 'INFO',
-            },
-            '__main__': {
-                'handlers': ['file', 'stderr'],
-                'level': 'INFO',
-            },
-            'eventum_core': {
-                'handlers': ['file', 'stderr'],
-                'level': 'INFO',
-            },
-            'eventum.plugins': {
-                'handlers': ['file', 'stderr'],
-                'level': 'INFO',
-            },
-            'eventum_content_manager': {
-                'handlers': ['file', 'stderr'],
-                'level': 'INFO',
-            },
-        }
-    }
 
     if not os.path.exists(LOG_DIR):
         os.makedirs(LOG_DIR, exist_ok=True)
 
-    logging.config.dictConfig(config=config)
+    shared_processors: list[structlog.typing.Processor] = [
+        structlog.stdlib.add_logger_name,
+        structlog.stdlib.add_log_level,
+        structlog.processors.TimeStamper(fmt='iso'),
+    ]
+
+    stderr_handler = logging.StreamHandler(sys.stderr)
+    stderr_handler.setLevel(stderr_level)
+    stderr_handler.setFormatter(
+        structlog.stdlib.ProcessorFormatter(
+            processors=[
+                structlog.stdlib.ProcessorFormatter.remove_processors_meta,
+                structlog.dev.ConsoleRenderer(colors=False),
+            ],
+            foreign_pre_chain=shared_processors
+        )
+    )
+
+    file_handler = logging.handlers.RotatingFileHandler(
+        filename=log_path,
+        maxBytes=5 * MiB,
+        backupCount=10
+    )
+    file_handler.setLevel(file_level)
+    file_handler.setFormatter(
+        structlog.stdlib.ProcessorFormatter(
+            processors=[
+                structlog.stdlib.ProcessorFormatter.remove_processors_meta,
+                structlog.processors.format_exc_info,
+                structlog.processors.JSONRenderer(),
+            ],
+            foreign_pre_chain=shared_processors
+        )
+    )
+
+    rate_limiter = RateLimiter(
+        interval=rate_limit_interval,
+        burst=rate_limit_burst
+    )
+
+    # Handlers are run in the listener thread, so slow disk or
+    # terminal does not block producers of log records, records lost
+    # due to full queue or rate limiting are reported by the listener
+    # periodically and on exit
+    queue_handler, listener = create_queue_sink(
+        handlers=[file_handler, stderr_handler],
+        queue_max_size=queue_max_size,
+        rate_limiter=rate_limiter,
+        summary_interval=summary_interval
+    )
+    listener.start()
+    atexit.register(listener.stop)
+
+    for name in LOGGERS:
+        logger = logging.getLogger(name)
+        logger.handlers = [queue_handler]
+        logger.setLevel(logging.INFO)
+
+    structlog.configure(
+        processors=[
+            structlog.stdlib.filter_by_level,
+            *shared_processors,
+            rate_limiter,
+            structlog.stdlib.PositionalArgumentsFormatter(),
+            structlog.processors.StackInfoRenderer(),
+            structlog.stdlib.ProcessorFormatter.wrap_for_formatter,
+        ],
+        logger_factory=structlog.stdlib.LoggerFactory(),
+        wrapper_class=structlog.stdlib.BoundLogger,
+        cache_logger_on_first_use=True,
+    )
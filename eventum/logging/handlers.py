@@ -0,0 +1,266 @@
+import logging
+import logging.handlers
+import queue
+import time
+from threading import Lock
+from typing import Callable, Mapping, Sequence
+
+from eventum.logging.processors import RateLimiter
+
+DEFAULT_QUEUE_MAX_SIZE = 10_000
+DEFAULT_SUMMARY_INTERVAL = 60
+
+
+class NonBlockingQueueHandler(logging.handlers.QueueHandler):
+    """Handler that puts log records to bounded queue without blocking
+    the caller. Records that do not fit into queue are dropped and
+    counted.
+
+    Parameters
+    ----------
+    queue : queue.Queue
+        Queue to put records to, it is expected to be consumed by
+        `logging.handlers.QueueListener` in the same process
+
+    Notes
+    -----
+    Records are put into queue as is, without preliminary formatting,
+    so formatters of handlers behind the queue (e.g.
+    `structlog.stdlib.ProcessorFormatter`) receive original records
+    """
+
+    def __init__(self, queue: queue.Queue) -> None:
+        super().__init__(queue)
+        self._dropped = 0
+        self._dropped_lock = Lock()
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return record
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            with self._dropped_lock:
+                self._dropped += 1
+
+    def pop_dropped(self) -> int:
+        """Get number of dropped records and reset counter.
+
+        Returns
+        -------
+        int
+            Number of records dropped since previous call
+        """
+        with self._dropped_lock:
+            dropped = self._dropped
+            self._dropped = 0
+
+        return dropped
+
+
+def create_summary_record(
+    dropped: int,
+    suppressed: Mapping[str, int]
+) -> logging.LogRecord | None:
+    """Create record summarizing log records that are lost.
+
+    Parameters
+    ----------
+    dropped : int
+        Number of records dropped due to full queue
+
+    suppressed : Mapping[str, int]
+        Number of messages suppressed by rate limiting by descriptions
+        of message keys
+
+    Returns
+    -------
+    logging.LogRecord | None
+        Warning record or `None` if nothing is lost
+    """
+    parts: list[str] = []
+
+    if dropped > 0:
+        parts.append(f'{dropped} log records dropped due to full queue')
+
+    if suppressed:
+        details = '; '.join(
+            f'{key}: {count}' for key, count in suppressed.items()
+        )
+        parts.append(
+            f'{sum(suppressed.values())} messages suppressed by rate '
+            f'limiting ({details})'
+        )
+
+    if not parts:
+        return None
+
+    return logging.LogRecord(
+        name=__name__,
+        level=logging.WARNING,
+        pathname=__file__,
+        lineno=0,
+        msg=f'Log records are lost: {", ".join(parts)}',
+        args=None,
+        exc_info=None
+    )
+
+
+class QueueSinkListener(logging.handlers.QueueListener):
+    """Listener of queue filled by `NonBlockingQueueHandler`.
+
+    Parameters
+    ----------
+    queue : queue.Queue
+        Queue to listen
+
+    *handlers : logging.Handler
+        Handlers that emit records
+
+    respect_handler_level : bool, default=False
+        Whether to respect levels of handlers
+
+    summarize : Callable[[], logging.LogRecord | None] | None, default=None
+        Callback for creating record that summarizes lost records (see
+        `create_summary_record`), it is called in listener thread
+        every `summary_interval` seconds and on stop
+
+    summary_interval : float, default=DEFAULT_SUMMARY_INTERVAL
+        Interval (in seconds) of emitting summary
+
+    Notes
+    -----
+    Unlike base listener, stop sentinel is put into queue with
+    blocking, so listener can be stopped even if queue is full
+    """
+
+    def __init__(
+        self,
+        queue: queue.Queue,
+        *handlers: logging.Handler,
+        respect_handler_level: bool = False,
+        summarize: Callable[[], logging.LogRecord | None] | None = None,
+        summary_interval: float = DEFAULT_SUMMARY_INTERVAL
+    ) -> None:
+        super().__init__(
+            queue,
+            *handlers,
+            respect_handler_level=respect_handler_level
+        )
+        self._summarize = summarize
+        self._summary_interval = summary_interval
+        self._summary_deadline = time.monotonic() + summary_interval
+
+    def start(self) -> None:
+        self._summary_deadline = time.monotonic() + self._summary_interval
+        super().start()
+
+    def _emit_summary(self) -> None:
+        """Emit summary of lost records if any."""
+        if self._summarize is None:
+            return
+
+        record = self._summarize()
+        if record is not None:
+            self.handle(record)
+
+    def dequeue(self, block: bool) -> logging.LogRecord:
+        if self._summarize is None:
+            return super().dequeue(block)
+
+        # Waiting for records is interrupted when summary is due, so
+        # it is emitted even if there are no records
+        while True:
+            timeout = self._summary_deadline - time.monotonic()
+
+            if timeout <= 0:
+                self._emit_summary()
+                self._summary_deadline = (
+                    time.monotonic() + self._summary_interval
+                )
+                continue
+
+            try:
+                return self.queue.get(block, timeout)
+            except queue.Empty:
+                if not block:
+                    raise
+
+    def enqueue_sentinel(self) -> None:
+        self.queue.put(self._sentinel)  # type: ignore[attr-defined]
+
+    def stop(self) -> None:
+        super().stop()
+
+        # Records that are lost after the last periodic summary
+        self._emit_summary()
+
+
+def create_queue_sink(
+    handlers: Sequence[logging.Handler],
+    queue_max_size: int = DEFAULT_QUEUE_MAX_SIZE,
+    rate_limiter: RateLimiter | None = None,
+    summary_interval: float = DEFAULT_SUMMARY_INTERVAL
+) -> tuple[NonBlockingQueueHandler, QueueSinkListener]:
+    """Create background sink that passes records to specified
+    handlers in separate thread.
+
+    Parameters
+    ----------
+    handlers : Sequence[logging.Handler]
+        Handlers that actually emit records
+
+    queue_max_size : int, default=DEFAULT_QUEUE_MAX_SIZE
+        Maximum number of records waiting in queue, records exceeding
+        this number are dropped
+
+    rate_limiter : RateLimiter | None, default=None
+        Rate limiter used in processors of records, suppressed
+        messages of it are reported in summary along with dropped
+        records
+
+    summary_interval : float, default=DEFAULT_SUMMARY_INTERVAL
+        Interval (in seconds) of emitting summary of lost records, it
+        is also emitted when listener is stopped
+
+    Returns
+    -------
+    tuple[NonBlockingQueueHandler, QueueSinkListener]
+        Handler to attach to loggers and listener that must be started
+        before and stopped after logging
+
+    Raises
+    ------
+    ValueError
+        If some parameter is out of allowed range
+    """
+    if queue_max_size < 1:
+        raise ValueError('Parameter `queue_max_size` must be greater than 0')
+
+    if summary_interval <= 0:
+        raise ValueError(
+            'Parameter `summary_interval` must be greater than 0'
+        )
+
+    records: queue.Queue = queue.Queue(maxsize=queue_max_size)
+    handler = NonBlockingQueueHandler(records)
+
+    def summarize() -> logging.LogRecord | None:
+        return create_summary_record(
+            dropped=handler.pop_dropped(),
+            suppressed=(
+                rate_limiter.pop_suppressed()
+                if rate_limiter is not None else {}
+            )
+        )
+
+    listener = QueueSinkListener(
+        records,
+        *handlers,
+        respect_handler_level=True,
+        summarize=summarize,
+        summary_interval=summary_interval
+    )
+
+    return handler, listener
@@ -0,0 +1,225 @@
+import time
+from dataclasses import dataclass
+from threading import Lock
+from typing import Callable, Sequence
+
+from structlog import DropEvent
+from structlog.typing import EventDict, WrappedLogger
+
+DEFAULT_KEY_FIELDS = ('plugin_type', 'plugin_name', 'plugin_id')
+
+
+@dataclass
+class _RateWindow:
+    """State of rate limiting window for single message key.
+
+    Parameters
+    ----------
+    start : float
+        Monotonic time of window start
+
+    passed : int
+        Number of messages passed in current window
+
+    suppressed : int
+        Number of messages suppressed in current window
+    """
+    start: float
+    passed: int
+    suppressed: int
+
+
+class RateLimiter:
+    """Structlog processor that limits rate of messages with the same
+    key and aggregates suppressed ones. Key of message consists of its
+    level, event and values of key fields.
+
+    When the first message of a new window passes after some messages
+    of previous window were suppressed, number of them is added to the
+    passing message under `suppressed` field along with `interval`
+    field.
+
+    Parameters
+    ----------
+    interval : float, default=10
+        Duration (in seconds) of rate limiting window
+
+    burst : int, default=10
+        Maximum number of messages with the same key that are passed
+        within single window
+
+    key_fields : Sequence[str], default=DEFAULT_KEY_FIELDS
+        Fields of event dict that complement message key
+
+    clock : Callable[[], float], default=time.monotonic
+        Function returning current time
+
+    Raises
+    ------
+    ValueError
+        If some parameter is out of allowed range
+
+    Notes
+    -----
+    Processor is thread safe, it is expected to be placed after
+    processors filtering by level and before rendering processors
+    """
+
+    def __init__(
+        self,
+        interval: float = 10,
+        burst: int = 10,
+        key_fields: Sequence[str] = DEFAULT_KEY_FIELDS,
+        clock: Callable[[], float] = time.monotonic
+    ) -> None:
+        if interval <= 0:
+            raise ValueError('Parameter `interval` must be greater than 0')
+
+        if burst < 1:
+            raise ValueError('Parameter `burst` must be greater than 0')
+
+        self._interval = interval
+        self._burst = burst
+        self._key_fields = tuple(key_fields)
+        self._clock = clock
+
+        self._windows: dict[tuple[str, ...], _RateWindow] = dict()
+        self._lock = Lock()
+
+    def _get_key(
+        self,
+        method_name: str,
+        event_dict: EventDict
+    ) -> tuple[str, ...]:
+        """Get key of message.
+
+        Parameters
+        ----------
+        method_name : str
+            Name of logging method
+
+        event_dict : EventDict
+            Event dict of message
+
+        Returns
+        -------
+        tuple[str, ...]
+            Key of message
+        """
+        return (
+            method_name,
+            str(event_dict.get('event')),
+            *(repr(event_dict.get(field)) for field in self._key_fields)
+        )
+
+    def __call__(
+        self,
+        logger: WrappedLogger,
+        method_name: str,
+        event_dict: EventDict
+    ) -> EventDict:
+        key = self._get_key(method_name, event_dict)
+        now = self._clock()
+
+        with self._lock:
+            window = self._windows.get(key)
+
+            if window is None:
+                self._windows[key] = _RateWindow(
+                    start=now, passed=1, suppressed=0
+                )
+                return event_dict
+
+            if now - window.start >= self._interval:
+                suppressed = window.suppressed
+
+                window.start = now
+                window.passed = 1
+                window.suppressed = 0
+
+                if suppressed > 0:
+                    event_dict['suppressed'] = suppressed
+                    event_dict['interval'] = self._interval
+
+                self._evict_expired(now)
+                return event_dict
+
+            if window.passed < self._burst:
+                window.passed += 1
+                return event_dict
+
+            window.suppressed += 1
+
+        raise DropEvent
+
+    def _evict_expired(self, now: float) -> None:
+        """Remove windows that are expired and have no suppressed
+        messages so state does not grow with number of distinct keys.
+
+        Parameters
+        ----------
+        now : float
+            Current time
+        """
+        expired = [
+            key for key, window in self._windows.items()
+            if now - window.start >= self._interval and window.suppressed == 0
+        ]
+        for key in expired:
+            del self._windows[key]
+
+    def _describe_key(self, key: tuple[str, ...]) -> str:
+        """Get human readable description of message key.
+
+        Parameters
+        ----------
+        key : tuple[str, ...]
+            Key of message
+
+        Returns
+        -------
+        str
+            Description in form `[level] event (field=value, ...)`,
+            fields with missing values are omitted
+        """
+        method_name, event, *values = key
+        fields = ', '.join(
+            f'{field}={value}'
+            for field, value in zip(self._key_fields, values)
+            if value != 'None'
+        )
+
+        description = f'[{method_name}] {event}'
+        return f'{description} ({fields})' if fields else description
+
+    def pop_suppressed(self) -> dict[str, int]:
+        """Get number of messages suppressed in current windows and
+        reset counters, useful to report them periodically and on
+        shutdown.
+
+        Returns
+        -------
+        dict[str, int]
+            Number of suppressed messages by descriptions of message
+            keys
+        """
+        with self._lock:
+            suppressed = {
+                self._describe_key(key): window.suppressed
+                for key, window in self._windows.items()
+                if window.suppressed > 0
+            }
+            for window in self._windows.values():
+                window.suppressed = 0
+
+        return suppressed
+
+    @property
+    def interval(self) -> float:
+        """Duration of rate limiting window."""
+        return self._interval
+
+    @property
+    def burst(self) -> int:
+        """Maximum number of passed messages within single window."""
+        return self._burst
@@ -0,0 +1,122 @@
+import logging
+import time
+
+import pytest
+from structlog import DropEvent
+
+from eventum.logging.handlers import create_queue_sink
+from eventum.logging.processors import RateLimiter
+
+
+class CollectingHandler(logging.Handler):
+    def __init__(self) -> None:
+        super().__init__()
+        self.records: list[logging.LogRecord] = []
+
+    def emit(self, record: logging.LogRecord) -> None:
+        self.records.append(record)
+
+
+def make_record(msg: object) -> logging.LogRecord:
+    return logging.LogRecord(
+        name='test', level=logging.ERROR, pathname=__file__, lineno=0,
+        msg=msg, args=None, exc_info=None
+    )
+
+
+def test_queue_sink():
+    target = CollectingHandler()
+    handler, listener = create_queue_sink([target])
+
+    listener.start()
+    try:
+        handler.handle(make_record({'event': 'Failed'}))
+    finally:
+        listener.stop()
+
+    assert len(target.records) == 1
+    assert target.records[0].msg == {'event': 'Failed'}
+
+
+def test_queue_sink_overflow():
+    target = CollectingHandler()
+    handler, listener = create_queue_sink([target], queue_max_size=2)
+
+    for _ in range(5):
+        handler.handle(make_record('Failed'))
+
+    assert handler.pop_dropped() == 3
+    assert handler.pop_dropped() == 0
+
+    listener.start()
+    listener.stop()
+
+    assert len(target.records) == 2
+
+
+def test_queue_sink_summary_on_stop():
+    target = CollectingHandler()
+    limiter = RateLimiter(burst=1)
+    handler, listener = create_queue_sink(
+        [target],
+        queue_max_size=2,
+        rate_limiter=limiter
+    )
+
+    for _ in range(5):
+        handler.handle(make_record('Failed'))
+
+    for _ in range(3):
+        try:
+            limiter(None, 'error', {'event': 'Failed', 'plugin_id': 1})
+        except DropEvent:
+            pass
+
+    listener.start()
+    listener.stop()
+
+    assert len(target.records) == 3
+
+    summary = target.records[-1]
+    assert summary.levelno == logging.WARNING
+    assert summary.getMessage() == (
+        'Log records are lost: 3 log records dropped due to full queue, '
+        '2 messages suppressed by rate limiting '
+        '([error] Failed (plugin_id=1): 2)'
+    )
+
+
+def test_queue_sink_periodic_summary():
+    target = CollectingHandler()
+    handler, listener = create_queue_sink(
+        [target],
+        queue_max_size=1,
+        summary_interval=0.05
+    )
+
+    listener.start()
+    try:
+        # Records are dropped while listener thread is blocked by the
+        # first one
+        with listener.handlers[0].lock:
+            for _ in range(3):
+                handler.handle(make_record('Failed'))
+            time.sleep(0.1)
+
+        for _ in range(100):
+            if len(target.records) > 1:
+                break
+            time.sleep(0.01)
+
+        messages = [record.getMessage() for record in target.records]
+        assert any('dropped due to full queue' in m for m in messages)
+    finally:
+        listener.stop()
+
+
+def test_queue_sink_invalid_size():
+    with pytest.raises(ValueError):
+        create_queue_sink([], queue_max_size=0)
+
+    with pytest.raises(ValueError):
+        create_queue_sink([], summary_interval=0)
@@ -0,0 +1,73 @@
+import pytest
+from structlog import DropEvent
+from structlog.typing import EventDict
+
+from eventum.logging.processors import RateLimiter
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def log(limiter: RateLimiter, event: str, **kwargs) -> EventDict | None:
+    try:
+        return limiter(None, 'error', dict(event=event, **kwargs))
+    except DropEvent:
+        return None
+
+
+def test_rate_limiter_burst():
+    clock = FakeClock()
+    limiter = RateLimiter(interval=10, burst=3, clock=clock)
+
+    results = [log(limiter, 'Failed') for _ in range(10)]
+
+    assert sum(result is not None for result in results) == 3
+    assert results[3:] == [None] * 7
+
+
+def test_rate_limiter_aggregation():
+    clock = FakeClock()
+    limiter = RateLimiter(interval=10, burst=1, clock=clock)
+
+    assert log(limiter, 'Failed') is not None
+    for _ in range(5):
+        assert log(limiter, 'Failed') is None
+
+    clock.now = 10
+    event_dict = log(limiter, 'Failed')
+
+    assert event_dict is not None
+    assert event_dict['suppressed'] == 5
+    assert event_dict['interval'] == 10
+
+    clock.now = 20
+    event_dict = log(limiter, 'Failed')
+
+    assert event_dict is not None
+    assert 'suppressed' not in event_dict
+
+
+def test_rate_limiter_keys():
+    clock = FakeClock()
+    limiter = RateLimiter(interval=10, burst=1, clock=clock)
+
+    assert log(limiter, 'Failed', plugin_id=1) is not None
+    assert log(limiter, 'Failed', plugin_id=2) is not None
+    assert log(limiter, 'Other', plugin_id=1) is not None
+    assert log(limiter, 'Failed', plugin_id=1) is None
+
+    assert list(limiter.pop_suppressed().values()) == [1]
+    assert limiter.pop_suppressed() == {}
+
+
+def test_rate_limiter_invalid_params():
+    with pytest.raises(ValueError):
+        RateLimiter(interval=0)
+
+    with pytest.raises(ValueError):
+        RateLimiter(burst=0)
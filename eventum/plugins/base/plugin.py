@@ -254,6 +254,11 @@ class Plugin(ABC, Generic[ConfigT, ParamsT]):
         """ID of the plugin."""
         return self._id
 
+    @property
+    def config(self) -> ConfigT:
+        """Config of the plugin."""
+        return self._config
+
     @property
     def plugin_name(self) -> str:
         """Canonical name of the plugin."""
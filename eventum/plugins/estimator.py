@@ -0,0 +1,447 @@
+import time
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from typing import Mapping, Sequence
+
+import numpy as np
+from croniter import croniter
+
+from eventum.plugins.event.base.plugin import EventPlugin
+from eventum.plugins.event.exceptions import EventsExhausted
+from eventum.plugins.input.base.config import InputPluginConfig
+from eventum.plugins.input.plugins.cron.config import CronInputPluginConfig
+from eventum.plugins.input.plugins.time_patterns.config import (
+    RandomizerDirection, TimePatternConfig)
+from eventum.plugins.input.plugins.timer.config import TimerInputPluginConfig
+from eventum.plugins.output.fields import RoutingConfig
+
+CRON_SAMPLING_SIZE = 1000
+
+
+def _estimate_time_pattern_rate(config: TimePatternConfig) -> float:
+    """Estimate mean rate of time pattern.
+
+    Parameters
+    ----------
+    config : TimePatternConfig
+        Time pattern config
+
+    Returns
+    -------
+    float
+        Mean number of timestamps per second
+    """
+    period = timedelta(
+        **{config.oscillator.unit.value: config.oscillator.period}
+    ).total_seconds()
+
+    deviation = config.randomizer.deviation
+    match config.randomizer.direction:
+        case RandomizerDirection.DECREASE:
+            mean_factor = 1 - deviation / 2
+        case RandomizerDirection.INCREASE:
+            mean_factor = 1 + deviation / 2
+        case RandomizerDirection.MIXED:
+            mean_factor = 1
+
+    return config.multiplier.ratio * mean_factor / period
+
+
+def _estimate_cron_rate(config: CronInputPluginConfig) -> float:
+    """Estimate mean rate of cron input plugin.
+
+    Parameters
+    ----------
+    config : CronInputPluginConfig
+        Cron input plugin config
+
+    Returns
+    -------
+    float
+        Mean number of timestamps per second
+    """
+    iterator = croniter(config.expression, datetime(2000, 1, 1))
+    first = iterator.get_next(float)
+    last = first
+
+    for _ in range(CRON_SAMPLING_SIZE):
+        last = iterator.get_next(float)
+
+    return config.count * CRON_SAMPLING_SIZE / (last - first)
+
+
+def estimate_input_rate(
+    config: InputPluginConfig | Sequence[TimePatternConfig]
+) -> float:
+    """Estimate mean rate of timestamps generated by input plugin in
+    live mode analytically.
+
+    Parameters
+    ----------
+    config : InputPluginConfig | Sequence[TimePatternConfig]
+        Input plugin config or configs of time patterns loaded for
+        `time_patterns` input plugin
+
+    Returns
+    -------
+    float
+        Mean number of timestamps per second
+
+    Raises
+    ------
+    ValueError
+        If rate cannot be estimated for provided config
+    """
+    match config:
+        case TimerInputPluginConfig():
+            return config.count / config.seconds
+        case CronInputPluginConfig():
+            return _estimate_cron_rate(config)
+        case TimePatternConfig():
+            return _estimate_time_pattern_rate(config)
+        case [*patterns] if all(
+            isinstance(pattern, TimePatternConfig) for pattern in patterns
+        ):
+            return sum(
+                _estimate_time_pattern_rate(pattern)  # type: ignore[arg-type]
+                for pattern in patterns
+            )
+        case _:
+            raise ValueError(
+                f'Rate cannot be estimated for {type(config).__name__}'
+            )
+
+
+@dataclass(frozen=True)
+class SizeStats:
+    """Statistics of event sizes in bytes.
+
+    Parameters
+    ----------
+    count : int
+        Number of events
+
+    mean : float
+        Mean size
+
+    p50 : float
+        Median size
+
+    p95 : float
+        95th percentile of size
+
+    max : int
+        Maximum size
+    """
+    count: int
+    mean: float
+    p50: float
+    p95: float
+    max: int
+
+    @classmethod
+    def from_sizes(cls, sizes: Sequence[int]) -> 'SizeStats':
+        """Calculate statistics of sizes.
+
+        Parameters
+        ----------
+        sizes : Sequence[int]
+            Sizes of events, must not be empty
+
+        Returns
+        -------
+        SizeStats
+            Statistics
+        """
+        array = np.array(sizes)
+        return cls(
+            count=array.size,
+            mean=float(array.mean()),
+            p50=float(np.percentile(array, 50)),
+            p95=float(np.percentile(array, 95)),
+            max=int(array.max())
+        )
+
+
+@dataclass(frozen=True)
+class ProducingBenchmark:
+    """Result of event plugin benchmark.
+
+    Parameters
+    ----------
+    calls_per_second : float
+        Number of `produce` calls that single core handles per second
+
+    events_per_call : float
+        Mean number of events produced by single call
+
+    sizes : dict[str | None, SizeStats]
+        Statistics of event sizes by aliases of templates
+
+    seconds_per_event : dict[str | None, float]
+        Mean time of producing event by aliases of templates, time of
+        call is split equally between events produced by the call
+    """
+    calls_per_second: float
+    events_per_call: float
+    sizes: dict[str | None, SizeStats]
+    seconds_per_event: dict[str | None, float]
+
+    @property
+    def mean_size(self) -> float:
+        """Mean size of event in bytes among all aliases."""
+        total_count = sum(stats.count for stats in self.sizes.values())
+        if total_count == 0:
+            return 0
+
+        return sum(
+            stats.mean * stats.count for stats in self.sizes.values()
+        ) / total_count
+
+
+def benchmark_producing(
+    plugin: EventPlugin,
+    count: int = 1000,
+    tags: tuple[str, ...] = tuple()
+) -> ProducingBenchmark:
+    """Benchmark producing of events by event plugin.
+
+    Parameters
+    ----------
+    plugin : EventPlugin
+        Event plugin, it is expected to be dedicated instance since its
+        state is changed during benchmark
+
+    count : int, default=1000
+        Number of `produce` calls
+
+    tags : tuple[str, ...], default=()
+        Tags passed to plugin
+
+    Returns
+    -------
+    ProducingBenchmark
+        Result of benchmark
+
+    Raises
+    ------
+    ValueError
+        If `count` is less than 1 or no events are produced
+
+    PluginRuntimeError
+        If error occurs during producing events
+    """
+    if count < 1:
+        raise ValueError('Parameter `count` must be greater than 0')
+
+    sizes: dict[str | None, list[int]] = dict()
+    seconds: dict[str | None, float] = dict()
+    total_seconds = 0.0
+    calls = 0
+    events_count = 0
+
+    timestamp = datetime.now().astimezone()
+    for _ in range(count):
+        start = time.perf_counter()
+        try:
+            events = plugin.produce_with_aliases(
+                params={'timestamp': timestamp, 'tags': tags}
+            )
+        except EventsExhausted:
+            break
+        elapsed = time.perf_counter() - start
+
+        total_seconds += elapsed
+        calls += 1
+        events_count += len(events)
+
+        for event, alias in events:
+            sizes.setdefault(alias, []).append(len(event.encode()))
+            seconds[alias] = seconds.get(alias, 0) + elapsed / len(events)
+
+    if events_count == 0:
+        raise ValueError('No events are produced')
+
+    return ProducingBenchmark(
+        calls_per_second=calls / total_seconds if total_seconds else np.inf,
+        events_per_call=events_count / calls,
+        sizes={
+            alias: SizeStats.from_sizes(alias_sizes)
+            for alias, alias_sizes in sizes.items()
+        },
+        seconds_per_event={
+            alias: seconds[alias] / len(alias_sizes)
+            for alias, alias_sizes in sizes.items()
+        }
+    )
+
+
+@dataclass(frozen=True)
+class StageEstimate:
+    """Estimate of pipeline stage.
+
+    Parameters
+    ----------
+    name : str
+        Name of stage
+
+    required_rate : float
+        Rate (in items per second) that stage must handle
+
+    capacity : float
+        Rate (in items per second) that single core handles in stage
+    """
+    name: str
+    required_rate: float
+    capacity: float
+
+    @property
+    def cores(self) -> float:
+        """Number of cores required by stage."""
+        if self.capacity == 0:
+            return np.inf
+
+        return self.required_rate / self.capacity
+
+
+@dataclass(frozen=True)
+class CapacityReport:
+    """Capacity report of generator.
+
+    Parameters
+    ----------
+    timestamps_rate : float
+        Rate of timestamps generated by input plugins
+
+    events_rate : float
+        Rate of produced events
+
+    sizes : dict[str | None, SizeStats]
+        Statistics of event sizes by aliases of templates
+
+    output_bytes_rate : dict[str, float]
+        Bytes per second written to each output
+
+    stages : list[StageEstimate]
+        Estimates of stages
+    """
+    timestamps_rate: float
+    events_rate: float
+    sizes: dict[str | None, SizeStats]
+    output_bytes_rate: dict[str, float]
+    stages: list[StageEstimate] = field(default_factory=list)
+
+    @property
+    def bottleneck(self) -> StageEstimate | None:
+        """Stage requiring the most cores."""
+        if not self.stages:
+            return None
+
+        return max(self.stages, key=lambda stage: stage.cores)
+
+    @property
+    def cores(self) -> float:
+        """Total number of required cores."""
+        return sum(stage.cores for stage in self.stages)
+
+    def format(self) -> str:
+        """Format report as human readable text.
+
+        Returns
+        -------
+        str
+            Formatted report
+        """
+        lines = [
+            f'Timestamps rate: {self.timestamps_rate:.2f} per second',
+            f'Events rate: {self.events_rate:.2f} per second',
+            'Event sizes (bytes):',
+        ]
+        for alias, stats in self.sizes.items():
+            lines.append(
+                f'  {alias or "-"}: mean={stats.mean:.0f} '
+                f'p50={stats.p50:.0f} p95={stats.p95:.0f} max={stats.max}'
+            )
+
+        lines.append('Outputs (bytes per second):')
+        for name, rate in self.output_bytes_rate.items():
+            lines.append(f'  {name}: {rate:.0f}')
+
+        lines.append('Stages:')
+        for stage in self.stages:
+            lines.append(
+                f'  {stage.name}: required={stage.required_rate:.2f}/s '
+                f'capacity={stage.capacity:.2f}/s cores={stage.cores:.2f}'
+            )
+
+        bottleneck = self.bottleneck
+        if bottleneck is not None:
+            lines.append(f'Bottleneck: {bottleneck.name}')
+
+        lines.append(f'Required cores: {self.cores:.2f}')
+        return '\n'.join(lines)
+
+
+def estimate_capacity(
+    timestamps_rate: float,
+    producing: ProducingBenchmark,
+    outputs: Mapping[str, RoutingConfig | None] | None = None,
+    stages: Sequence[StageEstimate] = tuple()
+) -> CapacityReport:
+    """Estimate capacity of generator.
+
+    Parameters
+    ----------
+    timestamps_rate : float
+        Rate of timestamps generated by input plugins (see
+        `estimate_input_rate`)
+
+    producing : ProducingBenchmark
+        Benchmark of event plugin (see `benchmark_producing`)
+
+    outputs : Mapping[str, RoutingConfig | None] | None, default=None
+        Routing configs by names of outputs, only template aliases
+        conditions of routing are taken into account
+
+    stages : Sequence[StageEstimate], default=()
+        Estimates of other stages (e.g. measured throughput of
+        outputs) to include in report
+
+    Returns
+    -------
+    CapacityReport
+        Capacity report
+    """
+    events_rate = timestamps_rate * producing.events_per_call
+
+    total_count = sum(stats.count for stats in producing.sizes.values())
+    alias_bytes_rate = {
+        alias: events_rate * stats.count / total_count * stats.mean
+        for alias, stats in producing.sizes.items()
+    }
+
+    output_bytes_rate: dict[str, float] = dict()
+    for name, routing in (outputs or dict()).items():
+        output_bytes_rate[name] = sum(
+            rate for alias, rate in alias_bytes_rate.items()
+            if (
+                routing is None
+                or not routing.template_aliases
+                or alias in routing.template_aliases
+            )
+        )
+
+    return CapacityReport(
+        timestamps_rate=timestamps_rate,
+        events_rate=events_rate,
+        sizes=producing.sizes,
+        output_bytes_rate=output_bytes_rate,
+        stages=[
+            StageEstimate(
+                name='event',
+                required_rate=timestamps_rate,
+                capacity=producing.calls_per_second
+            ),
+            *stages
+        ]
+    )
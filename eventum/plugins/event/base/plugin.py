@@ -78,3 +78,45 @@ class EventPlugin(Plugin[ConfigT, ParamsT], register=False):
             If no more events can be produced by event plugin
         """
         ...
+
+    def warm_up(self, count: int = 1) -> None:
+        """Prepare plugin for producing ahead of the first events
+        (e.g. fill caches and initialize lazily loaded modules)
+        without affecting state of producing. Nothing is done by
+        default.
+
+        Parameters
+        ----------
+        count : int, default=1
+            Number of throwaway producing rounds
+        """
+        pass
+
+    def produce_with_aliases(
+        self,
+        params: ProduceParams
+    ) -> list[tuple[str, str | None]]:
+        """Produce events with provided parameters along with aliases
+        of templates they are rendered from. Used for routing events
+        to outputs.
+
+        Parameters
+        ----------
+        params : ProduceParams
+            Parameters for events producing
+
+        Returns
+        -------
+        list[tuple[str, str | None]]
+           Produced events with aliases of templates, alias is `None`
+           for plugins that do not render templates
+
+        Raises
+        ------
+        PluginRuntimeError
+            If any error occurs during producing events
+
+        EventsExhausted
+            If no more events can be produced by event plugin
+        """
+        return [(event, None) for event in self.produce(params)]
@@ -198,12 +198,18 @@ class JinjaEventPlugin(
             ) from e
 
     def produce(self, params: ProduceParams) -> list[str]:
+        return [event for event, _ in self.produce_with_aliases(params)]
+
+    def produce_with_aliases(
+        self,
+        params: ProduceParams
+    ) -> list[tuple[str, str | None]]:
         self._event_context['timestamp'] = params['timestamp']
         self._event_context['tags'] = params['tags']
 
         picked_aliases = self._template_picker.pick(self._event_context)
 
-        rendered: list[str] = []
+        rendered: list[tuple[str, str | None]] = []
         for alias in picked_aliases:
             template = self._templates[alias]
 
@@ -222,13 +228,57 @@ class JinjaEventPlugin(
                         template_alias=alias
                     )
                 )
-            rendered.append(event)
+            rendered.append((event, alias))
         else:
             locals = self._template_states[alias]   # type: ignore
             self._event_context['locals'] = locals
 
         return rendered
 
+    def warm_up(self, count: int = 1) -> None:
+        """Render each template specified number of times with scratch
+        states to initialize used modules and fill caches of template
+        engine.
+
+        Parameters
+        ----------
+        count : int, default=1
+            Number of rendering rounds
+
+        Notes
+        -----
+        Picking state of templates and actual states are not affected,
+        but side effects of templates beyond states (e.g. running
+        subprocesses) are performed. Rendering errors are ignored since
+        templates can depend on states filled by producing.
+        """
+        timestamp = datetime.now().astimezone()
+        shared = SingleThreadState()
+        globals = SingleThreadState()
+        local_states = {
+            alias: SingleThreadState() for alias in self._templates.keys()
+        }
+
+        failed = 0
+        for _ in range(count):
+            for alias, template in self._templates.items():
+                try:
+                    template.render(
+                        timestamp=timestamp,
+                        tags=tuple(),
+                        locals=local_states[alias],
+                        shared=shared,
+                        globals=globals
+                    )
+                except Exception:
+                    failed += 1
+
+        self._logger.info(
+            'Plugin is warmed up',
+            count=count * len(self._templates),
+            failed=failed
+        )
+
     @property
     def local_states(self) -> dict[str, SingleThreadState]:
         """Local states of templates."""
@@ -9,6 +9,7 @@ from eventum.plugins.event.plugins.jinja.config import (
     CSVSampleConfig, ItemsSampleConfig, JinjaEventPluginConfig,
     JinjaEventPluginConfigForGeneralModes, SampleType,
     TemplateConfigForGeneralModes, TemplatePickingMode)
+from eventum.plugins.event.plugins.jinja.fsm import fields as fsm_fields
 from eventum.plugins.event.plugins.jinja.plugin import JinjaEventPlugin
 from eventum.plugins.event.plugins.jinja.state import MultiProcessState
 
@@ -555,3 +556,56 @@ def test_tags():
 
     assert len(events) == 1
     assert events.pop() == 'interesting'
+
+
+def test_warm_up():
+    # Forward references to condition models of `fsm` picking mode
+    # cannot be resolved in namespace of config module, so they are
+    # resolved explicitly
+    JinjaEventPluginConfig.model_rebuild(_types_namespace=vars(fsm_fields))
+
+    plugin = JinjaEventPlugin(
+        config=JinjaEventPluginConfig(
+            root=JinjaEventPluginConfigForGeneralModes(
+                params={},
+                samples={},
+                mode=TemplatePickingMode.ALL,
+                templates=[
+                    {
+                        'test': TemplateConfigForGeneralModes(
+                            template='test.jinja'
+                        )
+                    }
+                ]
+
+            )
+        ),
+        params={
+            'id': 1,
+            'templates_loader': DictLoader(
+                mapping={
+                    'test.jinja': (
+                        '{%- set i = locals.get("i", 1) -%}\n'
+                        '{%- set j = shared.get("j", 1) -%}\n'
+                        '{{ i }}{{ j }}\n'
+                        '{%- do locals.set("i", i + 1) -%}\n'
+                        '{%- do shared.set("j", j + 1) -%}\n'
+                    )
+                }
+            ),
+            'global_state': ...
+        }
+    )
+
+    plugin.warm_up(count=5)
+
+    events = plugin.produce(
+        params={
+            'tags': tuple(),
+            'timestamp': datetime.now().astimezone()
+        }
+    )
+
+    assert events == ['11']
+    assert plugin.local_states['test'].as_dict() == {'i': 2}
+    assert plugin.shared_state.as_dict() == {'j': 2}
@@ -1,4 +1,3 @@
-import logging
 import os
 import re
 from datetime import datetime
@@ -11,8 +10,6 @@ from eventum.plugins.event.plugins.replay.config import ReplayEventPluginConfig
 from eventum.plugins.exceptions import (PluginConfigurationError,
                                         PluginRuntimeError)
 
-logger = logging.getLogger(__name__)
-
 
 class ReplayEventPlugin(
     EventPlugin[ReplayEventPluginConfig, EventPluginParams]
@@ -86,9 +83,9 @@ class ReplayEventPlugin(
 
                 self._last_read_position = f.tell()
 
-                self._logger.info(
+                self._logger.debug(
                     'Next lines from file have been read',
-                    file_name=self._config.path,
+                    file_path=self._config.path,
                     count=len(lines)
                 )
                 return lines
@@ -223,8 +220,9 @@ class ReplayEventPlugin(
                 group_name='timestamp'
             )
         except ValueError as e:
-            logger.warning(
-                f'Failed to substitute timestamp into original message: {e}'
+            self._logger.warning(
+                'Failed to substitute timestamp into original message',
+                reason=str(e)
             )
 
         return [line]
@@ -1,17 +1,24 @@
+import time
 from abc import abstractmethod
 from concurrent.futures import Future, ThreadPoolExecutor
 from typing import (Iterator, Literal, NotRequired, Required, TypeAlias,
                     TypeVar, assert_never)
 
-from numpy import datetime64
+from numpy import datetime64, timedelta64
+from numpy.random import Generator, SeedSequence, default_rng
 from numpy.typing import NDArray
 from pydantic import RootModel
 from pytz import BaseTzInfo
 
 from eventum.plugins.base.plugin import Plugin, PluginParams
-from eventum.plugins.exceptions import PluginConfigurationError
+from eventum.plugins.exceptions import (PluginConfigurationError,
+                                        PluginRuntimeError)
 from eventum.plugins.input.base.config import InputPluginConfig
-from eventum.plugins.input.batcher import BatcherFullError, TimestampsBatcher
+from eventum.plugins.input.batcher import (BatcherFullError, LagPolicy,
+                                           TimestampsBatcher)
+from eventum.plugins.input.sharding import RangeGenerator, generate_sharded
+from eventum.plugins.input.utils.time_utils import (now64,
+                                                    timedelta64_to_seconds)
 
 QueueOverflowMode: TypeAlias = Literal['block', 'skip']
 
@@ -39,6 +46,32 @@ class InputPluginParams(PluginParams):
 
     on_queue_overflow : QueueOverflowMode, default='block'
         Block or skip adding new timestamps when batcher is overflowed
+
+    lag_policy : LagPolicy, default='catch-up'
+        Parameter `lag_policy` of `TimestampsBatcher`
+
+    max_lag : float | None, default=None
+        Parameter `max_lag` of `TimestampsBatcher`
+
+    scheduling_precision : float, default=0.0005
+        Parameter `scheduling_precision` of `TimestampsBatcher`
+
+    sample_workers : int, default=1
+        Number of worker processes generating shards of date range in
+        sample mode, only plugins supporting sharding use it
+
+    sample_shards : int | None, default=None
+        Number of shards to split date range into in sample mode, four
+        shards per worker are used if value is `None`
+
+    seed : int | SeedSequence | None, default=None
+        Entropy for random generator of plugin, fresh entropy is used
+        if value is `None`
+
+    live_horizon : float, default=1.0
+        Time (in seconds) ahead of current moment for which timestamps
+        are generated at once in live mode, only plugins supporting
+        generation by date range use it, zero value disables it
     """
     live_mode: Required[bool]
     timezone: Required[BaseTzInfo]
@@ -46,6 +79,13 @@ class InputPluginParams(PluginParams):
     batch_delay: NotRequired[float | None]
     queue_max_size: NotRequired[int]
     on_queue_overflow: NotRequired[QueueOverflowMode]
+    lag_policy: NotRequired[LagPolicy]
+    max_lag: NotRequired[float | None]
+    scheduling_precision: NotRequired[float]
+    sample_workers: NotRequired[int]
+    sample_shards: NotRequired[int | None]
+    seed: NotRequired[int | SeedSequence | None]
+    live_horizon: NotRequired[float]
 
 
 ConfigT = TypeVar(
@@ -82,7 +122,13 @@ class InputPlugin(Plugin[ConfigT, InputPluginParams], register=False):
                 batch_delay=params.get('batch_delay', 0.1),
                 scheduling=self._live_mode,
                 timezone=self._timezone,
-                queue_max_size=params.get('queue_max_size', 1_000_000)
+                queue_max_size=params.get('queue_max_size', 1_000_000),
+                lag_policy=params.get('lag_policy', 'catch-up'),
+                max_lag=params.get('max_lag', None),
+                on_lag=self._handle_lag,
+                scheduling_precision=params.get(
+                    'scheduling_precision', 0.0005
+                )
             )
         except ValueError as e:
             raise PluginConfigurationError(
@@ -94,6 +140,79 @@ class InputPlugin(Plugin[ConfigT, InputPluginParams], register=False):
             'on_queue_overflow', 'block'
         )
 
+        seed = params.get('seed', None)
+        self._seed_sequence = (
+            seed if isinstance(seed, SeedSequence) else SeedSequence(seed)
+        )
+        self._rng: Generator = default_rng(self._seed_sequence)
+
+        self._sample_workers = params.get('sample_workers', 1)
+        self._sample_shards = params.get('sample_shards', None)
+
+        if self._sample_workers < 1 or (
+            self._sample_shards is not None and self._sample_shards < 1
+        ):
+            raise PluginConfigurationError(
+                'Wrong sharding parameters',
+                context=dict(
+                    self.instance_info,
+                    reason='Number of workers and shards must be positive'
+                )
+            )
+
+        self._live_horizon = params.get('live_horizon', 1.0)
+
+        if self._live_horizon < 0:
+            raise PluginConfigurationError(
+                'Wrong live horizon parameter',
+                context=dict(
+                    self.instance_info,
+                    reason='Live horizon must be non negative'
+                )
+            )
+
+    def _handle_lag(
+        self,
+        policy: LagPolicy,
+        count: int,
+        lag: float
+    ) -> None:
+        """Report applied lag policy with number of timestamps
+        affected by it.
+
+        Parameters
+        ----------
+        policy : LagPolicy
+            Applied policy
+
+        count : int
+            Number of lagging timestamps
+
+        lag : float
+            Lag (in seconds) of the oldest timestamp
+        """
+        affected: dict[str, int]
+        match policy:
+            case 'catch-up':
+                affected = {}
+            case 'drop':
+                affected = {'dropped': count}
+            case 'collapse':
+                # The latest lagging timestamp is kept
+                affected = {'collapsed': count - 1}
+            case 'restamp':
+                affected = {'restamped': count}
+            case policy:
+                assert_never(policy)
+
+        self._logger.warning(
+            'Timestamps are lagging behind real time',
+            lag_policy=policy,
+            count=count,
+            lag=lag,
+            **affected
+        )
+
     def _handle_done_future(self, future: Future) -> None:
         """Handle future when it is done.
 
@@ -149,18 +268,168 @@ class InputPlugin(Plugin[ConfigT, InputPluginParams], register=False):
         PluginRuntimeError
             If any error occurs during timestamps generation
         """
-        with ThreadPoolExecutor(max_workers=1) as executor:
-            future = executor.submit(
-                self._generate_live
-                if self._live_mode
-                else self._generate_sample
+        if self._live_mode and self._batcher.max_lag is not None:
+            self._logger.info(
+                'Lag policy is active',
+                lag_policy=self._batcher.lag_policy,
+                max_lag=self._batcher.max_lag
+            )
+
+        if self._live_mode:
+            range_generator = (
+                self._create_live_range_generator()
+                if self._live_horizon > 0
+                else None
+            )
+        else:
+            range_generator = (
+                self._create_range_generator()
+                if self._sample_workers > 1
+                else None
             )
+
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            if self._live_mode and range_generator is not None:
+                future = executor.submit(
+                    self._generate_live_ahead, range_generator
+                )
+            elif self._live_mode:
+                future = executor.submit(self._generate_live)
+            elif range_generator is not None:
+                future = executor.submit(
+                    self._generate_sample_sharded, range_generator
+                )
+            else:
+                future = executor.submit(self._generate_sample)
+
             future.add_done_callback(self._handle_done_future)
 
             yield from self._batcher.scroll()
 
             future.result()
 
+    def _create_range_generator(self) -> RangeGenerator | None:
+        """Create generator of timestamps within parts of date range
+        for sharded generation in sample mode.
+
+        Returns
+        -------
+        RangeGenerator | None
+            Range generator or `None` if plugin doesn't support
+            sharded generation
+        """
+        return None
+
+    def _create_live_range_generator(self) -> RangeGenerator | None:
+        """Create generator of timestamps within parts of date range
+        for generation with lookahead horizon in live mode.
+
+        Returns
+        -------
+        RangeGenerator | None
+            Range generator or `None` if plugin doesn't support
+            generation with lookahead horizon
+        """
+        return None
+
+    def _generate_live_ahead(self, range_generator: RangeGenerator) -> None:
+        """Generate timestamps in live mode by enqueuing all timestamps
+        within lookahead horizon at once, batcher releases them when
+        they are due.
+
+        Parameters
+        ----------
+        range_generator : RangeGenerator
+            Range generator of plugin
+        """
+        horizon = timedelta64(int(self._live_horizon * 1_000_000), 'us')
+        start = max(range_generator.start, now64(self._timezone))
+        end = range_generator.end
+
+        self._logger.info(
+            'Generating in range',
+            start_timestamp=str(range_generator.start),
+            end_timestamp=str(end),
+            horizon=self._live_horizon
+        )
+
+        if start >= end:
+            self._logger.info(
+                'All timestamps are in past, nothing to generate'
+            )
+            return
+        elif start > range_generator.start:
+            self._logger.info('Past timestamps are skipped')
+
+        while start < end:
+            now = now64(self._timezone)
+            window_end = min(now + horizon, end)
+
+            if window_end <= start:
+                time.sleep(timedelta64_to_seconds(start - horizon - now))
+                continue
+
+            # Each window gets independent random stream, as parts of
+            # range are expected to
+            timestamps = range_generator.generate(
+                start, window_end, self._seed_sequence.spawn(1)[0]
+            )
+            if timestamps.size > 0:
+                self._enqueue(timestamps)
+
+            start = window_end
+
+            # Next window is generated when half of horizon is left, so
+            # timestamps are enqueued before they are due
+            wait_seconds = timedelta64_to_seconds(
+                start - horizon // 2 - now64(self._timezone)
+            )
+            if wait_seconds > 0:
+                time.sleep(wait_seconds)
+
+    def _generate_sample_sharded(
+        self,
+        range_generator: RangeGenerator
+    ) -> None:
+        """Generate timestamps in sample mode by shards in process
+        pool and enqueue them in order.
+
+        Parameters
+        ----------
+        range_generator : RangeGenerator
+            Range generator of plugin
+
+        Raises
+        ------
+        PluginRuntimeError
+            If any error occurs during timestamps generation
+        """
+        shards = self._sample_shards or self._sample_workers * 4
+        self._logger.info(
+            'Generating in shards',
+            start_timestamp=str(range_generator.start),
+            end_timestamp=str(range_generator.end),
+            workers=self._sample_workers,
+            shards=shards
+        )
+
+        try:
+            for timestamps in generate_sharded(
+                generator=range_generator,
+                workers=self._sample_workers,
+                shards=shards,
+                seed=self._seed_sequence
+            ):
+                if timestamps.size > 0:
+                    self._enqueue(timestamps)
+        except PluginRuntimeError:
+            raise
+        except Exception as e:
+            raise PluginRuntimeError(
+                'Failed to generate shard',
+                context=dict(self.instance_info, reason=str(e))
+            ) from e
+
     @abstractmethod
     def _generate_sample(self) -> None:
         """Start timestamps generation in sample mode. `self._enqueue`
@@ -197,3 +466,15 @@ class InputPlugin(Plugin[ConfigT, InputPluginParams], register=False):
     def live_mode(self) -> bool:
         """Status of live mode of the plugin."""
         return self._live_mode
+
+    @property
+    def timezone(self) -> BaseTzInfo:
+        """Timezone of generated timestamps."""
+        return self._timezone
+
+    @property
+    def watermark(self) -> datetime64 | None:
+        """The earliest timestamp that is generated but not yet
+        published or `None` if there are no such timestamps.
+        """
+        return self._batcher.watermark
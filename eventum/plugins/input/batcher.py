@@ -1,16 +1,19 @@
-import time
-from collections import deque
 from concurrent.futures import ThreadPoolExecutor
 from threading import Condition, RLock
-from typing import Iterator
+from typing import (Callable, Iterator, Literal, TypeAlias, assert_never,
+                    get_args)
 
-from numpy import concatenate, datetime64
+from numpy import concatenate, datetime64, full, timedelta64
 from numpy.typing import NDArray
 from pytz import timezone
 from pytz.tzinfo import BaseTzInfo
 
 from eventum.plugins.input.utils.array_utils import chunk_array, get_past_slice
-from eventum.plugins.input.utils.time_utils import now64
+from eventum.plugins.input.utils.ring_buffer import TimestampsRingBuffer
+from eventum.plugins.input.utils.time_utils import (now64,
+                                                    timedelta64_to_seconds)
+
+LagPolicy: TypeAlias = Literal['catch-up', 'drop', 'collapse', 'restamp']
 
 
 class BatcherClosedError(Exception):
@@ -32,6 +35,9 @@ class TimestampsBatcher:
     MIN_BATCH_DELAY : float
         Minimum batch delay that can be configured for batcher
 
+    INITIAL_QUEUE_CAPACITY : int
+        Initial capacity of queue storage when `batch_size` is not set
+
     Parameters
     ----------
     batch_size : int | None, default=100_000
@@ -55,14 +61,52 @@ class TimestampsBatcher:
     max_queue_size : int, default=1_000_000
         Maximum size of queue for added timestamps to prepare batches
 
+    lag_policy : LagPolicy, default='catch-up'
+        Policy of handling timestamps that are lagging behind real time
+        more than `max_lag` when `scheduling` parameter is set to
+        `True`: `catch-up` - publish them as fast as possible, `drop` -
+        drop them, `collapse` - replace them with single timestamp
+        (the latest one), `restamp` - replace their values with
+        current time and move them after the rest timestamps
+
+    max_lag : float | None, default=None
+        Maximum lag (in seconds) of timestamps behind real time after
+        which `lag_policy` is applied, lagging is not tracked if value
+        is `None`
+
+    on_lag : Callable[[LagPolicy, int, float], None] | None, default=None
+        Callback that is called with active policy, number of lagging
+        timestamps and the lag (in seconds) of the oldest one each
+        time policy is applied
+
+    scheduling_precision : float, default=0.0005
+        Time (in seconds) before due moment within which timestamp is
+        already considered as past when `scheduling` parameter is set
+        to `True`, lower values make publishing more accurate at the
+        cost of more frequent wakeups for dense timestamps
+
     Raises
     ------
     ValueError
         If some parameter is out of allowed range
+
+    Notes
+    -----
+    Queued timestamps are stored in ring buffer (see
+    `TimestampsRingBuffer`), its storage grows on demand up to
+    `queue_max_size`, so queue size is tracked in constant time and
+    batches are extracted by slices without concatenating queued
+    arrays.
+
+    With scheduling, tracking thread sleeps until the moment when the
+    next notification of consumer is due (e.g. the first timestamp or
+    the timestamp completing batch becomes past) or until state of
+    queue changes, so idle batcher doesn't consume CPU.
     """
 
     MIN_BATCH_SIZE = 1
     MIN_BATCH_DELAY = 0.1
+    INITIAL_QUEUE_CAPACITY = 1024
 
     def __init__(
         self,
@@ -70,7 +114,11 @@ class TimestampsBatcher:
         batch_delay: float | None = None,
         scheduling: bool = False,
         timezone: BaseTzInfo = timezone('UTC'),
-        queue_max_size: int = 100_000_000
+        queue_max_size: int = 100_000_000,
+        lag_policy: LagPolicy = 'catch-up',
+        max_lag: float | None = None,
+        on_lag: Callable[[LagPolicy, int, float], None] | None = None,
+        scheduling_precision: float = 0.0005
     ) -> None:
         if batch_size is None and batch_delay is None:
             raise ValueError(
@@ -96,13 +144,39 @@ class TimestampsBatcher:
         if queue_max_size < 1:
             raise ValueError('`queue_max_size` must be greater than 1')
 
+        if lag_policy not in get_args(LagPolicy):
+            raise ValueError(
+                'Parameter `lag_policy` must be one of '
+                f'{", ".join(get_args(LagPolicy))}'
+            )
+
+        if max_lag is not None and max_lag < 0:
+            raise ValueError('Parameter `max_lag` must be non negative')
+
+        if scheduling_precision < 0:
+            raise ValueError(
+                'Parameter `scheduling_precision` must be non negative'
+            )
+
         self._batch_size = batch_size
         self._batch_delay = batch_delay
         self._scheduling = scheduling
         self._timezone = timezone
         self._queue_max_size = queue_max_size
+        self._lag_policy = lag_policy
+        self._max_lag = (
+            None if max_lag is None
+            else timedelta64(int(max_lag * 1_000_000), 'us')
+        )
+        self._on_lag = on_lag
+        self._scheduling_precision = timedelta64(
+            int(scheduling_precision * 1_000_000), 'us'
+        )
 
-        self._timestamp_arrays_queue: deque[NDArray[datetime64]] = deque()
+        self._queue = TimestampsRingBuffer(
+            max_size=queue_max_size,
+            initial_capacity=batch_size or self.INITIAL_QUEUE_CAPACITY
+        )
         self._lock = RLock()
 
         # When `scheduling` is `False`, the first item is considered
@@ -114,6 +188,9 @@ class TimestampsBatcher:
         self._flush_condition = Condition(self._lock)
         self._queue_consumed_condition = Condition(self._lock)
 
+        # Wakes tracking thread up when state of queue is changed
+        self._queue_changed_condition = Condition(self._lock)
+
         self._is_closed = False
         self._is_waiting_first_item = True
 
@@ -165,7 +242,8 @@ class TimestampsBatcher:
                 addition = timestamps[:queue_available_size]
                 timestamps = timestamps[queue_available_size:]
 
-                self._timestamp_arrays_queue.append(addition)
+                self._queue.push(addition)
+                self._queue_changed_condition.notify_all()
 
                 # With active scheduling first item and flush conditions
                 # are controlled by `_track_past_timestamps`
@@ -188,6 +266,7 @@ class TimestampsBatcher:
 
         with self._lock:
             self._is_closed = True
+            self._queue_changed_condition.notify_all()
 
             if not self._scheduling:
                 if self._is_waiting_first_item:
@@ -225,37 +304,32 @@ class TimestampsBatcher:
         """
         while True:
             with self._lock:
-                if not self._is_closed and not self._timestamp_arrays_queue:
+                if not self._is_closed and self._queue.size == 0:
                     self._is_waiting_first_item = True
                     self._wait_first_item_condition.wait()
 
-                if self._is_closed and not self._timestamp_arrays_queue:
+                if self._is_closed and self._queue.size == 0:
                     break
 
-                queue_current_size = self.queue_current_size
                 if (
                     not self._is_closed and (
                         self._batch_size is None
-                        or queue_current_size < self._batch_size
+                        or self._queue.size < self._batch_size
                     )
                 ):
                     self._flush_condition.wait(timeout=self._batch_delay)
 
-                array = concatenate(self._timestamp_arrays_queue)
+                size = self._queue.size
 
-                if (
-                    self._batch_size is not None
-                    and array.size > self._batch_size
-                ):
-                    batches = chunk_array(array, self._batch_size)
-                    if len(batches[-1]) < self._batch_size:
-                        self._timestamp_arrays_queue.clear()
-                        self._timestamp_arrays_queue.append(batches.pop())
-                    else:
-                        self._timestamp_arrays_queue.clear()
+                # Incomplete batch is kept in queue to be completed
+                # unless it is the only one
+                if self._batch_size is not None and size > self._batch_size:
+                    batches = [
+                        self._queue.pop(self._batch_size)
+                        for _ in range(size // self._batch_size)
+                    ]
                 else:
-                    batches = [array, ]
-                    self._timestamp_arrays_queue.clear()
+                    batches = [self._queue.pop(size), ]
 
                 self._queue_consumed_condition.notify_all()
 
@@ -277,13 +351,14 @@ class TimestampsBatcher:
             with self._lock:
                 past_timestamps_count = self._past_timestamps_count
                 if (
-                    (not self._is_closed or self._timestamp_arrays_queue)
+                    (not self._is_closed or self._queue.size > 0)
                     and past_timestamps_count == 0
                 ):
                     self._is_waiting_first_item = True
+                    self._queue_changed_condition.notify_all()
                     self._wait_first_item_condition.wait()
 
-                if self._is_closed and not self._timestamp_arrays_queue:
+                if self._is_closed and self._queue.size == 0:
                     break
 
                 past_timestamps_count = self._past_timestamps_count
@@ -291,47 +366,94 @@ class TimestampsBatcher:
                     self._batch_size is None
                     or past_timestamps_count < self._batch_size
                 ):
+                    # Tracking thread reevaluates flush condition once
+                    # this thread starts waiting for it
+                    self._queue_changed_condition.notify_all()
                     self._flush_condition.wait(timeout=self._batch_delay)
 
-                array = concatenate(self._timestamp_arrays_queue)
-
-                past_timestamps_count = self._past_timestamps_count
-                past_timestamps = array[:past_timestamps_count]
-                future_timestamps = array[past_timestamps_count:]
+                past_timestamps = self._queue.pop(self._past_timestamps_count)
+                past_timestamps, lag_info = self._handle_lag(past_timestamps)
 
                 if (
                     self._batch_size is not None
                     and past_timestamps.size > self._batch_size
                 ):
                     batches = chunk_array(past_timestamps, self._batch_size)
+
+                    # Incomplete batch is returned to queue before
+                    # future timestamps to be completed
                     if len(batches[-1]) < self._batch_size:
-                        self._timestamp_arrays_queue.clear()
-                        self._timestamp_arrays_queue.append(batches.pop())
-                    else:
-                        self._timestamp_arrays_queue.clear()
+                        self._queue.push_front(batches.pop())
                 else:
                     batches = [past_timestamps, ]
-                    self._timestamp_arrays_queue.clear()
-
-                if future_timestamps.size > 0:
-                    self._timestamp_arrays_queue.append(future_timestamps)
 
                 self._queue_consumed_condition.notify_all()
+                self._queue_changed_condition.notify_all()
+
+            if lag_info is not None and self._on_lag is not None:
+                self._on_lag(self._lag_policy, *lag_info)
 
             for batch in batches:
-                yield batch
+                if batch.size > 0:
+                    yield batch
+
+    def _handle_lag(
+        self,
+        timestamps: NDArray[datetime64]
+    ) -> tuple[NDArray[datetime64], tuple[int, float] | None]:
+        """Apply lag policy to timestamps that are lagging behind real
+        time more than maximum lag.
+
+        Parameters
+        ----------
+        timestamps : NDArray[datetime64]
+            Timestamps in the past sorted in ascending order
+
+        Returns
+        -------
+        tuple[NDArray[datetime64], tuple[int, float] | None]
+            Timestamps with applied policy and information about lag as
+            number of lagging timestamps and lag (in seconds) of the
+            oldest one, or `None` if there are no lagging timestamps
+        """
+        if self._max_lag is None or timestamps.size == 0:
+            return timestamps, None
+
+        now = now64(self._timezone)
+        lag = now - timestamps[0]
+
+        if lag <= self._max_lag:
+            return timestamps, None
+
+        lagging_count = get_past_slice(timestamps, now - self._max_lag).size
+        lag_info = (lagging_count, timedelta64_to_seconds(lag))
+
+        match self._lag_policy:
+            case 'catch-up':
+                pass
+            case 'drop':
+                timestamps = timestamps[lagging_count:]
+            case 'collapse':
+                timestamps = timestamps[lagging_count - 1:]
+            case 'restamp':
+                # Restamped timestamps are placed after the rest ones to
+                # keep ascending order
+                timestamps = concatenate([
+                    timestamps[lagging_count:],
+                    full(lagging_count, now, dtype=timestamps.dtype)
+                ])
+            case policy:
+                assert_never(policy)
+
+        return timestamps, lag_info
 
     def _track_past_timestamps(self) -> None:
-        """Continuously track the number of timestamps in the past and
-        notify dependent thread about the first item and publish
-        conditions.
+        """Track the number of timestamps in the past and notify
+        dependent thread about the first item and publish conditions.
         """
-        while True:
-            with self._lock:
-                if (
-                    self._is_closed
-                    and not self._timestamp_arrays_queue
-                ):
+        with self._lock:
+            while True:
+                if self._is_closed and self._queue.size == 0:
                     if self._is_waiting_first_item:
                         self._wait_first_item_condition.notify_all()
                         self._is_waiting_first_item = False
@@ -356,38 +478,59 @@ class TimestampsBatcher:
                     ):
                         self._flush_condition.notify_all()
 
-            time.sleep(self.MIN_BATCH_DELAY / 2)
+                self._queue_changed_condition.wait(
+                    timeout=self._get_tracking_timeout(past_count)
+                )
+
+    def _get_tracking_timeout(self, past_count: int) -> float | None:
+        """Get time until the next moment when dependent thread should
+        be notified.
+
+        Parameters
+        ----------
+        past_count : int
+            Current count of timestamps in queue that are in the past
+
+        Returns
+        -------
+        float | None
+            Time in seconds or `None` if notification depends only on
+            changes of queue state
+        """
+        size = self._queue.size
+
+        if past_count == size:
+            return None
+
+        if self._is_waiting_first_item or past_count == 0:
+            index = past_count
+        elif self._batch_size is not None and past_count < self._batch_size:
+            if size >= self._batch_size:
+                index = self._batch_size - 1
+            elif self._is_closed and self._batch_delay is None:
+                index = size - 1
+            else:
+                return None
+        else:
+            return None
+
+        due = self._queue.get(index) - self._scheduling_precision
+        return max(timedelta64_to_seconds(due - now64(self._timezone)), 0)
 
     @property
     def _past_timestamps_count(self) -> int:
         """Count of timestamps in queue that are in the past."""
-        now = now64(self._timezone)
-
-        if not self._timestamp_arrays_queue:
+        if self._queue.size == 0:
             return 0
 
-        count = 0
-
-        for array in self._timestamp_arrays_queue:
-            if array.size == 0:
-                continue
-
-            if now < array[0]:
-                return count
-            elif now > array[-1]:
-                count += array.size
-            else:
-                past_slice = get_past_slice(array, now)
-                return count + past_slice.size
-
-        return count
+        return self._queue.count_before(
+            now64(self._timezone) + self._scheduling_precision
+        )
 
     @property
     def queue_current_size(self) -> int:
         """Current size of input queue."""
-        return sum(
-            [arr.size for arr in self._timestamp_arrays_queue]
-        )
+        return self._queue.size
 
     @property
     def queue_available_size(self) -> int:
@@ -396,6 +539,18 @@ class TimestampsBatcher:
         """
         return max(self.queue_max_size - self.queue_current_size, 0)
 
+    @property
+    def watermark(self) -> datetime64 | None:
+        """The earliest timestamp in input queue or `None` if queue
+        is empty. Batcher cannot publish timestamps earlier than it
+        unless earlier timestamps are added.
+        """
+        with self._lock:
+            if self._queue.size == 0:
+                return None
+
+            return self._queue.get(0)
+
     @property
     def queue_max_size(self) -> int:
         """Maximum size of input queue."""
@@ -415,3 +570,21 @@ class TimestampsBatcher:
     def batch_delay(self) -> float | None:
         """Batch delay."""
         return self._batch_delay
+
+    @property
+    def scheduling_precision(self) -> float:
+        """Scheduling precision in seconds."""
+        return timedelta64_to_seconds(self._scheduling_precision)
+
+    @property
+    def lag_policy(self) -> LagPolicy:
+        """Lag policy."""
+        return self._lag_policy
+
+    @property
+    def max_lag(self) -> float | None:
+        """Maximum lag in seconds."""
+        if self._max_lag is None:
+            return None
+
+        return timedelta64_to_seconds(self._max_lag)
@@ -1,7 +1,7 @@
+import heapq
+import itertools
 import threading
-import time
 from concurrent.futures import Future, ThreadPoolExecutor
-from datetime import datetime
 from typing import (Annotated, Generic, Iterable, Iterator, Literal, TypeAlias,
                     TypeVar, overload)
 
@@ -11,7 +11,10 @@ from numpy.typing import NDArray
 
 from eventum.plugins.exceptions import PluginRuntimeError
 from eventum.plugins.input.base.plugin import InputPlugin
-from eventum.plugins.input.utils.array_utils import chunk_array, merge_arrays
+from eventum.plugins.input.utils.array_utils import (
+    chunk_array, merge_sorted_arrays_with_sources)
+from eventum.plugins.input.utils.time_utils import (now64,
+                                                    timedelta64_to_seconds)
 
 logger = structlog.stdlib.get_logger()
 
@@ -24,12 +27,26 @@ class AccumulatorClosedError(Exception):
 
 
 class BatchesAccumulator(Generic[T]):
-    """Thread safe accumulator of batches."""
+    """Thread safe accumulator of batches.
 
-    def __init__(self):
+    Parameters
+    ----------
+    condition : threading.Condition | None, default=None
+        Condition to notify when batch is added or accumulator is
+        closed
+    """
+
+    def __init__(self, condition: threading.Condition | None = None):
         self._lock = threading.RLock()
-        self._batches = []
+        self._batches: list[T] = []
         self._is_closed = False
+        self._condition = condition
+
+    def _notify(self) -> None:
+        """Notify condition if it is provided."""
+        if self._condition is not None:
+            with self._condition:
+                self._condition.notify_all()
 
     def add(self, batch: T) -> None:
         """Add batch to accumulator.
@@ -50,6 +67,8 @@ class BatchesAccumulator(Generic[T]):
 
             self._batches.append(batch)
 
+        self._notify()
+
     def consume(self) -> list[T]:
         """Get all accumulated batches.
 
@@ -69,12 +88,20 @@ class BatchesAccumulator(Generic[T]):
         with self._lock:
             self._is_closed = True
 
+        self._notify()
+
     @property
     def closed(self) -> bool:
         """Closed status of accumulator."""
         with self._lock:
             return self._is_closed
 
+    @property
+    def empty(self) -> bool:
+        """Whether there are no accumulated batches."""
+        with self._lock:
+            return not self._batches
+
 
 TimestampBatch: TypeAlias = NDArray[np.datetime64]
 TimestampIdBatch: TypeAlias = Annotated[
@@ -127,8 +154,14 @@ class InputPluginsLiveMerger:
 
     Notes
     -----
-    Using ordering requires additional delays (2 * `target_delay`) for
-    publishing batches.
+    Merging is driven by notifications of plugin flows, no polling is
+    performed. Without ordering batches are published as soon as they
+    are received. With ordering each active plugin advertises low
+    watermark - the earliest timestamp it can still publish, that is
+    the earliest timestamp in its batcher queue but not later than
+    current time minus `target_delay`, and timestamps not later than
+    the minimum of watermarks among active plugins are published in
+    sorted order as soon as they are received.
     """
 
     MIN_DELAY = 0.1
@@ -167,12 +200,22 @@ class InputPluginsLiveMerger:
         self._batch_size = batch_size
         self._ordering = ordering
         self._plugins = {idx: plugin for idx, plugin in enumerate(plugins)}
+        self._condition = threading.Condition()
         self._accumulators: dict[
             int,
             BatchesAccumulator[MinimizedTimestampIdBatch]
-        ] = {idx: BatchesAccumulator() for idx in self._plugins.keys()}
+        ] = {
+            idx: BatchesAccumulator(self._condition)
+            for idx in self._plugins.keys()
+        }
         self._active_plugin_indices = list(self._plugins.keys())
-        self._overlapped_future_part: TimestampIdBatch | None = None
+
+        # Received batches that are not yet published with ordering,
+        # ordered by their first timestamps, counter breaks ties
+        self._pending: list[
+            tuple[np.datetime64, int, MinimizedTimestampIdBatch]
+        ] = []
+        self._pending_counter = itertools.count()
 
     @overload
     def generate(
@@ -309,42 +352,60 @@ class InputPluginsLiveMerger:
                 'unexpected error'
             )
 
-    def _unminimize_batch(
+    def _unminimize_batches(
         self,
-        batch: MinimizedTimestampIdBatch
+        batches: list[MinimizedTimestampIdBatch],
+        ordered: bool = False
     ) -> TimestampIdBatch:
-        """Unminimize batch converting it to structured array in which
-        id is duplicated for each timestamp.
+        """Unminimize batches converting them to single structured
+        array in which id is duplicated for each timestamp.
 
         Parameters
         ----------
-        batch : MinimizedTimestampIdBatch
-            Minimized batch
+        batches : list[MinimizedTimestampIdBatch]
+            Minimized batches, must not be empty
+
+        ordered : bool, default=False
+            Whether to merge sorted batches into sorted array instead
+            of concatenating them
 
         Returns
         -------
         TimestampIdBatch
             Unminimized timestamps batch
         """
-        timestamps = batch[0]
-        id = batch[1]
+        ids = np.array([id for _, id in batches], dtype=np.uint16)
+
+        if ordered:
+            timestamps, sources = merge_sorted_arrays_with_sources(
+                [timestamps for timestamps, _ in batches]
+            )
+            batch_ids = ids[sources]
+        else:
+            timestamps = np.concatenate(
+                [timestamps for timestamps, _ in batches]
+            )
+            batch_ids = np.repeat(
+                ids,
+                [timestamps.size for timestamps, _ in batches]
+            )
 
         unminimized_batch = np.empty(
             shape=timestamps.size,
             dtype=[('timestamp', 'datetime64[us]'), ('id', 'uint16')]
         )
         unminimized_batch['timestamp'][:] = timestamps
-        unminimized_batch['id'][:] = id
+        unminimized_batch['id'][:] = batch_ids
 
         return unminimized_batch
 
-    def _consume_batches(self) -> list[TimestampIdBatch]:
+    def _consume_batches(self) -> list[MinimizedTimestampIdBatch]:
         """Consume all currently available batches.
 
         Returns
         -------
-        list[TimestampIdBatch]
-            List of consumed batches
+        list[MinimizedTimestampIdBatch]
+            List of consumed non empty batches
         """
         if not self._active_plugin_indices:
             return []
@@ -354,7 +415,9 @@ class InputPluginsLiveMerger:
 
         for idx in self._active_plugin_indices:
             accumulator = self._accumulators[idx]
-            batches.extend(accumulator.consume())
+            batches.extend(
+                batch for batch in accumulator.consume() if batch[0].size > 0
+            )
 
             if accumulator.closed:
                 done_indices.append(idx)
@@ -362,103 +425,192 @@ class InputPluginsLiveMerger:
         for idx in done_indices:
             self._active_plugin_indices.remove(idx)
 
-        unminimized_batches: list[TimestampIdBatch] = [
-            self._unminimize_batch(batch) for batch in batches
-        ]
+        return batches
 
-        return unminimized_batches
+    def _wait_batches(self, timeout: float | None) -> None:
+        """Wait until any batch is added, any plugin finishes or
+        timeout expires.
 
-    def _generate(self,) -> Iterator[TimestampIdBatch]:
-        """Generate timestamps without ordering.
+        Parameters
+        ----------
+        timeout : float | None
+            Timeout in seconds, not limited if value is `None`
+        """
+        with self._condition:
+            if any(
+                not self._accumulators[idx].empty
+                or self._accumulators[idx].closed
+                for idx in self._active_plugin_indices
+            ):
+                return
+
+            self._condition.wait(timeout=timeout)
+
+    def _rebatch(
+        self,
+        array: TimestampIdBatch
+    ) -> Iterator[TimestampIdBatch]:
+        """Split array into batches of configured size.
+
+        Parameters
+        ----------
+        array : TimestampIdBatch
+            Array to split
 
         Yields
         ------
         TimestampIdBatch
             Timestamp batches
         """
+        if self._batch_size is None:
+            yield array
+        else:
+            yield from chunk_array(array=array, size=self._batch_size)
 
+    def _generate(self) -> Iterator[TimestampIdBatch]:
+        """Generate timestamps without ordering.
+
+        Yields
+        ------
+        TimestampIdBatch
+            Timestamp batches
+        """
         while self._active_plugin_indices:
-            time.sleep(self._delay)
+            self._wait_batches(timeout=None)
             batches = self._consume_batches()
 
             if not batches:
                 continue
 
-            if self._batch_size is None:
-                yield np.concatenate(batches)
-            else:
-                yield from chunk_array(
-                    array=np.concatenate(batches),
-                    size=self._batch_size
-                )
+            yield from self._rebatch(self._unminimize_batches(batches))
 
-    def _generate_with_ordering(self) -> Iterator[TimestampIdBatch]:
-        """Generate timestamps with ordering.
+    def _get_watermark(self) -> np.datetime64 | None:
+        """Get global low watermark as the minimum of active plugins
+        watermarks.
 
-        Yields
-        ------
-        TimestampIdBatch
-            Timestamp batches
+        Returns
+        -------
+        np.datetime64 | None
+            Watermark or `None` if there are no active plugins
         """
-        while (
-            self._active_plugin_indices
-            or self._overlapped_future_part is not None
-        ):
-            time.sleep(self._delay)
-            batches = self._consume_batches()
+        watermarks: list[np.datetime64] = []
+        for idx in self._active_plugin_indices:
+            plugin = self._plugins[idx]
+            watermark = now64(plugin.timezone) - np.timedelta64(
+                int(self._delay * 1_000_000), 'us'
+            )
 
-            if self._overlapped_future_part is not None:
-                batches.append(self._overlapped_future_part)
-                self._overlapped_future_part = None
+            queued_watermark = plugin.watermark
+            if queued_watermark is not None and queued_watermark < watermark:
+                watermark = queued_watermark
 
-            if not batches:
+            watermarks.append(watermark)
+
+        if not watermarks:
+            return None
+
+        return min(watermarks)
+
+    def _release_pending(
+        self,
+        watermark: np.datetime64 | None
+    ) -> list[MinimizedTimestampIdBatch]:
+        """Release parts of pending batches that are not later than
+        watermark.
+
+        Parameters
+        ----------
+        watermark : np.datetime64 | None
+            Watermark, all pending batches are released if value is
+            `None`
+
+        Returns
+        -------
+        list[MinimizedTimestampIdBatch]
+            Released non empty parts of batches
+        """
+        released: list[MinimizedTimestampIdBatch] = []
+
+        while self._pending and (
+            watermark is None or self._pending[0][0] <= watermark
+        ):
+            _, _, batch = heapq.heappop(self._pending)
+
+            if watermark is None:
+                released.append(batch)
                 continue
 
-            # after getting batches within delay time we need to wait for
-            # overlapping batches that are not yet captured
-            # Scheme: :
-            #      capturing starts after first batch is received
-            #      |     capturing ends after the delay has elapsed
-            #      |     | overlapping batch is published after capturing !
-            # -----|     | |   that's why we should wait delay once again
-            #   ----- +++++|   |
-            #      ----- | |   |
-            #
+            timestamps, id = batch
+            index = np.searchsorted(a=timestamps, v=watermark, side='right')
+            released.append((timestamps[:index], id))
 
-            if self._active_plugin_indices:
-                # finding latest timestamp that will be a cutoff point
-                latest_timestamp = np.datetime64(datetime.min.isoformat())
-                for batch in batches:
-                    last_timestamp: np.datetime64 = batch['timestamp'][-1]
+            if index < timestamps.size:
+                self._push_pending((timestamps[index:], id))
+
+        return released
+
+    def _push_pending(self, batch: MinimizedTimestampIdBatch) -> None:
+        """Add batch to pending batches.
+
+        Parameters
+        ----------
+        batch : MinimizedTimestampIdBatch
+            Non empty sorted batch
+        """
+        heapq.heappush(
+            self._pending,
+            (batch[0][0], next(self._pending_counter), batch)
+        )
 
-                    if last_timestamp > latest_timestamp:
-                        latest_timestamp = last_timestamp
+    def _get_release_timeout(self) -> float | None:
+        """Get time until the earliest pending timestamp falls behind
+        time based part of watermarks of all active plugins.
 
-                time.sleep(self._delay)
-                overlapped_batches = self._consume_batches()
+        Returns
+        -------
+        float | None
+            Timeout in seconds or `None` if there are no pending
+            batches
+        """
+        if not self._pending:
+            return None
 
-                if overlapped_batches:
-                    overlapped = merge_arrays(overlapped_batches)
-                    index = np.searchsorted(
-                        a=overlapped['timestamp'],
-                        v=latest_timestamp,
-                        side='right'
-                    )
-                    overlapped_part = overlapped[:index]
-                    future_part = overlapped[index:]
+        earliest = self._pending[0][0]
+        delay = np.timedelta64(int(self._delay * 1_000_000), 'us')
 
-                    if overlapped_part.size > 0:
-                        batches.append(overlapped_part)
+        timeout = max(
+            timedelta64_to_seconds(
+                earliest + delay - now64(self._plugins[idx].timezone)
+            )
+            for idx in self._active_plugin_indices
+        )
 
-                    if future_part.size > 0:
-                        self._overlapped_future_part = future_part
+        # Release is held by queued timestamps of some plugin, it is
+        # expected to be notified once they are published, timeout
+        # covers the case when they are dropped by plugin
+        if timeout <= 0:
+            return self._delay
 
-            sorted_array = merge_arrays(batches)
+        return timeout
 
-            if self._batch_size is None:
-                yield sorted_array
-            else:
-                yield from chunk_array(
-                    array=sorted_array,
-                    size=self._batch_size
+    def _generate_with_ordering(self) -> Iterator[TimestampIdBatch]:
+        """Generate timestamps with ordering.
+
+        Yields
+        ------
+        TimestampIdBatch
+            Timestamp batches
+        """
+        while self._active_plugin_indices or self._pending:
+            for batch in self._consume_batches():
+                self._push_pending(batch)
+
+            released = self._release_pending(self._get_watermark())
+
+            if released:
+                yield from self._rebatch(
+                    self._unminimize_batches(released, ordered=True)
                 )
+
+            if self._active_plugin_indices:
+                self._wait_batches(timeout=self._get_release_timeout())
@@ -0,0 +1,357 @@
+from dataclasses import dataclass
+from datetime import datetime
+from itertools import islice
+from typing import Iterator
+
+import croniter
+from numpy import (arange, array, datetime64, int64, ones, searchsorted,
+                   timedelta64, zeros)
+from numpy.typing import NDArray
+
+BLOCK_SIZE = 1_000_000
+
+
+@dataclass(frozen=True)
+class CronSchedule:
+    """Cron expression compiled into sets of allowed values of its
+    fields.
+
+    Parameters
+    ----------
+    day_offsets : NDArray[timedelta64]
+        Sorted offsets of matching moments from the beginning of day
+
+    months : NDArray[bool]
+        Mask of allowed months indexed by month number (1-12)
+
+    days_of_month : NDArray[bool] | None
+        Mask of allowed days of month indexed by day number (1-31),
+        `None` if field is not restricted
+
+    days_of_week : NDArray[bool] | None
+        Mask of allowed days of week indexed by day number (0-6,
+        starting from Sunday), `None` if field is not restricted
+
+    years : NDArray[bool] | None
+        Mask of allowed years indexed by year number, `None` if field
+        is not restricted
+    """
+    day_offsets: NDArray[timedelta64]
+    months: NDArray
+    days_of_month: NDArray | None
+    days_of_week: NDArray | None
+    years: NDArray | None
+
+    def match_days(self, days: NDArray[datetime64]) -> NDArray:
+        """Get mask of days matching the schedule.
+
+        Parameters
+        ----------
+        days : NDArray[datetime64]
+            Days with `datetime64[D]` type
+
+        Returns
+        -------
+        NDArray[bool]
+            Mask of matching days
+
+        Notes
+        -----
+        Days of month and days of week are matched as in classic cron:
+        if both fields are restricted then day is matched if any of
+        them matches it.
+        """
+        month_starts = days.astype('datetime64[M]')
+        months = month_starts.astype(int64) % 12 + 1
+        mask = self.months[months]
+
+        if self.years is not None:
+            years = days.astype('datetime64[Y]').astype(int64) + 1970
+            mask &= (years < self.years.size) & self.years[
+                years.clip(0, self.years.size - 1)
+            ]
+
+        dom_mask = None
+        if self.days_of_month is not None:
+            dom = (days - month_starts.astype('datetime64[D]')).astype(int64)
+            dom_mask = self.days_of_month[dom + 1]
+
+        dow_mask = None
+        if self.days_of_week is not None:
+            # 1970-01-01 is Thursday
+            dow = (days.astype(int64) + 4) % 7
+            dow_mask = self.days_of_week[dow]
+
+        if dom_mask is not None and dow_mask is not None:
+            mask &= dom_mask | dow_mask
+        elif dom_mask is not None:
+            mask &= dom_mask
+        elif dow_mask is not None:
+            mask &= dow_mask
+
+        return mask
+
+
+def _to_mask(values: list, size: int) -> NDArray | None:
+    """Convert expanded values of cron field to mask.
+
+    Parameters
+    ----------
+    values : list
+        Expanded values
+
+    size : int
+        Size of mask
+
+    Returns
+    -------
+    NDArray[bool] | None
+        Mask or `None` if field is not restricted
+
+    Raises
+    ------
+    ValueError
+        If values contain special values
+    """
+    if values == ['*']:
+        return None
+
+    if not all(isinstance(value, int) for value in values):
+        raise ValueError('Special values are not supported')
+
+    mask = zeros(size, dtype=bool)
+    mask[values] = True
+    return mask
+
+
+def _to_values(values: list, stop: int) -> NDArray[int64]:
+    """Convert expanded values of time field to array of values.
+
+    Parameters
+    ----------
+    values : list
+        Expanded values
+
+    stop : int
+        Upper bound of values (exclusive) of not restricted field
+
+    Returns
+    -------
+    NDArray[int64]
+        Values
+
+    Raises
+    ------
+    ValueError
+        If values contain special values
+    """
+    if values == ['*']:
+        return arange(stop, dtype=int64)
+
+    if not all(isinstance(value, int) for value in values):
+        raise ValueError('Special values are not supported')
+
+    return array(sorted(values), dtype=int64)
+
+
+def compile_expression(expression: str) -> CronSchedule | None:
+    """Compile cron expression into schedule.
+
+    Parameters
+    ----------
+    expression : str
+        Cron expression
+
+    Returns
+    -------
+    CronSchedule | None
+        Compiled schedule or `None` if expression uses features that
+        are not supported in vectorized expansion (e.g. last day of
+        month or nth day of week)
+    """
+    try:
+        fields, nth_weekday = croniter.croniter.expand(expression)
+    except ValueError:
+        # croniter errors are subclasses of ValueError
+        return None
+
+    if nth_weekday:
+        return None
+
+    minutes, hours, days_of_month, months, days_of_week, *rest = fields
+    seconds = rest[0] if len(rest) > 0 else [0]
+    years = rest[1] if len(rest) > 1 else ['*']
+
+    try:
+        offsets = (
+            _to_values(hours, 24)[:, None, None] * 3600
+            + _to_values(minutes, 60)[None, :, None] * 60
+            + _to_values(seconds, 60)[None, None, :]
+        ).ravel()
+        months_mask = _to_mask(months, 13)
+        schedule = CronSchedule(
+            day_offsets=(offsets * 1_000_000).astype('timedelta64[us]'),
+            months=(
+                months_mask if months_mask is not None
+                else ones(13, dtype=bool)
+            ),
+            days_of_month=_to_mask(days_of_month, 32),
+            days_of_week=_to_mask(days_of_week, 7),
+            years=_to_mask(years, max(
+                [value for value in years if isinstance(value, int)],
+                default=0
+            ) + 1)
+        )
+    except (ValueError, IndexError):
+        return None
+
+    return schedule
+
+
+def _iterate_schedule(
+    schedule: CronSchedule,
+    start: datetime64,
+    end: datetime64,
+    block_size: int
+) -> Iterator[NDArray[datetime64]]:
+    """Iterate over blocks of timestamps of compiled schedule.
+
+    Parameters
+    ----------
+    schedule : CronSchedule
+        Compiled schedule
+
+    start : datetime64
+        Start of range (inclusive)
+
+    end : datetime64
+        End of range (inclusive)
+
+    block_size : int
+        Approximate maximum number of timestamps in block
+
+    Yields
+    ------
+    NDArray[datetime64]
+        Sorted non empty blocks of timestamps
+    """
+    days_per_block = max(1, block_size // schedule.day_offsets.size)
+    day = start.astype('datetime64[D]')
+    last_day = end.astype('datetime64[D]')
+
+    while day <= last_day:
+        days = arange(
+            day,
+            min(day + days_per_block, last_day + 1),
+            dtype='datetime64[D]'
+        )
+        day += days.size
+
+        days = days[schedule.match_days(days)]
+        if days.size == 0:
+            continue
+
+        timestamps = (
+            days.astype('datetime64[us]')[:, None]
+            + schedule.day_offsets[None, :]
+        ).ravel()
+
+        timestamps = timestamps[
+            searchsorted(timestamps, start, side='left'):
+            searchsorted(timestamps, end, side='right')
+        ]
+        if timestamps.size > 0:
+            yield timestamps
+
+
+def _iterate_croniter(
+    expression: str,
+    start: datetime64,
+    end: datetime64,
+    block_size: int
+) -> Iterator[NDArray[datetime64]]:
+    """Iterate over blocks of timestamps using `croniter`.
+
+    Parameters
+    ----------
+    expression : str
+        Cron expression
+
+    start : datetime64
+        Start of range (inclusive)
+
+    end : datetime64
+        End of range (inclusive)
+
+    block_size : int
+        Maximum number of timestamps in block
+
+    Yields
+    ------
+    NDArray[datetime64]
+        Sorted non empty blocks of timestamps
+    """
+    range = croniter.croniter_range(
+        start=start.astype(datetime),
+        stop=end.astype(datetime),
+        expr_format=expression,
+        ret_type=datetime
+    )
+
+    while True:
+        timestamps = array(
+            list(islice(range, block_size)),
+            dtype='datetime64[us]'
+        )
+        if timestamps.size == 0:
+            return
+
+        yield timestamps
+
+
+def iterate_timestamps(
+    expression: str,
+    start: datetime64,
+    end: datetime64,
+    block_size: int = BLOCK_SIZE
+) -> Iterator[NDArray[datetime64]]:
+    """Iterate over blocks of naive timestamps matching cron expression
+    within date range.
+
+    Parameters
+    ----------
+    expression : str
+        Cron expression
+
+    start : datetime64
+        Start of range (inclusive)
+
+    end : datetime64
+        End of range (inclusive)
+
+    block_size : int, default=BLOCK_SIZE
+        Approximate maximum number of timestamps in block
+
+    Yields
+    ------
+    NDArray[datetime64]
+        Sorted non empty blocks of timestamps with `datetime64[us]`
+        type
+
+    Notes
+    -----
+    Expression is expanded with vectorized operations over blocks of
+    days, expressions with features that are not supported in
+    vectorized expansion are expanded by `croniter`. Timestamps are
+    naive wall clock time, so they are the same as `croniter` produces
+    for naive datetimes regardless of DST transitions.
+    """
+    start = start.astype('datetime64[us]')
+    end = end.astype('datetime64[us]')
+
+    schedule = compile_expression(expression)
+
+    if schedule is None:
+        yield from _iterate_croniter(expression, start, end, block_size)
+    else:
+        yield from _iterate_schedule(schedule, start, end, block_size)
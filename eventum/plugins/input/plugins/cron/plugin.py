@@ -1,15 +1,56 @@
 import time
+from dataclasses import dataclass
 from datetime import datetime
 from typing import Iterator
 
 import croniter
-from numpy import array, datetime64, full, repeat
+from numpy import (array, concatenate, datetime64, full, repeat,
+                   timedelta64)
+from numpy.random import SeedSequence
+from numpy.typing import NDArray
 
 from eventum.plugins.exceptions import PluginConfigurationError
 from eventum.plugins.input.base.plugin import InputPlugin, InputPluginParams
 from eventum.plugins.input.fields import TimeKeyword
 from eventum.plugins.input.normalizers import normalize_versatile_daterange
 from eventum.plugins.input.plugins.cron.config import CronInputPluginConfig
+from eventum.plugins.input.plugins.cron.expansion import iterate_timestamps
+from eventum.plugins.input.sharding import RangeGenerator
+from eventum.plugins.input.utils.time_utils import to_naive
+
+
+@dataclass(frozen=True)
+class CronRangeGenerator(RangeGenerator):
+    """Range generator of `cron` input plugin.
+
+    Parameters
+    ----------
+    expression : str
+        Cron expression
+
+    count : int
+        Number of events to generate for every interval
+    """
+    expression: str
+    count: int
+
+    def generate(
+        self,
+        start: datetime64,
+        end: datetime64,
+        seed: SeedSequence
+    ) -> NDArray[datetime64]:
+        blocks = list(
+            iterate_timestamps(
+                expression=self.expression,
+                start=start,
+                end=end - timedelta64(1, 'us')
+            )
+        )
+        if not blocks:
+            return array([], dtype='datetime64[us]')
+
+        return repeat(a=concatenate(blocks), repeats=self.count)
 
 
 class CronInputPlugin(InputPlugin[CronInputPluginConfig]):
@@ -35,6 +76,30 @@ class CronInputPlugin(InputPlugin[CronInputPluginConfig]):
                 context=dict(self.instance_info)
             )
 
+    def _create_range_generator(self) -> CronRangeGenerator:
+        start, end = normalize_versatile_daterange(
+            start=self._config.start,
+            end=self._config.end,
+            timezone=self._timezone,
+            none_start='now',
+            none_end='max'
+        )
+
+        return CronRangeGenerator(
+            start=datetime64(
+                to_naive(start, self._timezone).isoformat(), 'us'
+            ),
+            end=(
+                datetime64(to_naive(end, self._timezone).isoformat(), 'us')
+                + timedelta64(1, 'us')
+            ),
+            expression=self._config.expression,
+            count=self._config.count
+        )
+
+    def _create_live_range_generator(self) -> CronRangeGenerator:
+        return self._create_range_generator()
+
     def _generate_sample(self) -> None:
         start, end = normalize_versatile_daterange(
             start=self._config.start,
@@ -50,19 +115,12 @@ class CronInputPlugin(InputPlugin[CronInputPluginConfig]):
             end_timestamp=end.isoformat()
         )
 
-        range = croniter.croniter_range(
-            start=start.replace(tzinfo=None),
-            stop=end.replace(tzinfo=None),
-            expr_format=self._config.expression,
-            ret_type=datetime
-        )
-
-        timestamps = repeat(
-            a=array(list(range), dtype='datetime64[us]'),
-            repeats=self._config.count
-        )
-
-        self._enqueue(timestamps)
+        for timestamps in iterate_timestamps(
+            expression=self._config.expression,
+            start=datetime64(start.replace(tzinfo=None).isoformat(), 'us'),
+            end=datetime64(end.replace(tzinfo=None).isoformat(), 'us')
+        ):
+            self._enqueue(repeat(a=timestamps, repeats=self._config.count))
 
     def _generate_live(self) -> None:
         now = datetime.now().astimezone(self._timezone)
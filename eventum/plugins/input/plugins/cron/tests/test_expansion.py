@@ -0,0 +1,97 @@
+from datetime import datetime
+
+import numpy as np
+import pytest
+from croniter import croniter, croniter_range
+from numpy import datetime64
+
+from eventum.plugins.input.plugins.cron.expansion import (compile_expression,
+                                                          iterate_timestamps)
+
+START = datetime64('2023-12-31T13:17:05.500000', 'us')
+END = datetime64('2024-03-05T11:00:00', 'us')
+
+
+def expand(expression, start=START, end=END, block_size=10_000):
+    blocks = list(
+        iterate_timestamps(expression, start, end, block_size=block_size)
+    )
+    if not blocks:
+        return np.array([], dtype='datetime64[us]')
+
+    return np.concatenate(blocks)
+
+
+@pytest.mark.parametrize(
+    'expression',
+    [
+        '* * * * *',
+        '*/5 1-3 * * *',
+        '0 0 1,15 * 1-5',
+        '0 0 * * 7',
+        '0 0 * * sun,mon',
+        '0 12 * feb *',
+        '30 2 29 2 *',
+        '15 */3 * jan-mar 0,6',
+        '7 7 31 * *',
+        '* 3 * * * */10',
+        '0 0 1 1 * 0 2024-2025',
+        '@daily',
+    ]
+)
+def test_expansion_equals_croniter(expression):
+    assert compile_expression(expression) is not None
+
+    expected = np.array(
+        list(
+            croniter_range(
+                START.astype(datetime),
+                END.astype(datetime),
+                expression,
+                ret_type=datetime
+            )
+        ),
+        dtype='datetime64[us]'
+    )
+
+    assert np.array_equal(expand(expression), expected)
+
+
+@pytest.mark.parametrize('expression', ['0 0 L * *', '0 0 * * 1#2'])
+def test_expansion_fallback(expression):
+    assert compile_expression(expression) is None
+
+    timestamps = expand(expression)
+
+    assert timestamps.size == 2
+    assert all(
+        croniter.match(expression, timestamp)
+        for timestamp in timestamps.astype(datetime)
+    )
+
+
+def test_expansion_day_or_semantics():
+    timestamps = expand('0 0 1 * mon')
+
+    for timestamp in timestamps.astype(datetime):
+        assert timestamp.day == 1 or timestamp.weekday() == 0
+
+    assert datetime64('2024-03-01') in timestamps
+    assert datetime64('2024-01-08') in timestamps
+
+
+def test_expansion_blocks():
+    blocks = list(
+        iterate_timestamps(
+            '* * * * * *',
+            datetime64('2024-01-01', 'us'),
+            datetime64('2025-01-01', 'us'),
+            block_size=1_000_000
+        )
+    )
+
+    assert all(block.size <= 1_000_000 for block in blocks)
+    assert sum(block.size for block in blocks) == 366 * 86400 + 1
+
+    for previous, block in zip(blocks, blocks[1:]):
+        assert previous[-1] < block[0]
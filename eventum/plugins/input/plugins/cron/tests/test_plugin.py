@@ -1,5 +1,6 @@
 from datetime import datetime, timedelta
 
+import numpy as np
 from numpy import datetime64
 from pytz import timezone
 
@@ -61,3 +62,30 @@ def test_cron_live():
     assert timestamps[-1] == datetime64(
         start.replace(microsecond=0, tzinfo=None) + timedelta(seconds=2)
     )
+
+
+def test_cron_sample_sharded():
+    config = CronInputPluginConfig(
+        expression='*/7 * * * *',
+        count=2,
+        start=datetime(2024, 1, 1, 0, 0, 0, tzinfo=timezone('UTC')),
+        end=datetime(2024, 1, 3, 0, 0, 0, tzinfo=timezone('UTC'))
+    )
+
+    def generate(**params):
+        plugin = CronInputPlugin(
+            config=config,
+            params={
+                'id': 1,
+                'live_mode': False,
+                'timezone': timezone('UTC'),
+                **params
+            }
+        )
+        return np.concatenate(list(plugin.generate()))
+
+    expected = generate()
+    timestamps = generate(sample_workers=2, sample_shards=5)
+
+    assert np.array_equal(timestamps, expected)
+    assert timestamps[-1] == datetime64('2024-01-03T00:00:00')
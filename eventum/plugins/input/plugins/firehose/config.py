@@ -0,0 +1,20 @@
+from pydantic import Field
+
+from eventum.plugins.input.base.config import InputPluginConfig
+
+
+class FirehoseInputPluginConfig(InputPluginConfig, frozen=True):
+    """Configuration for `firehose` input plugin.
+
+    Attributes
+    ----------
+    count : int | None, default=None
+        Number of timestamps to generate, if value is not set (only for
+        live mode) generate infinitely
+
+    chunk_size : int, default=100_000
+        Size of pre-generated array of timestamps that is repeatedly
+        enqueued
+    """
+    count: int | None = Field(default=None, gt=0)
+    chunk_size: int = Field(default=100_000, gt=0)
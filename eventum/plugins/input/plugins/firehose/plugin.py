@@ -0,0 +1,52 @@
+from numpy import full
+
+from eventum.plugins.exceptions import PluginConfigurationError
+from eventum.plugins.input.base.plugin import InputPlugin, InputPluginParams
+from eventum.plugins.input.plugins.firehose.config import \
+    FirehoseInputPluginConfig
+from eventum.plugins.input.utils.time_utils import now64
+
+
+class FirehoseInputPlugin(InputPlugin[FirehoseInputPluginConfig]):
+    """Input plugin for generating timestamps at the maximum rate the
+    pipeline can absorb, used for load testing of other stages. All
+    timestamps have a value of time when generation was started, so
+    they are never delayed by scheduling.
+    """
+
+    def __init__(
+        self,
+        config: FirehoseInputPluginConfig,
+        params: InputPluginParams
+    ) -> None:
+        super().__init__(config, params)
+
+        if not self._live_mode and self._config.count is None:
+            raise PluginConfigurationError(
+                'Count must be finite for sample mode',
+                context=dict(self.instance_info)
+            )
+
+    def _generate_sample(self) -> None:
+        self._logger.info('Generating at current timestamp')
+
+        # Batcher does not modify enqueued arrays, so the same array is
+        # reused for all chunks to avoid allocations
+        chunk = full(
+            shape=self._config.chunk_size,
+            fill_value=now64(timezone=self._timezone),
+            dtype='datetime64[us]'
+        )
+
+        remaining = self._config.count
+        while remaining is None or remaining > 0:
+            if remaining is None:
+                size = chunk.size
+            else:
+                size = min(remaining, chunk.size)
+                remaining -= size
+
+            self._enqueue(chunk[:size])
+
+    def _generate_live(self) -> None:
+        self._generate_sample()
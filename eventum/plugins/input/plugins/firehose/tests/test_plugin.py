@@ -0,0 +1,57 @@
+import pytest
+from pytz import timezone
+
+from eventum.plugins.exceptions import PluginConfigurationError
+from eventum.plugins.input.plugins.firehose.config import \
+    FirehoseInputPluginConfig
+from eventum.plugins.input.plugins.firehose.plugin import FirehoseInputPlugin
+
+
+def test_firehose_sample():
+    config = FirehoseInputPluginConfig(count=1050, chunk_size=100)
+    plugin = FirehoseInputPlugin(
+        config=config,
+        params={
+            'id': 1,
+            'live_mode': False,
+            'timezone': timezone('UTC'),
+            'batch_size': 500
+        }
+    )
+
+    batches = list(plugin.generate())
+
+    assert sum(batch.size for batch in batches) == 1050
+    assert all(batch.size <= 500 for batch in batches)
+
+
+def test_firehose_live():
+    config = FirehoseInputPluginConfig(count=10_000, chunk_size=1000)
+    plugin = FirehoseInputPlugin(
+        config=config,
+        params={
+            'id': 1,
+            'live_mode': True,
+            'timezone': timezone('UTC'),
+            'batch_size': 1000,
+            'queue_max_size': 1000
+        }
+    )
+
+    batches = list(plugin.generate())
+
+    assert sum(batch.size for batch in batches) == 10_000
+
+
+def test_firehose_sample_infinite():
+    config = FirehoseInputPluginConfig()
+
+    with pytest.raises(PluginConfigurationError):
+        FirehoseInputPlugin(
+            config=config,
+            params={
+                'id': 1,
+                'live_mode': False,
+                'timezone': timezone('UTC')
+            }
+        )
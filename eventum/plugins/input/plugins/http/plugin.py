@@ -1,15 +1,11 @@
-from concurrent.futures import ThreadPoolExecutor
-from http.server import HTTPServer
-from threading import Event
-
-from numpy import full
+import asyncio
+import socket
 
 from eventum.plugins.exceptions import (PluginConfigurationError,
                                         PluginRuntimeError)
 from eventum.plugins.input.base.plugin import InputPlugin, InputPluginParams
 from eventum.plugins.input.plugins.http.config import HttpInputPluginConfig
-from eventum.plugins.input.plugins.http.server import RequestHandler
-from eventum.plugins.input.utils.time_utils import now64
+from eventum.plugins.input.plugins.http.server import HttpInputServer
 
 
 class HttpInputPlugin(InputPlugin[HttpInputPluginConfig]):
@@ -18,14 +14,25 @@ class HttpInputPlugin(InputPlugin[HttpInputPluginConfig]):
 
     Notes
     -----
-    For generating events a POST request is required with following
-    data in body:
+    For generating events a POST request to `/generate` endpoint is
+    required with following data in body:
     ```json
     {
-        "count": x
+        "count": x,
+        "timestamp": "2024-01-01T00:00:00+00:00"
     }
     ```
-    , where `x` - is a number of events to generate
+    , where `x` - is a number of events to generate and optional
+    `timestamp` - is a timestamp of events (current time is used by
+    default). Many such items can be sent at once as JSON array to
+    `/generate/batch` endpoint. For sustained load such items can be
+    streamed as newline delimited JSON to `/generate/stream` endpoint
+    in body of single request with `application/x-ndjson` content
+    type.
+
+    Server handles requests concurrently on persistent connections.
+    In live mode timestamps from future are held until they are due,
+    so timestamps of all requests are published in ascending order.
     """
 
     def __init__(
@@ -34,17 +41,14 @@ class HttpInputPlugin(InputPlugin[HttpInputPluginConfig]):
         params: InputPluginParams
     ) -> None:
         super().__init__(config, params)
-        self._request_handler_cls = RequestHandler
-        self._stop_event = Event()
-        self._stop_event.clear()
 
         try:
-            self._server = HTTPServer(
-                server_address=(
-                    str(self._config.ip),
-                    self._config.port
-                ),
-                RequestHandlerClass=self._request_handler_cls
+            self._socket = socket.create_server(
+                address=(str(self._config.ip), self._config.port),
+                family=(
+                    socket.AF_INET6 if self._config.ip.version == 6
+                    else socket.AF_INET
+                )
             )
         except OSError as e:
             raise PluginConfigurationError(
@@ -52,52 +56,31 @@ class HttpInputPlugin(InputPlugin[HttpInputPluginConfig]):
                 context=dict(self.instance_info, reason=str(e))
             )
 
-    def _handle_stop(self) -> None:
-        """Shut down the server once handler thread notifies via
-        condition.
-        """
-        self._stop_event.wait()
-        self._logger.info(
-            'Stop request is received, shutting down the http server'
+        self._server = HttpInputServer(
+            sock=self._socket,
+            generate_callback=self._enqueue,
+            timezone=self._timezone,
+            logger=self._logger,
+            hold_future=self._live_mode
         )
-        self._server.shutdown()
 
     def _generate_sample(self) -> None:
-        self._request_handler_cls.set_logger(self._logger)
-        self._request_handler_cls.set_generate_callback(
-            callback=lambda count:
-            self._enqueue(
-                full(
-                    shape=count,
-                    fill_value=now64(self._timezone),
-                    dtype='datetime64[us]'
-                )
-            )
-        )
-        self._request_handler_cls.set_stop_callback(
-            callback=self._stop_event.set
-        )
-
         self._logger.info(
             'Starting http server',
             ip=str(self._config.ip),
             port=self._config.port
         )
-        with ThreadPoolExecutor(max_workers=2) as executor:
-            stop_future = executor.submit(self._handle_stop)
-            serve_future = executor.submit(self._server.serve_forever)
+        self._logger.info('Waiting for incoming generation requests')
 
-            self._logger.info('Waiting for incoming generation requests')
-            try:
-                serve_future.result()
-                self._stop_event.set()
-                stop_future.result()
-            except Exception as e:
-                self._server.server_close()
-                raise PluginRuntimeError(
-                    'HTTP server was stopped due to error',
-                    context=dict(self.instance_info, reason=str(e))
-                )
+        try:
+            asyncio.run(self._server.serve())
+        except Exception as e:
+            raise PluginRuntimeError(
+                'HTTP server was stopped due to error',
+                context=dict(self.instance_info, reason=str(e))
+            )
+        finally:
+            self._socket.close()
 
     def _generate_live(self) -> None:
         self._generate_sample()
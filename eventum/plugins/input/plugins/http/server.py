@@ -1,147 +1,374 @@
-import json
-from http.server import BaseHTTPRequestHandler
-from typing import Any, Callable
+import asyncio
+import socket
+from datetime import datetime
+from typing import Annotated, Any, Callable, Sequence
 
+import msgspec
 import structlog
+from aiohttp import web
+from numpy import (array, datetime64, empty, int64, maximum, repeat,
+                   searchsorted)
+from numpy.typing import NDArray
+from pytz import BaseTzInfo
 
+from eventum.plugins.input.utils.array_utils import \
+    merge_sorted_arrays_with_sources
+from eventum.plugins.input.utils.time_utils import (now64,
+                                                    timedelta64_to_seconds,
+                                                    to_naive)
 
-class RequestHandler(BaseHTTPRequestHandler):
-    _generate_callback: Callable[[int], Any] | None = None
-    _stop_callback: Callable[[], Any] | None = None
-    _logger = structlog.stdlib.get_logger()
 
-    @classmethod
-    def set_generate_callback(cls, callback: Callable[[int], Any]) -> None:
-        """Set callback that is called for each `/generate` request.
+class GenerationRequest(msgspec.Struct, frozen=True):
+    """Request for generating timestamps, unknown fields are ignored.
+
+    Attributes
+    ----------
+    count : int
+        Number of timestamps to generate
+
+    timestamp : datetime | None, default=None
+        Timestamp to generate, naive timestamp is considered to be in
+        timezone of plugin, current time is used if value is not set
+    """
+    count: Annotated[int, msgspec.Meta(ge=1)]
+    timestamp: datetime | None = None
+
+
+_request_decoder = msgspec.json.Decoder(GenerationRequest)
+_batch_decoder = msgspec.json.Decoder(list[GenerationRequest])
+
+
+class HttpInputServer:
+    """Asynchronous HTTP server accepting requests for generating
+    timestamps.
+
+    Parameters
+    ----------
+    sock : socket.socket
+        Bound socket to listen on
+
+    generate_callback : Callable[[NDArray[datetime64]], Any]
+        Callback that is called with generated timestamps, it is called
+        in separate thread, so it can block
+
+    timezone : BaseTzInfo
+        Timezone of generated timestamps
+
+    logger : structlog.stdlib.BoundLogger
+        Logger
+
+    hold_future : bool, default=False
+        Whether to hold timestamps that are in the future until they
+        are due, it is required when generated timestamps are
+        published according to real time, so they are passed to
+        callback in ascending order even if requests are not ordered
+
+    Notes
+    -----
+    Endpoints (all accept POST requests):
+    - `/generate` - single `GenerationRequest` in JSON
+    - `/generate/batch` - JSON array of `GenerationRequest` items, all
+    timestamps are generated at once
+    - `/generate/stream` - newline delimited JSON `GenerationRequest`
+    items (`application/x-ndjson`), body can be sent with chunked
+    transfer encoding over long-lived connection, items are decoded
+    incrementally and timestamps are generated for each received
+    chunk of body
+    - `/stop` - stop the server
+
+    When `hold_future` is set, future timestamps from all requests are
+    merged into sorted pending array and passed to callback when they
+    are due. Timestamps that are earlier than already passed ones are
+    late anyway, so they are moved forward to the latest passed
+    timestamp to keep passed timestamps ordered.
+    """
+
+    def __init__(
+        self,
+        sock: socket.socket,
+        generate_callback: Callable[[NDArray[datetime64]], Any],
+        timezone: BaseTzInfo,
+        logger: structlog.stdlib.BoundLogger,
+        hold_future: bool = False
+    ) -> None:
+        self._sock = sock
+        self._generate_callback = generate_callback
+        self._timezone = timezone
+        self._logger = logger
+        self._hold_future = hold_future
+
+        self._stop_event: asyncio.Event | None = None
+
+        self._pending: NDArray[datetime64] = empty(0, dtype='datetime64[us]')
+        self._pending_changed_event: asyncio.Event | None = None
+        self._last_passed: datetime64 | None = None
+        self._callback_lock: asyncio.Lock | None = None
+
+        self._app = web.Application()
+        self._app.add_routes([
+            web.post('/generate', self._handle_generate),
+            web.post('/generate/batch', self._handle_generate_batch),
+            web.post('/generate/stream', self._handle_generate_stream),
+            web.post('/stop', self._handle_stop),
+        ])
+
+    def _build_timestamps(
+        self,
+        requests: Sequence[GenerationRequest]
+    ) -> NDArray[datetime64]:
+        """Build array of timestamps for generation requests.
 
         Parameters
         ----------
-        callback : Callable[[int], Any]
-            Callback to call
+        requests : Sequence[GenerationRequest]
+            Generation requests
+
+        Returns
+        -------
+        NDArray[datetime64]
+            Timestamps sorted in ascending order
         """
-        cls._generate_callback = callback
+        now = now64(self._timezone)
+        timestamps = array(
+            [
+                now if request.timestamp is None
+                else to_naive(request.timestamp, self._timezone)
+                for request in requests
+            ],
+            dtype='datetime64[us]'
+        )
+        counts = array([request.count for request in requests], dtype=int64)
+
+        timestamps = repeat(timestamps, counts)
+        timestamps.sort()
 
-    @classmethod
-    def set_stop_callback(cls, callback: Callable[[], Any]) -> None:
-        """Set callback that is called for `/stop` request.
+        return timestamps
+
+    async def _pass_ordered(self, timestamps: NDArray[datetime64]) -> None:
+        """Pass timestamps to callback keeping ascending order of all
+        passed timestamps.
 
         Parameters
         ----------
-        callback : Callable[[], Any]
-            Callback to call
+        timestamps : NDArray[datetime64]
+            Timestamps sorted in ascending order
         """
-        cls._stop_callback = callback
+        assert self._callback_lock is not None
+
+        async with self._callback_lock:
+            if self._last_passed is not None:
+                timestamps = maximum(timestamps, self._last_passed)
+
+            self._last_passed = timestamps[-1]
+            await asyncio.to_thread(self._generate_callback, timestamps)
+
+    async def _release_pending(self) -> None:
+        """Continuously pass pending timestamps to callback when they
+        are due.
+        """
+        assert self._pending_changed_event is not None
+
+        while True:
+            if self._pending.size == 0:
+                await self._pending_changed_event.wait()
+                self._pending_changed_event.clear()
+                continue
 
-    @classmethod
-    def set_logger(cls, logger: structlog.stdlib.BoundLogger) -> None:
-        """Set logger that will be used across class instances.
+            delay = timedelta64_to_seconds(
+                self._pending[0] - now64(self._timezone)
+            )
+            if delay > 0:
+                try:
+                    await asyncio.wait_for(
+                        self._pending_changed_event.wait(),
+                        timeout=delay
+                    )
+                except asyncio.TimeoutError:
+                    pass
+
+                self._pending_changed_event.clear()
+                continue
+
+            index = searchsorted(
+                self._pending, now64(self._timezone), side='right'
+            )
+            due = self._pending[:index]
+            self._pending = self._pending[index:]
+
+            await self._pass_ordered(due)
+
+    async def _generate(self, requests: Sequence[GenerationRequest]) -> None:
+        """Generate timestamps for requests.
 
         Parameters
         ----------
-        logger : structlog.stdlib.BoundLogger
-            Logger to use
+        requests : Sequence[GenerationRequest]
+            Generation requests
         """
-        cls._logger = logger
+        if not requests:
+            return
+
+        timestamps = self._build_timestamps(requests)
+
+        if not self._hold_future:
+            await asyncio.to_thread(self._generate_callback, timestamps)
+            return
+
+        assert self._pending_changed_event is not None
 
-    def _send_response(self, status: int, message: str | None = None) -> None:
-        """Send response back to client.
+        index = searchsorted(
+            timestamps, now64(self._timezone), side='right'
+        )
+        due, future = timestamps[:index], timestamps[index:]
+
+        if future.size > 0:
+            self._pending, _ = merge_sorted_arrays_with_sources(
+                [self._pending, future]
+            )
+            self._pending_changed_event.set()
+
+        if due.size > 0:
+            await self._pass_ordered(due)
+
+    async def _handle_requests(
+        self,
+        request: web.Request,
+        decoder: msgspec.json.Decoder
+    ) -> web.Response:
+        """Decode generation requests from body and generate
+        timestamps.
 
         Parameters
         ----------
-        status : int
-            HTTP response code
+        request : web.Request
+            HTTP request
 
-        message : str
-            Response message
+        decoder : msgspec.json.Decoder
+            Decoder of body
+
+        Returns
+        -------
+        web.Response
+            HTTP response
         """
+        if request.content_type != 'application/json':
+            return web.Response(status=400, text='Expected JSON content type')
+
         try:
-            self.send_response(status)
-            self.end_headers()
-
-            if message is not None:
-                self.wfile.write(message.encode())
-        except OSError as e:
-            RequestHandler._logger.error(
-                'Failed to send response',
+            decoded = decoder.decode(await request.read())
+        except msgspec.ValidationError as e:
+            return web.Response(status=400, text=f'Invalid json schema: {e}')
+        except msgspec.DecodeError:
+            return web.Response(status=400, text='Invalid json data')
+
+        requests = decoded if isinstance(decoded, list) else [decoded]
+
+        try:
+            await self._generate(requests)
+        except Exception as e:
+            self._logger.error(
+                'Error occurred during handling "generate" request',
                 reason=str(e)
             )
+            return web.Response(status=500, text='Error during generation')
 
-    def _handle_generate(self) -> None:
+        return web.Response(status=201, text='Generated')
+
+    async def _handle_generate(self, request: web.Request) -> web.Response:
         """Handle request to `/generate` endpoint."""
-        if self.headers.get('Content-Type') != 'application/json':
-            self._send_response(400, 'Expected JSON content type')
-            return
+        return await self._handle_requests(request, _request_decoder)
+
+    async def _handle_generate_batch(
+        self,
+        request: web.Request
+    ) -> web.Response:
+        """Handle request to `/generate/batch` endpoint."""
+        return await self._handle_requests(request, _batch_decoder)
+
+    async def _handle_generate_stream(
+        self,
+        request: web.Request
+    ) -> web.Response:
+        """Handle request to `/generate/stream` endpoint."""
+        if request.content_type != 'application/x-ndjson':
+            return web.Response(
+                status=400,
+                text='Expected NDJSON content type'
+            )
 
-        # Read and parse JSON
-        content_length = int(self.headers.get('Content-Length', 0))
+        tail = b''
         try:
-            post_data = self.rfile.read(content_length)
-            data = json.loads(post_data)
+            async for chunk in request.content.iter_any():
+                data = tail + chunk
+                last_newline = data.rfind(b'\n')
 
-            count = data['count']
-            if not isinstance(count, int):
-                raise TypeError()
+                if last_newline == -1:
+                    tail = data
+                    continue
 
-            if count < 1:
-                raise ValueError
-        except json.JSONDecodeError:
-            self._send_response(400, 'Invalid json data')
-            return
-        except (TypeError, KeyError):
-            self._send_response(400, 'Invalid json schema')
-            return
-        except ValueError:
-            self._send_response(400, 'Number of events must be greater than 0')
-            return
-        except Exception:
-            RequestHandler._logger.exception('Error during processing request')
-            self._send_response(500, 'Error during processing request')
-            return
+                tail = data[last_newline + 1:]
+                await self._generate(
+                    _request_decoder.decode_lines(data[:last_newline + 1])
+                )
 
-        try:
-            if RequestHandler._generate_callback is not None:
-                RequestHandler._generate_callback(count)  # type: ignore
+            if tail.strip():
+                await self._generate(_request_decoder.decode_lines(tail))
+        except msgspec.ValidationError as e:
+            return web.Response(status=400, text=f'Invalid json schema: {e}')
+        except msgspec.DecodeError:
+            return web.Response(status=400, text='Invalid json data')
         except Exception as e:
-            RequestHandler._logger.error(
+            self._logger.error(
                 'Error occurred during handling "generate" request',
                 reason=str(e)
             )
-            self._send_response(500, 'Error during generation')
-            return
+            return web.Response(status=500, text='Error during generation')
 
-        self._send_response(201, 'Generated')
+        return web.Response(status=201, text='Generated')
 
-    def _handle_stop(self) -> None:
+    async def _handle_stop(self, request: web.Request) -> web.Response:
         """Handle request to `/stop` endpoint."""
-        # response now, because stop callback will shut down the server
-        self._send_response(200, 'Stopping')
+        if self._stop_event is not None:
+            self._stop_event.set()
+
+        return web.Response(status=200, text='Stopping')
+
+    async def serve(self) -> None:
+        """Serve requests until stop request is received.
 
+        Raises
+        ------
+        OSError
+            If server cannot be started
+        """
+        self._stop_event = asyncio.Event()
+        self._pending_changed_event = asyncio.Event()
+        self._callback_lock = asyncio.Lock()
+
+        releasing_task = asyncio.create_task(self._release_pending())
+
+        runner = web.AppRunner(self._app, access_log=None)
+        await runner.setup()
         try:
-            if RequestHandler._stop_callback is not None:
-                RequestHandler._stop_callback()
-        except Exception as e:
-            RequestHandler._logger.error(
-                'Error occurred during handling "stop" request',
-                reason=str(e)
+            site = web.SockSite(runner, self._sock)
+            await site.start()
+
+            await self._stop_event.wait()
+            self._logger.info(
+                'Stop request is received, shutting down the http server'
             )
-            return
+        finally:
+            await runner.cleanup()
 
-    def _handle_404(self) -> None:
-        """Handle request to unknown endpoint."""
-        self._send_response(404, 'Not found')
-
-    def do_POST(self) -> None:
-        match self.path:
-            case '/generate':
-                self._handle_generate()
-            case '/stop':
-                self._handle_stop()
-            case _:
-                self._handle_404()
-
-    def log_message(self, format: str, *args: Any) -> None:
-        RequestHandler._logger.info(
-            'Request received',
-            request_info=format % args,
-            ip=self.address_string()
-        )
+            releasing_task.cancel()
+            try:
+                await releasing_task
+            except asyncio.CancelledError:
+                pass
+
+        # Held timestamps are passed at once, they are published on
+        # time by consumer
+        if self._pending.size > 0:
+            pending = self._pending
+            self._pending = empty(0, dtype='datetime64[us]')
+            await self._pass_ordered(pending)
@@ -1,7 +1,10 @@
+import time
 from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
 
 import pytest
 import requests as rq  # type: ignore[import-untyped]
+from numpy import datetime64
 from pytz import timezone
 
 from eventum.plugins.exceptions import PluginConfigurationError
@@ -39,6 +42,250 @@ def test_plugin():
         assert len(events) == 10
 
 
+def test_plugin_batch():
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        plugin = HttpInputPlugin(
+            config=HttpInputPluginConfig(
+                port=8081
+            ),
+            params={
+                'id': 1,
+                'batch_size': 10,
+                'timezone': timezone('UTC'),
+                'live_mode': True,
+            }
+        )
+
+        events = []
+        future = executor.submit(lambda: events.extend(plugin.generate()))
+
+        res = rq.post(
+            'http://localhost:8081/generate/batch',
+            json=[
+                {'count': 2, 'timestamp': '2024-01-01T00:00:02+00:00'},
+                {'count': 1, 'timestamp': '2024-01-01T03:00:01+03:00'},
+            ]
+        )
+        assert res.status_code == 201
+
+        res = rq.post('http://localhost:8081/stop')
+        assert res.status_code == 200
+
+        future.result()
+
+        timestamps = [
+            timestamp for batch in events for timestamp in batch
+        ]
+        assert timestamps == [
+            datetime64('2024-01-01T00:00:01'),
+            datetime64('2024-01-01T00:00:02'),
+            datetime64('2024-01-01T00:00:02'),
+        ]
+
+
+def test_plugin_invalid_requests():
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        plugin = HttpInputPlugin(
+            config=HttpInputPluginConfig(
+                port=8082
+            ),
+            params={
+                'id': 1,
+                'batch_size': 1,
+                'timezone': timezone('UTC'),
+                'live_mode': True,
+            }
+        )
+
+        events = []
+        future = executor.submit(lambda: events.extend(plugin.generate()))
+
+        with rq.Session() as session:
+            res = session.post(
+                'http://localhost:8082/generate', json={'count': 0}
+            )
+            assert res.status_code == 400
+
+            res = session.post(
+                'http://localhost:8082/generate', json={'amount': 1}
+            )
+            assert res.status_code == 400
+
+            res = session.post(
+                'http://localhost:8082/generate/batch',
+                data='[{"count":',
+                headers={'Content-Type': 'application/json'}
+            )
+            assert res.status_code == 400
+
+            res = session.post(
+                'http://localhost:8082/generate', json={'count': 1}
+            )
+            assert res.status_code == 201
+
+            # Unknown fields are ignored
+            res = session.post(
+                'http://localhost:8082/generate',
+                json={'count': 1, 'tags': ['a']}
+            )
+            assert res.status_code == 201
+
+            res = session.post('http://localhost:8082/stop')
+            assert res.status_code == 200
+
+        future.result()
+
+        assert len(events) == 2
+
+
+def test_plugin_stream():
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        plugin = HttpInputPlugin(
+            config=HttpInputPluginConfig(
+                port=8083
+            ),
+            params={
+                'id': 1,
+                'batch_size': 100,
+                'timezone': timezone('UTC'),
+                'live_mode': True,
+            }
+        )
+
+        events = []
+        future = executor.submit(lambda: events.extend(plugin.generate()))
+
+        def body():
+            for i in range(10):
+                # records are split across chunks
+                yield b'{"count": 1, "timestamp": '
+                yield f'"2024-01-01T00:00:{i:02}Z"}}\n'.encode()
+            yield b'{"count": 5}'
+
+        res = rq.post(
+            'http://localhost:8083/generate/stream',
+            data=body(),
+            headers={'Content-Type': 'application/x-ndjson'}
+        )
+        assert res.status_code == 201
+
+        res = rq.post(
+            'http://localhost:8083/generate/stream',
+            data=iter([b'{"count": -1}\n']),
+            headers={'Content-Type': 'application/x-ndjson'}
+        )
+        assert res.status_code == 400
+
+        res = rq.post('http://localhost:8083/stop')
+        assert res.status_code == 200
+
+        future.result()
+
+        timestamps = [
+            timestamp for batch in events for timestamp in batch
+        ]
+        assert len(timestamps) == 15
+        assert timestamps[:10] == [
+            datetime64(f'2024-01-01T00:00:{i:02}') for i in range(10)
+        ]
+
+
+def test_plugin_unordered_requests():
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        plugin = HttpInputPlugin(
+            config=HttpInputPluginConfig(
+                port=8084
+            ),
+            params={
+                'id': 1,
+                'batch_size': 1,
+                'timezone': timezone('UTC'),
+                'live_mode': True,
+            }
+        )
+
+        batches = []
+        future = executor.submit(lambda: batches.extend(plugin.generate()))
+
+        start = datetime.now(tz=timezone('UTC'))
+        later = start + timedelta(seconds=1)
+
+        res = rq.post(
+            'http://localhost:8084/generate',
+            json={'count': 1, 'timestamp': later.isoformat()}
+        )
+        assert res.status_code == 201
+
+        res = rq.post(
+            'http://localhost:8084/generate',
+            json={'count': 1, 'timestamp': start.isoformat()}
+        )
+        assert res.status_code == 201
+
+        time.sleep(0.5)
+        published = [list(batch) for batch in batches]
+
+        res = rq.post('http://localhost:8084/stop')
+        assert res.status_code == 200
+
+        future.result()
+
+        assert published == [[datetime64(start.replace(tzinfo=None))]]
+        assert [list(batch) for batch in batches] == [
+            [datetime64(start.replace(tzinfo=None))],
+            [datetime64(later.replace(tzinfo=None))],
+        ]
+
+
+def test_plugin_unordered_stream():
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        plugin = HttpInputPlugin(
+            config=HttpInputPluginConfig(
+                port=8085
+            ),
+            params={
+                'id': 1,
+                'batch_size': 1,
+                'timezone': timezone('UTC'),
+                'live_mode': True,
+            }
+        )
+
+        batches = []
+        future = executor.submit(lambda: batches.extend(plugin.generate()))
+
+        start = datetime.now(tz=timezone('UTC'))
+        later = start + timedelta(seconds=0.5)
+
+        def body():
+            yield (
+                f'{{"count": 1, "timestamp": "{later.isoformat()}"}}\n'
+            ).encode()
+            time.sleep(0.1)
+            yield (
+                f'{{"count": 1, "timestamp": "{start.isoformat()}"}}\n'
+            ).encode()
+
+        res = rq.post(
+            'http://localhost:8085/generate/stream',
+            data=body(),
+            headers={'Content-Type': 'application/x-ndjson'}
+        )
+        assert res.status_code == 201
+
+        time.sleep(1)
+
+        res = rq.post('http://localhost:8085/stop')
+        assert res.status_code == 200
+
+        future.result()
+
+        assert [list(batch) for batch in batches] == [
+            [datetime64(start.replace(tzinfo=None))],
+            [datetime64(later.replace(tzinfo=None))],
+        ]
+
+
 def test_plugin_bad_address():
     with pytest.raises(PluginConfigurationError):
         HttpInputPlugin(
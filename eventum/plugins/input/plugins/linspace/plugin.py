@@ -1,19 +1,109 @@
-from numpy import datetime64, linspace, timedelta64
+import math
+from dataclasses import dataclass
+from typing import Iterator
+
+from numpy import arange, datetime64, int64, timedelta64
+from numpy.random import SeedSequence
 from numpy.typing import NDArray
 
 from eventum.plugins.input.base.plugin import InputPlugin, InputPluginParams
 from eventum.plugins.input.normalizers import normalize_versatile_daterange
 from eventum.plugins.input.plugins.linspace.config import \
     LinspaceInputPluginConfig
+from eventum.plugins.input.sharding import RangeGenerator
 from eventum.plugins.input.utils.array_utils import get_future_slice
 from eventum.plugins.input.utils.time_utils import now64, to_naive
 
 
+@dataclass(frozen=True)
+class LinspaceRangeGenerator(RangeGenerator):
+    """Range generator of `linspace` input plugin.
+
+    Parameters
+    ----------
+    first : datetime64
+        The first timestamp
+
+    duration : timedelta64
+        Duration of date range
+
+    count : int
+        Number of timestamps within date range
+
+    endpoint : bool
+        Whether to include end point of date range
+    """
+    first: datetime64
+    duration: timedelta64
+    count: int
+    endpoint: bool
+
+    def generate_indices(self, low: int, high: int) -> NDArray[datetime64]:
+        """Generate timestamps with indices within bounds.
+
+        Parameters
+        ----------
+        low : int
+            Index of the first timestamp
+
+        high : int
+            Index of the last timestamp (exclusive)
+
+        Returns
+        -------
+        NDArray[datetime64]
+            Timestamps, they are the same as corresponding timestamps
+            computed with `numpy.linspace` for the whole range
+        """
+        div = self.count - 1 if self.endpoint else self.count
+        step = 1 / div if div > 0 else 0.0
+
+        indices = arange(max(low, 0), min(high, self.count))
+        space = indices * step
+        if self.endpoint and div > 0:
+            space[indices == self.count - 1] = 1
+
+        return self.first + (self.duration * space)
+
+    def generate(
+        self,
+        start: datetime64,
+        end: datetime64,
+        seed: SeedSequence
+    ) -> NDArray[datetime64]:
+        div = self.count - 1 if self.endpoint else self.count
+        step = 1 / div if div > 0 else 0.0
+        duration_us = int(self.duration.astype(int64))
+
+        # Index bounds are estimated with margin, exact values are
+        # computed the same way as for the whole range and filtered
+        if step > 0 and duration_us > 0:
+            point_us = step * duration_us
+            low = math.floor(
+                int((start - self.first).astype(int64)) / point_us
+            ) - 1
+            high = math.ceil(
+                int((end - self.first).astype(int64)) / point_us
+            ) + 1
+        else:
+            low, high = 0, self.count
+
+        timestamps = self.generate_indices(low, high)
+        return timestamps[(timestamps >= start) & (timestamps < end)]
+
+
 class LinspaceInputPlugin(InputPlugin[LinspaceInputPluginConfig]):
     """Input plugin for generating specified count of events linearly
     spaced in specified date range.
+
+    Attributes
+    ----------
+    GENERATION_CHUNK_SIZE : int
+        Number of timestamps computed and enqueued at once
     """
 
+    GENERATION_CHUNK_SIZE = 1_000_000
+
     def __init__(
         self,
         config: LinspaceInputPluginConfig,
@@ -21,7 +111,28 @@ class LinspaceInputPlugin(InputPlugin[LinspaceInputPluginConfig]):
     ) -> None:
         super().__init__(config, params)
 
-    def _generate(self) -> NDArray[datetime64]:
+    def _iterate_timestamps(self) -> Iterator[NDArray[datetime64]]:
+        """Iterate over chunks of timestamps.
+
+        Yields
+        ------
+        NDArray[datetime64]
+            Chunks of timestamps in ascending order
+        """
+        generator = self._create_range_generator()
+
+        self._logger.info(
+            'Generating in range',
+            start_timestamp=str(generator.first),
+            end_timestamp=str(generator.first + generator.duration)
+        )
+
+        for low in range(0, generator.count, self.GENERATION_CHUNK_SIZE):
+            yield generator.generate_indices(
+                low, low + self.GENERATION_CHUNK_SIZE
+            )
+
+    def _create_range_generator(self) -> LinspaceRangeGenerator:
         start, end = normalize_versatile_daterange(
             start=self._config.start,
             end=self._config.end,
@@ -30,38 +141,34 @@ class LinspaceInputPlugin(InputPlugin[LinspaceInputPluginConfig]):
             none_end='max'
         )
 
-        self._logger.info(
-            'Generating in range',
-            start_timestamp=start.isoformat(),
-            end_timestamp=end.isoformat()
-        )
-
-        space = linspace(
-            start=0,
-            stop=1,
-            num=self._config.count,
-            endpoint=self._config.endpoint,
-        )
-
         first = datetime64(to_naive(start, self._timezone).isoformat(), 'us')
-        timedelta = timedelta64((end - start), 'us')
+        duration = timedelta64((end - start), 'us')
 
-        timestamps = first + (timedelta * space)
-        return timestamps
+        return LinspaceRangeGenerator(
+            start=first,
+            end=first + duration + timedelta64(1, 'us'),
+            first=first,
+            duration=duration,
+            count=self._config.count,
+            endpoint=self._config.endpoint
+        )
 
     def _generate_sample(self) -> None:
-        timestamps = self._generate()
-        self._enqueue(timestamps)
+        for timestamps in self._iterate_timestamps():
+            self._enqueue(timestamps)
 
     def _generate_live(self) -> None:
-        timestamps = self._generate()
+        skipped = False
 
-        future_timestamps = get_future_slice(
-            timestamps=timestamps,
-            after=now64(self._timezone)
-        )
+        for timestamps in self._iterate_timestamps():
+            future_timestamps = get_future_slice(
+                timestamps=timestamps,
+                after=now64(self._timezone)
+            )
 
-        if len(future_timestamps) < len(timestamps):
-            self._logger.info('Past timestamps are skipped')
+            if len(future_timestamps) < len(timestamps) and not skipped:
+                self._logger.info('Past timestamps are skipped')
+                skipped = True
 
-        self._enqueue(future_timestamps)
+            if len(future_timestamps) > 0:
+                self._enqueue(future_timestamps)
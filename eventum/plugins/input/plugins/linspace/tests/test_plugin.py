@@ -1,5 +1,6 @@
 from datetime import datetime, timedelta
 
+import numpy as np
 import pytest
 from numpy import datetime64
 from pytz import timezone
@@ -77,3 +78,62 @@ def test_linspace_live():
     assert len(timestamps) == 100
     assert timestamps[-1] == datetime64(end.replace(tzinfo=None))
     assert timestamps[0] >= datetime64(start.replace(tzinfo=None))
+
+
+@pytest.mark.parametrize('endpoint', [True, False])
+def test_linspace_sample_sharded(endpoint):
+    config = LinspaceInputPluginConfig(
+        start=datetime(2024, 1, 1, tzinfo=timezone('UTC')),
+        end=datetime(2024, 1, 2, tzinfo=timezone('UTC')),
+        count=100_003,
+        endpoint=endpoint
+    )
+
+    def generate(**params):
+        plugin = LinspaceInputPlugin(
+            config=config,
+            params={
+                'id': 1,
+                'live_mode': False,
+                'timezone': timezone('UTC'),
+                **params
+            }
+        )
+        return np.concatenate(list(plugin.generate()))
+
+    expected = generate()
+    timestamps = generate(sample_workers=2, sample_shards=7)
+
+    assert np.array_equal(timestamps, expected)
+
+
+@pytest.mark.parametrize('endpoint', [True, False])
+def test_linspace_sample_chunked(monkeypatch, endpoint):
+    monkeypatch.setattr(LinspaceInputPlugin, 'GENERATION_CHUNK_SIZE', 1000)
+
+    start = datetime(2024, 1, 1, tzinfo=timezone('UTC'))
+    end = datetime(2024, 1, 2, tzinfo=timezone('UTC'))
+    config = LinspaceInputPluginConfig(
+        start=start,
+        end=end,
+        count=10_007,
+        endpoint=endpoint
+    )
+
+    plugin = LinspaceInputPlugin(
+        config=config,
+        params={
+            'id': 1,
+            'live_mode': False,
+            'timezone': timezone('UTC')
+        }
+    )
+
+    timestamps = np.concatenate(list(plugin.generate()))
+
+    expected = datetime64('2024-01-01T00:00:00', 'us') + (
+        np.timedelta64(end - start, 'us')
+        * np.linspace(0, 1, num=10_007, endpoint=endpoint)
+    )
+
+    assert np.array_equal(timestamps, expected)
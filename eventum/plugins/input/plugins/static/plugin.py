@@ -9,8 +9,15 @@ class StaticInputPlugin(InputPlugin[StaticInputPluginConfig]):
     """Input plugin for generating specified number of timestamps with
     static value. All timestamps have a value of time when generation
     was started.
+
+    Attributes
+    ----------
+    GENERATION_CHUNK_SIZE : int
+        Number of timestamps enqueued at once
     """
 
+    GENERATION_CHUNK_SIZE = 1_000_000
+
     def __init__(
         self,
         config: StaticInputPluginConfig,
@@ -20,13 +27,15 @@ class StaticInputPlugin(InputPlugin[StaticInputPluginConfig]):
 
     def _generate_sample(self) -> None:
         self._logger.info('Generating at current timestamp')
-        timestamps = full(
-            shape=self._config.count,
+        # Chunk is never modified, so it is enqueued repeatedly
+        chunk = full(
+            shape=min(self.GENERATION_CHUNK_SIZE, self._config.count),
             fill_value=now64(timezone=self._timezone),
             dtype='datetime64[us]'
         )
 
-        self._enqueue(timestamps)
+        for offset in range(0, self._config.count, chunk.size):
+            self._enqueue(chunk[:self._config.count - offset])
 
     def _generate_live(self) -> None:
         self._generate_sample()
@@ -40,3 +40,24 @@ def test_static_live():
 
     assert len(timestamps) == 100
     assert timestamps[0] == timestamps[-1]
+
+
+def test_static_sample_chunked(monkeypatch):
+    monkeypatch.setattr(StaticInputPlugin, 'GENERATION_CHUNK_SIZE', 7)
+
+    config = StaticInputPluginConfig(count=100)
+    plugin = StaticInputPlugin(
+        config=config,
+        params={
+            'id': 1,
+            'live_mode': False,
+            'timezone': timezone('UTC')
+        }
+    )
+
+    timestamps = []
+    for batch in plugin.generate():
+        timestamps.extend(batch)
+
+    assert len(timestamps) == 100
+    assert timestamps[0] == timestamps[-1]
@@ -1,11 +1,15 @@
+import math
 import time
+from dataclasses import dataclass
 from datetime import datetime, timedelta
 from typing import Iterator, assert_never
 
 import numpy as np
 import yaml
+from numpy.random import SeedSequence
 from numpy.typing import NDArray
 from pydantic import ValidationError
+from pytz import BaseTzInfo
 
 from eventum.plugins.exceptions import (PluginConfigurationError,
                                         PluginRuntimeError)
@@ -17,9 +21,9 @@ from eventum.plugins.input.normalizers import normalize_versatile_daterange
 from eventum.plugins.input.plugins.time_patterns.config import (
     Distribution, RandomizerDirection, TimePatternConfig,
     TimePatternsInputPluginConfig)
-from eventum.plugins.input.utils.array_utils import (get_future_slice,
-                                                     get_past_slice,
-                                                     merge_arrays)
+from eventum.plugins.input.sharding import RangeGenerator
+from eventum.plugins.input.utils.array_utils import (
+    get_future_slice, get_past_slice, merge_sorted_arrays_with_sources)
 from eventum.plugins.input.utils.time_utils import (now64, skip_periods,
                                                     timedelta64_to_seconds,
                                                     to_naive)
@@ -67,8 +71,16 @@ class TimePatternInputPlugin(InputPlugin[TimePatternConfig], register=False):
     o-----------------------------> t
     Signals are distributed within one period using probability function
     ```
+
+    Attributes
+    ----------
+    SAMPLE_BLOCK_SIZE : int
+        Approximate number of timestamps generated at once for block
+        of periods in sample mode
     """
 
+    SAMPLE_BLOCK_SIZE = 1_000_000
+
     def __init__(
         self,
         config: TimePatternConfig,
@@ -79,6 +91,7 @@ class TimePatternInputPlugin(InputPlugin[TimePatternConfig], register=False):
         self._randomizer_factors = self._generate_randomizer_factors(
             count=self._config.randomizer.sampling
         )
+        self._randomizer_position = 0
 
         if (
             not self._live_mode
@@ -89,7 +102,10 @@ class TimePatternInputPlugin(InputPlugin[TimePatternConfig], register=False):
                 context=dict(self.instance_info)
             )
 
-    def _generate_randomizer_factors(self, count: int) -> Iterator[float]:
+    def _generate_randomizer_factors(
+        self,
+        count: int
+    ) -> NDArray[np.float64]:
         """Generate sample of factors for randomizer.
 
         Parameters
@@ -97,30 +113,26 @@ class TimePatternInputPlugin(InputPlugin[TimePatternConfig], register=False):
         size : int
             Number of unique factors
 
-        Yields
-        ------
-        float
-            Randomizer factor
-
-        Notes
-        -----
-        Factors are shuffled each time the sample is exhausted
+        Returns
+        -------
+        NDArray[np.float64]
+            Randomizer factors
         """
         match self._config.randomizer.direction:
             case RandomizerDirection.DECREASE:
-                factors = np.random.uniform(
+                factors = self._rng.uniform(
                     low=(1 - self._config.randomizer.deviation),
                     high=1,
                     size=count
                 )
             case RandomizerDirection.INCREASE:
-                factors = np.random.uniform(
+                factors = self._rng.uniform(
                     low=1,
                     high=(1 + self._config.randomizer.deviation),
                     size=count
                 )
             case RandomizerDirection.MIXED:
-                factors = np.random.uniform(
+                factors = self._rng.uniform(
                     low=(1 - self._config.randomizer.deviation),
                     high=(1 + self._config.randomizer.deviation),
                     size=count
@@ -128,11 +140,48 @@ class TimePatternInputPlugin(InputPlugin[TimePatternConfig], register=False):
             case direction:
                 assert_never(direction)
 
-        while True:
-            for factor in factors:
-                yield float(factor)
+        return factors
+
+    def _take_randomizer_factors(self, count: int) -> NDArray[np.float64]:
+        """Take next randomizer factors from sample.
 
-            np.random.shuffle(factors)
+        Parameters
+        ----------
+        count : int
+            Number of factors to take
+
+        Returns
+        -------
+        NDArray[np.float64]
+            Randomizer factors
+
+        Notes
+        -----
+        Factors are shuffled each time the sample is exhausted
+        """
+        factors = self._randomizer_factors
+        parts: list[NDArray[np.float64]] = []
+
+        while count > 0:
+            if self._randomizer_position == factors.size:
+                self._rng.shuffle(factors)
+                self._randomizer_position = 0
+
+            taken = min(count, factors.size - self._randomizer_position)
+            parts.append(
+                factors[
+                    self._randomizer_position:
+                    self._randomizer_position + taken
+                ].copy()
+            )
+
+            self._randomizer_position += taken
+            count -= taken
+
+        if not parts:
+            return np.empty(0, dtype=np.float64)
+
+        return np.concatenate(parts)
 
     @property
     def _period_duration(self) -> timedelta:
@@ -153,50 +202,64 @@ class TimePatternInputPlugin(InputPlugin[TimePatternConfig], register=False):
         """
         return int(
             self._config.multiplier.ratio
-            * next(self._randomizer_factors)
+            * self._take_randomizer_factors(1)[0]
         )
 
-    def _generate_distribution(
-        self,
-        size: int,
-        duration: np.timedelta64
-    ) -> NDArray[np.timedelta64]:
-        """Generate distribution of time points for one period where
-        each point is expressed as time from the beginning of the
-        period.
+    def _sample_distribution(self, size: int) -> NDArray[np.float64]:
+        """Sample spreader distribution where each point is expressed
+        as fraction of period.
 
         Parameters
         ----------
         size : int
-            Size of distribution
-
-        duration : numpy.timedelta64
-            Duration of period
+            Size of sample
 
         Returns
         -------
-        NDArray[numpy.timedelta64]
-            Generated distribution
+        NDArray[np.float64]
+            Unsorted sample with values in range [0; 1]
         """
         params = self._config.spreader.parameters
         match self._config.spreader.distribution:
             case Distribution.UNIFORM:
                 low = params.low        # type: ignore[union-attr]
                 high = params.high      # type: ignore[union-attr]
-                array = np.sort(np.random.uniform(low, high, size))
+                return self._rng.uniform(low, high, size)
             case Distribution.TRIANGULAR:
                 left = params.left      # type: ignore[union-attr]
                 mode = params.mode      # type: ignore[union-attr]
                 right = params.right    # type: ignore[union-attr]
-                array = np.sort(np.random.triangular(left, mode, right, size))
+                return self._rng.triangular(left, mode, right, size)
             case Distribution.BETA:
                 a = params.a            # type: ignore[union-attr]
                 b = params.b            # type: ignore[union-attr]
-                array = np.sort(np.random.beta(a, b, size))
+                return self._rng.beta(a, b, size)
             case val:
                 assert_never(val)
 
-        return array * duration
+    def _generate_distribution(
+        self,
+        size: int,
+        duration: np.timedelta64
+    ) -> NDArray[np.timedelta64]:
+        """Generate distribution of time points for one period where
+        each point is expressed as time from the beginning of the
+        period.
+
+        Parameters
+        ----------
+        size : int
+            Size of distribution
+
+        duration : numpy.timedelta64
+            Duration of period
+
+        Returns
+        -------
+        NDArray[numpy.timedelta64]
+            Generated distribution
+        """
+        return np.sort(self._sample_distribution(size)) * duration
 
     def _generate_period_timeseries(
         self,
@@ -225,7 +288,57 @@ class TimePatternInputPlugin(InputPlugin[TimePatternConfig], register=False):
         """
         return self._generate_distribution(size, duration) + start
 
-    def _generate_sample(self) -> None:
+    def _generate_periods_timeseries(
+        self,
+        start: np.datetime64,
+        periods: int,
+        duration: np.timedelta64
+    ) -> NDArray[np.datetime64]:
+        """Generate array of timestamps distributed within block of
+        consecutive periods at once.
+
+        Parameters
+        ----------
+        start : numpy.datetime64
+            Start timestamp of the first period
+
+        periods : int
+            Number of periods
+
+        duration : numpy.timedelta64
+            Duration of one period
+
+        Returns
+        -------
+        NDArray[numpy.datetime64]
+            Generated sorted array of timestamps
+        """
+        sizes = (
+            self._config.multiplier.ratio
+            * self._take_randomizer_factors(periods)
+        ).astype(np.int64)
+
+        period_offsets = np.repeat(np.arange(periods) * duration, sizes)
+        offsets = period_offsets + (
+            self._sample_distribution(int(sizes.sum())) * duration
+        )
+
+        # Points of each period lie within the period, so sorting the
+        # whole block sorts each period segment in place
+        offsets.sort()
+
+        return offsets + start
+
+    @property
+    def _block_periods(self) -> int:
+        """Number of periods generated at once in sample mode."""
+        return max(1, self.SAMPLE_BLOCK_SIZE // self._config.multiplier.ratio)
+
+    @property
+    def sample_range(self) -> tuple[np.datetime64, np.datetime64]:
+        """Naive start and end (inclusive) of date range in sample
+        mode.
+        """
         start_dt, end_dt = normalize_versatile_daterange(
             start=self._config.oscillator.start,
             end=self._config.oscillator.end,
@@ -233,28 +346,110 @@ class TimePatternInputPlugin(InputPlugin[TimePatternConfig], register=False):
             none_start='now',
             none_end='max'
         )
+        return (
+            np.datetime64(
+                to_naive(start_dt, self._timezone).isoformat(), 'us'
+            ),
+            np.datetime64(to_naive(end_dt, self._timezone).isoformat(), 'us')
+        )
+
+    def generate_range(
+        self,
+        start: np.datetime64,
+        end: np.datetime64
+    ) -> NDArray[np.datetime64]:
+        """Generate timestamps of sample mode within part of date
+        range without enqueuing them.
+
+        Parameters
+        ----------
+        start : np.datetime64
+            Start of the part
+
+        end : np.datetime64
+            End of the part (exclusive)
+
+        Returns
+        -------
+        NDArray[np.datetime64]
+            Sorted timestamps
+
+        Notes
+        -----
+        Periods that straddle bounds of the part are generated entirely
+        and then cut, so parts generated independently are equivalent
+        to the whole range statistically rather than exactly.
+        """
+        range_start, range_end = self.sample_range
+        delta = np.timedelta64(self._period_duration)
+
+        total_periods = max(0, math.ceil((range_end - range_start) / delta))
+        period = min(
+            total_periods, max(0, math.floor((start - range_start) / delta))
+        )
+        last_period = min(
+            total_periods, max(0, math.ceil((end - range_start) / delta))
+        )
+
+        blocks: list[NDArray[np.datetime64]] = []
+        while period < last_period:
+            periods = min(self._block_periods, last_period - period)
+            timestamps = self._generate_periods_timeseries(
+                start=range_start + delta * period,
+                periods=periods,
+                duration=delta
+            )
+            blocks.append(
+                timestamps[
+                    (timestamps >= start)
+                    & (timestamps < end)
+                    & (timestamps <= range_end)
+                ]
+            )
+            period += periods
+
+        if not blocks:
+            return np.array([], dtype='datetime64[us]')
+
+        return np.concatenate(blocks)
+
+    def iterate_sample(self) -> Iterator[NDArray[np.datetime64]]:
+        """Iterate over blocks of timestamps in sample mode without
+        enqueuing them.
+
+        Yields
+        ------
+        NDArray[np.datetime64]
+            Sorted block of timestamps, each block covers whole
+            periods, so timestamps of the next blocks are not earlier
+            than the last timestamp of the previous ones
+        """
+        start, end = self.sample_range
         self._logger.info(
             'Generating in range',
-            start_timestamp=start_dt.isoformat(),
-            end_timestamp=end_dt.isoformat()
+            start_timestamp=str(start),
+            end_timestamp=str(end)
         )
 
         delta = np.timedelta64(self._period_duration)
-        start = np.datetime64(to_naive(start_dt, self._timezone))
-        end = np.datetime64(to_naive(end_dt, self._timezone))
+        block_periods = self._block_periods
 
         while start < end:
-            timestamps = get_past_slice(
-                timestamps=self._generate_period_timeseries(
+            periods = min(block_periods, math.ceil((end - start) / delta))
+            yield get_past_slice(
+                timestamps=self._generate_periods_timeseries(
                     start=start,
-                    size=self._period_size,
+                    periods=periods,
                     duration=delta
                 ),
                 before=end
             )
-            self._enqueue(timestamps)
 
-            start += delta
+            start += delta * periods
+
+    def _generate_sample(self) -> None:
+        for timestamps in self.iterate_sample():
+            self._enqueue(timestamps)
 
     def _generate_live(self) -> None:
         start_dt, end_dt = normalize_versatile_daterange(
@@ -329,6 +524,45 @@ class TimePatternInputPlugin(InputPlugin[TimePatternConfig], register=False):
             )
 
 
+@dataclass(frozen=True)
+class TimePatternsRangeGenerator(RangeGenerator):
+    """Range generator of `time_patterns` input plugin.
+
+    Parameters
+    ----------
+    patterns : tuple[TimePatternConfig, ...]
+        Configs of time patterns
+
+    timezone : BaseTzInfo
+        Timezone used to resolve date ranges of time patterns
+    """
+    patterns: tuple[TimePatternConfig, ...]
+    timezone: BaseTzInfo
+
+    def generate(
+        self,
+        start: np.datetime64,
+        end: np.datetime64,
+        seed: SeedSequence
+    ) -> NDArray[np.datetime64]:
+        arrays = [
+            TimePatternInputPlugin(
+                config=pattern,
+                params={
+                    'id': idx,
+                    'live_mode': False,
+                    'timezone': self.timezone,
+                    'seed': pattern_seed
+                }
+            ).generate_range(start, end)
+            for idx, (pattern, pattern_seed) in enumerate(
+                zip(self.patterns, seed.spawn(len(self.patterns)))
+            )
+        ]
+        timestamps, _ = merge_sorted_arrays_with_sources(arrays)
+        return timestamps
+
+
 class TimePatternsInputPlugin(InputPlugin[TimePatternsInputPluginConfig]):
     """Input plugin for merging timestamps from multiple
     `TimePatternInputPlugin` instances.
@@ -356,7 +590,11 @@ class TimePatternsInputPlugin(InputPlugin[TimePatternsInputPluginConfig]):
             Input plugin parameters
         """
         time_patterns: list[TimePatternInputPlugin] = []
-        for pattern_path in self._config.patterns:
+
+        # each time pattern gets independent random stream
+        seeds = self._seed_sequence.spawn(len(self._config.patterns))
+
+        for pattern_path, seed in zip(self._config.patterns, seeds):
             self._logger.info(
                 'Initializing time pattern for configuration',
                 file_path=pattern_path
@@ -413,7 +651,7 @@ class TimePatternsInputPlugin(InputPlugin[TimePatternsInputPluginConfig]):
             try:
                 time_pattern_plugin = TimePatternInputPlugin(
                     config=time_pattern,
-                    params=params
+                    params=params | {'seed': seed}   # type: ignore
                 )
             except PluginConfigurationError as e:
                 raise PluginConfigurationError(
@@ -430,14 +668,71 @@ class TimePatternsInputPlugin(InputPlugin[TimePatternsInputPluginConfig]):
         return time_patterns
 
     def _generate_sample(self) -> None:
-        samples: list[NDArray[np.datetime64]] = []
-        for plugin in self._time_patterns:
-            samples.append(
-                np.concatenate(list(plugin.generate()))  # propagate exceptions
+        # Time patterns are advanced in lockstep by blocks, the one
+        # with the earliest last generated timestamp is advanced first
+        # and all timestamps not later than it are merged and enqueued,
+        # so only about a block per pattern is kept in memory
+        iterators = {
+            idx: pattern.iterate_sample()
+            for idx, pattern in enumerate(self._time_patterns)
+        }
+        pending: dict[int, NDArray[np.datetime64]] = dict()
+        latest: dict[int, np.datetime64] = dict()
+
+        def advance(idx: int) -> None:
+            for block in iterators[idx]:
+                if block.size == 0:
+                    continue
+
+                if idx in pending:
+                    pending[idx] = np.concatenate([pending[idx], block])
+                else:
+                    pending[idx] = block
+
+                latest[idx] = block[-1]
+                return
+
+            del iterators[idx]
+            latest.pop(idx, None)
+
+        for idx in list(iterators):
+            advance(idx)
+
+        while iterators:
+            watermark = min(latest.values())
+            released: list[NDArray[np.datetime64]] = []
+
+            for idx, timestamps in list(pending.items()):
+                past = get_past_slice(timestamps, watermark)
+                if past.size > 0:
+                    released.append(past)
+
+                if past.size == timestamps.size:
+                    del pending[idx]
+                else:
+                    pending[idx] = timestamps[past.size:]
+
+            if released:
+                self._enqueue(merge_sorted_arrays_with_sources(released)[0])
+
+            advance(min(latest, key=lambda idx: latest[idx]))
+
+        if pending:
+            self._enqueue(
+                merge_sorted_arrays_with_sources(list(pending.values()))[0]
             )
 
-        timestamps = merge_arrays(samples)
-        self._enqueue(timestamps)
+    def _create_range_generator(self) -> TimePatternsRangeGenerator:
+        ranges = [pattern.sample_range for pattern in self._time_patterns]
+
+        return TimePatternsRangeGenerator(
+            start=min(start for start, _ in ranges),
+            end=max(end for _, end in ranges) + np.timedelta64(1, 'us'),
+            patterns=tuple(
+                pattern._config for pattern in self._time_patterns
+            ),
+            timezone=self._timezone
+        )
 
     def _generate_live(self) -> None:
         self._logger.info('Merging time patterns')
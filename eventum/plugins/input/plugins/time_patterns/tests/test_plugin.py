@@ -1,13 +1,15 @@
 import os
 
+import numpy as np
 import pytest
+import yaml
 from pytz import timezone
 
 from eventum.plugins.exceptions import PluginConfigurationError
-from eventum.plugins.input.plugins.time_patterns.config import \
-    TimePatternsInputPluginConfig
-from eventum.plugins.input.plugins.time_patterns.plugin import \
-    TimePatternsInputPlugin
+from eventum.plugins.input.plugins.time_patterns.config import (
+    TimePatternConfig, TimePatternsInputPluginConfig)
+from eventum.plugins.input.plugins.time_patterns.plugin import (
+    TimePatternInputPlugin, TimePatternsInputPlugin)
 
 STATIC_FILES_DIR = os.path.join(
     os.path.abspath(os.path.dirname(__file__)),
@@ -59,6 +61,152 @@ def test_time_pattern_sample():
     # plt.show()
 
 
+def test_time_pattern_sample_windowed_merge():
+    config = TimePatternsInputPluginConfig(
+        patterns=[
+            os.path.join(STATIC_FILES_DIR, 'pattern1.yml'),
+            os.path.join(STATIC_FILES_DIR, 'pattern2.yml'),
+            os.path.join(STATIC_FILES_DIR, 'pattern3.yml')
+        ]
+    )
+    plugin = TimePatternsInputPlugin(
+        config=config,
+        params={
+            'id': 1,
+            'live_mode': False,
+            'timezone': timezone('UTC')
+        }
+    )
+    for pattern in plugin._time_patterns:
+        pattern.SAMPLE_BLOCK_SIZE = 100
+
+    timestamps = np.concatenate(list(plugin.generate()))
+
+    assert timestamps.size > 0
+    assert np.all(timestamps[:-1] <= timestamps[1:])
+
+
+def test_single_time_pattern_sample_blocks():
+    config = TimePatternConfig.model_validate({
+        'label': 'test',
+        'oscillator': {
+            'period': 1,
+            'unit': 'seconds',
+            'start': '2024-01-01T00:00:00',
+            'end': '2024-01-02T00:00:00'
+        },
+        'multiplier': {'ratio': 10},
+        'randomizer': {'deviation': 0.5, 'direction': 'decrease'},
+        'spreader': {
+            'distribution': 'uniform',
+            'parameters': {'low': 0, 'high': 1}
+        }
+    })
+    plugin = TimePatternInputPlugin(
+        config=config,
+        params={
+            'id': 1,
+            'live_mode': False,
+            'timezone': timezone('UTC')
+        }
+    )
+    plugin.SAMPLE_BLOCK_SIZE = 100_000
+
+    timestamps = np.concatenate(list(plugin.generate()))
+
+    assert 5 * 86_400 <= timestamps.size <= 10 * 86_400
+    assert np.all(timestamps[:-1] <= timestamps[1:])
+    assert timestamps[0] >= np.datetime64('2024-01-01T00:00:00')
+    assert timestamps[-1] <= np.datetime64('2024-01-02T00:00:00')
+
+    # Each period gets number of points defined by its randomizer factor
+    _, counts = np.unique(
+        timestamps.astype('datetime64[s]'),
+        return_counts=True
+    )
+    assert counts.max() <= 10
+
+
+def test_time_pattern_sample_sharded():
+    config = TimePatternsInputPluginConfig(
+        patterns=[
+            os.path.join(STATIC_FILES_DIR, 'pattern1.yml'),
+            os.path.join(STATIC_FILES_DIR, 'pattern2.yml'),
+            os.path.join(STATIC_FILES_DIR, 'pattern3.yml')
+        ]
+    )
+
+    def generate(**params):
+        plugin = TimePatternsInputPlugin(
+            config=config,
+            params={
+                'id': 1,
+                'live_mode': False,
+                'timezone': timezone('UTC'),
+                **params
+            }
+        )
+        return np.concatenate(list(plugin.generate()))
+
+    expected = generate()
+    timestamps = generate(sample_workers=2, sample_shards=6)
+
+    assert np.all(timestamps[:-1] <= timestamps[1:])
+    assert timestamps[0] >= expected[0] - np.timedelta64(1, 'D')
+    assert timestamps[-1] <= expected[-1] + np.timedelta64(1, 'D')
+    assert 0.8 < timestamps.size / expected.size < 1.2
+
+
+def test_time_pattern_sample_seed(tmp_path):
+    patterns = []
+    for idx, distribution in enumerate(['uniform', 'beta']):
+        path = tmp_path / f'pattern{idx}.yml'
+        path.write_text(
+            yaml.dump({
+                'label': f'pattern {idx}',
+                'oscillator': {
+                    'period': 1,
+                    'unit': 'minutes',
+                    'start': '2024-01-01T00:00:00',
+                    'end': '2024-01-01T06:00:00'
+                },
+                'multiplier': {'ratio': 100},
+                'randomizer': {'deviation': 0.5, 'direction': 'mixed'},
+                'spreader': {
+                    'distribution': distribution,
+                    'parameters': (
+                        {'low': 0, 'high': 1}
+                        if distribution == 'uniform'
+                        else {'a': 2, 'b': 5}
+                    )
+                }
+            })
+        )
+        patterns.append(str(path))
+
+    config = TimePatternsInputPluginConfig(patterns=patterns)
+
+    def generate(seed, **params):
+        plugin = TimePatternsInputPlugin(
+            config=config,
+            params={
+                'id': 1,
+                'live_mode': False,
+                'timezone': timezone('UTC'),
+                'seed': seed,
+                **params
+            }
+        )
+        return np.concatenate(list(plugin.generate()))
+
+    assert np.array_equal(generate(42), generate(42))
+    assert not np.array_equal(generate(42), generate(43))
+    assert np.array_equal(
+        generate(42, sample_workers=2, sample_shards=4),
+        generate(42, sample_workers=2, sample_shards=4)
+    )
+
+
 def test_time_pattern_live():
     config = TimePatternsInputPluginConfig(
         patterns=[
@@ -1,17 +1,65 @@
 import time
+from dataclasses import dataclass
 from datetime import datetime, timedelta
 from itertools import repeat as i_repeat
 
-from numpy import arange, datetime64, full, repeat, timedelta64
+from numpy import arange, datetime64, full, int64, repeat, timedelta64
+from numpy.random import SeedSequence
 from numpy.typing import NDArray
 
 from eventum.plugins.exceptions import PluginConfigurationError
 from eventum.plugins.input.base.plugin import InputPlugin, InputPluginParams
 from eventum.plugins.input.normalizers import normalize_versatile_datetime
 from eventum.plugins.input.plugins.timer.config import TimerInputPluginConfig
+from eventum.plugins.input.sharding import RangeGenerator
 from eventum.plugins.input.utils.time_utils import skip_periods, to_naive
 
 
+@dataclass(frozen=True)
+class TimerRangeGenerator(RangeGenerator):
+    """Range generator of `timer` input plugin.
+
+    Parameters
+    ----------
+    origin : datetime64
+        Start time of timer countdown
+
+    interval : timedelta64
+        Interval between timestamps
+
+    repeat : int
+        Number of cycles
+
+    count : int
+        Number of timestamps to generate for every cycle
+    """
+    origin: datetime64
+    interval: timedelta64
+    repeat: int
+    count: int
+
+    def generate(
+        self,
+        start: datetime64,
+        end: datetime64,
+        seed: SeedSequence
+    ) -> NDArray[datetime64]:
+        interval_us = int(self.interval.astype(int64))
+        start_us = int((start - self.origin).astype(int64))
+        end_us = int((end - self.origin).astype(int64))
+
+        # Cycles `k` in [1; repeat] with `origin + k * interval` within
+        # [start; end)
+        first_cycle = max(1, -(-start_us // interval_us))
+        last_cycle = min(self.repeat, -(-end_us // interval_us) - 1)
+
+        timestamps = (
+            arange(first_cycle, last_cycle + 1) * self.interval
+            + self.origin
+        )
+        return repeat(timestamps, repeats=self.count)
+
+
 class TimerInputPlugin(InputPlugin[TimerInputPluginConfig]):
     """Input plugin for generating timestamps after specified number of
     seconds.
@@ -30,6 +78,40 @@ class TimerInputPlugin(InputPlugin[TimerInputPluginConfig]):
                 context=dict(self.instance_info)
             )
 
+    def _create_range_generator(self) -> TimerRangeGenerator:
+        start = normalize_versatile_datetime(
+            value=self._config.start,
+            timezone=self._timezone,
+            none_point='now'
+        )
+
+        origin = datetime64(to_naive(start, self._timezone).isoformat(), 'us')
+        interval = timedelta64(timedelta(seconds=self._config.seconds), 'us')
+
+        if self._config.repeat is None:
+            end = normalize_versatile_datetime(
+                value=None,
+                timezone=self._timezone,
+                none_point='max'
+            )
+            repeat = int(
+                (end - start) / timedelta(seconds=self._config.seconds)
+            )
+        else:
+            repeat = self._config.repeat
+
+        return TimerRangeGenerator(
+            start=origin + interval,
+            end=origin + interval * repeat + timedelta64(1, 'us'),
+            origin=origin,
+            interval=interval,
+            repeat=repeat,
+            count=self._config.count
+        )
+
+    def _create_live_range_generator(self) -> TimerRangeGenerator:
+        return self._create_range_generator()
+
     def _generate_sample(self) -> None:
         start = normalize_versatile_datetime(
             value=self._config.start,
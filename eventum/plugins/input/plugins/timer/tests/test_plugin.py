@@ -1,10 +1,16 @@
+from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 
+import numpy as np
+import pytest
 from numpy import datetime64, timedelta64
+from numpy.random import SeedSequence
 from pytz import timezone
 
 from eventum.plugins.input.plugins.timer.config import TimerInputPluginConfig
 from eventum.plugins.input.plugins.timer.plugin import TimerInputPlugin
+from eventum.plugins.input.sharding import RangeGenerator
+from eventum.plugins.input.utils.time_utils import now64
 
 
 def test_timer_sample():
@@ -58,3 +64,99 @@ def test_timer_live():
         datetime64(expected_end.replace(tzinfo=None))
         - timestamps[-1]
     ) < timedelta64(100, 'ms')
+
+
+@pytest.mark.parametrize('live_horizon', [0.2, 10])
+def test_timer_live_horizon(live_horizon):
+    start = datetime.now(tz=timezone('UTC')) - timedelta(seconds=0.25)
+    plugin = TimerInputPlugin(
+        config=TimerInputPluginConfig(
+            start=start,
+            seconds=0.1,
+            count=3,
+            repeat=10
+        ),
+        params={
+            'id': 1,
+            'live_mode': True,
+            'timezone': timezone('UTC'),
+            'live_horizon': live_horizon
+        }
+    )
+
+    timestamps = []
+    for batch in plugin.generate():
+        # batches are released only when their timestamps are due
+        assert batch[-1] <= now64(timezone('UTC'))
+        timestamps.extend(batch)
+
+    # two cycles are in past and skipped
+    assert len(timestamps) == 8 * 3
+    assert timestamps[-1] == datetime64(
+        (start + timedelta(seconds=1)).replace(tzinfo=None)
+    )
+
+
+@dataclass(frozen=True)
+class SeedsRecordingRangeGenerator(RangeGenerator):
+    seeds: list[SeedSequence] = field(default_factory=list)
+
+    def generate(self, start, end, seed):
+        self.seeds.append(seed)
+        return np.array([], dtype='datetime64[us]')
+
+
+def test_timer_live_horizon_window_seeds():
+    plugin = TimerInputPlugin(
+        config=TimerInputPluginConfig(
+            start=datetime.now(tz=timezone('UTC')),
+            seconds=0.1,
+            count=1,
+            repeat=1
+        ),
+        params={
+            'id': 1,
+            'live_mode': True,
+            'timezone': timezone('UTC'),
+            'live_horizon': 0.1
+        }
+    )
+    now = now64(timezone('UTC'))
+    generator = SeedsRecordingRangeGenerator(
+        start=now,
+        end=now + timedelta64(300, 'ms')
+    )
+
+    plugin._generate_live_ahead(generator)
+
+    # Each window has independent random stream
+    assert len(generator.seeds) >= 2
+    assert len({seed.spawn_key for seed in generator.seeds}) == len(
+        generator.seeds
+    )
+
+
+def test_timer_sample_sharded():
+    config = TimerInputPluginConfig(
+        start=datetime(2024, 1, 1, 0, 0, 0, tzinfo=timezone('UTC')),
+        seconds=0.7,
+        count=2,
+        repeat=10_001
+    )
+
+    def generate(**params):
+        plugin = TimerInputPlugin(
+            config=config,
+            params={
+                'id': 1,
+                'live_mode': False,
+                'timezone': timezone('UTC'),
+                **params
+            }
+        )
+        return np.concatenate(list(plugin.generate()))
+
+    expected = generate()
+    timestamps = generate(sample_workers=3, sample_shards=11)
+
+    assert np.array_equal(timestamps, expected)
@@ -1,13 +1,20 @@
-
-
 import os
 from datetime import datetime
+from enum import StrEnum
 
 from pydantic import Field, field_validator
 
 from eventum.plugins.input.base.config import InputPluginConfig
 
 
+class EpochUnit(StrEnum):
+    """Units of integer epoch timestamps."""
+    SECONDS = 's'
+    MILLISECONDS = 'ms'
+    MICROSECONDS = 'us'
+    NANOSECONDS = 'ns'
+
+
 class TimestampsInputPluginConfig(InputPluginConfig, frozen=True):
     """Configuration for `timestamps` input plugin.
 
@@ -15,7 +22,12 @@ class TimestampsInputPluginConfig(InputPluginConfig, frozen=True):
     ----------
     source : list[datetime] | str
         List of timestamps or absolute path to file with new line
-        separated timestamps in ISO8601 format
+        separated timestamps in ISO8601 format or to binary `.npy` file
+        with one dimensional array of naive `datetime64` timestamps or
+        integer UTC epoch timestamps
+
+    epoch_unit : EpochUnit, default='us'
+        Unit of integer epoch timestamps in binary file
 
     Notes
     -----
@@ -23,6 +35,7 @@ class TimestampsInputPluginConfig(InputPluginConfig, frozen=True):
     order
     """
     source: list[datetime] | str = Field(min_length=1)
+    epoch_unit: EpochUnit = Field(default=EpochUnit.MICROSECONDS)
 
     @field_validator('source')
     def validate_source(cls, v: list[datetime] | str) -> list[datetime] | str:
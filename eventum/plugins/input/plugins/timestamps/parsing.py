@@ -0,0 +1,370 @@
+from datetime import datetime, timedelta
+from itertools import islice
+from typing import Iterable, Iterator
+
+from numpy import (array, ascontiguousarray, datetime64, empty, maximum,
+                   intp, load, str_, uint32, unique, where, zeros)
+from numpy import char as np_char
+from numpy.typing import NDArray
+from pytz import BaseTzInfo, utc
+
+from eventum.plugins.input.utils.time_utils import to_naive
+
+CHUNK_SIZE = 1_000_000
+
+# Offsets of real timezones change at quarter hour boundaries, so the
+# offset is computed once per quarter hour of timestamps in chunk
+_OFFSET_RESOLUTION = 'datetime64[15m]'
+
+# Minimal position of offset sign, signs at lower positions belong to
+# date part (`YYYY-MM-DD`)
+_MIN_OFFSET_POSITION = 11
+
+
+def _slice_strings(
+    strings: NDArray[str_],
+    start: int,
+    stop: int
+) -> NDArray[str_]:
+    """Slice each string of array at the same positions.
+
+    Parameters
+    ----------
+    strings : NDArray[str_]
+        Array of strings with unicode type
+
+    start : int
+        Start position
+
+    stop : int
+        Stop position (exclusive), it must not exceed width of type
+
+    Returns
+    -------
+    NDArray[str_]
+        Sliced strings
+    """
+    width = strings.dtype.itemsize // 4
+    codes = ascontiguousarray(strings).view(uint32).reshape(-1, width)
+
+    return ascontiguousarray(codes[:, start:stop]).view(
+        f'<U{stop - start}'
+    ).ravel()
+
+
+def _parse_offset(suffix: str) -> timedelta:
+    """Parse UTC offset suffix of ISO 8601 timestamp.
+
+    Parameters
+    ----------
+    suffix : str
+        Suffix (e.g. `Z`, `+03:00`, `-0530`) or empty string for naive
+        timestamps
+
+    Returns
+    -------
+    timedelta
+        UTC offset
+
+    Raises
+    ------
+    ValueError
+        If suffix cannot be parsed
+    """
+    if not suffix:
+        return timedelta()
+
+    offset = datetime.fromisoformat(f'2000-01-01T00:00:00{suffix}').utcoffset()
+    if offset is None:
+        raise ValueError(f'Invalid UTC offset "{suffix}"')
+
+    return offset
+
+
+def _utc_to_local(
+    timestamps: NDArray[datetime64],
+    timezone: BaseTzInfo
+) -> NDArray[datetime64]:
+    """Convert naive UTC timestamps to naive wall clock time of
+    timezone.
+
+    Parameters
+    ----------
+    timestamps : NDArray[datetime64]
+        Naive UTC timestamps
+
+    timezone : BaseTzInfo
+        Target timezone
+
+    Returns
+    -------
+    NDArray[datetime64]
+        Naive timestamps of target timezone
+    """
+    quarters, inverse = unique(
+        timestamps.astype(_OFFSET_RESOLUTION),
+        return_inverse=True
+    )
+    offsets = array(
+        [
+            utc.localize(quarter).astimezone(timezone).utcoffset()
+            for quarter in quarters.astype(datetime)
+        ],
+        dtype='timedelta64[us]'
+    )
+
+    return timestamps + offsets[inverse]
+
+
+def _parse_chunk_vectorized(
+    lines: NDArray[str_],
+    timezone: BaseTzInfo
+) -> NDArray[datetime64]:
+    """Parse stripped ISO 8601 timestamps using vectorized operations.
+
+    Parameters
+    ----------
+    lines : NDArray[str_]
+        Stripped non empty lines with unicode type
+
+    timezone : BaseTzInfo
+        Timezone for converting timestamps with UTC offsets
+
+    Returns
+    -------
+    NDArray[datetime64]
+        Naive timestamps with `datetime64[us]` type
+
+    Raises
+    ------
+    ValueError
+        If some timestamp cannot be parsed
+    """
+    lengths = np_char.str_len(lines)
+    signs = maximum(np_char.rfind(lines, '+'), np_char.rfind(lines, '-'))
+
+    # Position where UTC offset suffix starts
+    positions = where(
+        np_char.endswith(lines, 'Z'),
+        lengths - 1,
+        where(signs >= _MIN_OFFSET_POSITION, signs, lengths)
+    )
+
+    timestamps: NDArray[datetime64] = empty(lines.size, dtype='datetime64[us]')
+    for position in unique(positions):
+        mask = positions == position
+        group = lines[mask]
+
+        local = _slice_strings(group, 0, position).astype('datetime64[us]')
+
+        group_suffixes = _slice_strings(
+            group, position, group.dtype.itemsize // 4
+        )
+        if (group_suffixes == group_suffixes[0]).all():
+            suffixes = group_suffixes[:1]
+            inverse = zeros(group.size, dtype=intp)
+        else:
+            suffixes, inverse = unique(group_suffixes, return_inverse=True)
+
+        if suffixes.size == 1 and suffixes[0] == '':
+            timestamps[mask] = local
+            continue
+
+        # Timestamps with offsets are converted to UTC and then to
+        # wall clock time of timezone, naive ones are kept as is
+        offsets = array(
+            [_parse_offset(str(suffix)) for suffix in suffixes],
+            dtype='timedelta64[us]'
+        )
+        aware = (suffixes != '')[inverse]
+
+        converted = local.copy()
+        converted[aware] = _utc_to_local(
+            local[aware] - offsets[inverse][aware],
+            timezone
+        )
+        timestamps[mask] = converted
+
+    return timestamps
+
+
+def parse_timestamps(
+    lines: Iterable[str],
+    timezone: BaseTzInfo
+) -> NDArray[datetime64]:
+    """Parse ISO 8601 timestamps to naive timestamps of timezone.
+
+    Parameters
+    ----------
+    lines : Iterable[str]
+        Lines with timestamps, empty lines are skipped
+
+    timezone : BaseTzInfo
+        Timezone for converting timestamps with UTC offsets, naive
+        timestamps are considered to be already in this timezone
+
+    Returns
+    -------
+    NDArray[datetime64]
+        Timestamps with `datetime64[us]` type
+
+    Raises
+    ------
+    ValueError
+        If some timestamp cannot be parsed
+
+    Notes
+    -----
+    Timestamps are parsed in vectorized form, if it fails (e.g. for
+    timestamps in basic format) each timestamp is parsed by
+    `datetime.fromisoformat`.
+    """
+    stripped = np_char.strip(array(list(lines), dtype=str_))
+    stripped = stripped[np_char.str_len(stripped) > 0]
+
+    if stripped.size == 0:
+        return empty(0, dtype='datetime64[us]')
+
+    try:
+        return _parse_chunk_vectorized(stripped, timezone)
+    except ValueError:
+        pass
+
+    return array(
+        [
+            to_naive(datetime.fromisoformat(str(line)), timezone)
+            for line in stripped
+        ],
+        dtype='datetime64[us]'
+    )
+
+
+def iterate_timestamps_file(
+    path: str,
+    timezone: BaseTzInfo,
+    chunk_size: int = CHUNK_SIZE
+) -> Iterator[NDArray[datetime64]]:
+    """Iterate over chunks of timestamps parsed from file with new line
+    separated ISO 8601 timestamps.
+
+    Parameters
+    ----------
+    path : str
+        Path to file
+
+    timezone : BaseTzInfo
+        Timezone for converting timestamps with UTC offsets (see
+        `parse_timestamps`)
+
+    chunk_size : int, default=CHUNK_SIZE
+        Number of lines parsed at once
+
+    Yields
+    ------
+    NDArray[datetime64]
+        Non empty chunks of timestamps
+
+    Raises
+    ------
+    OSError
+        If file cannot be read
+
+    ValueError
+        If some timestamp cannot be parsed
+    """
+    with open(path) as f:
+        while True:
+            lines = list(islice(f, chunk_size))
+            if not lines:
+                return
+
+            timestamps = parse_timestamps(lines, timezone)
+            if timestamps.size > 0:
+                yield timestamps
+
+
+def map_timestamps_file(
+    path: str,
+    epoch_unit: str = 'us'
+) -> tuple[NDArray[datetime64], bool]:
+    """Memory map binary `.npy` file with timestamps.
+
+    Parameters
+    ----------
+    path : str
+        Path to file with one dimensional array of naive `datetime64`
+        timestamps or 64-bit integer UTC epoch timestamps
+
+    epoch_unit : str, default='us'
+        Unit of integer epoch timestamps
+
+    Returns
+    -------
+    tuple[NDArray[datetime64], bool]
+        Mapped array of timestamps and flag whether timestamps are in
+        UTC (for integer epoch timestamps which are viewed as
+        `datetime64` without copying)
+
+    Raises
+    ------
+    OSError
+        If file cannot be read
+
+    ValueError
+        If file is not valid `.npy` file or array has unsupported
+        shape or type
+    """
+    mapped = load(path, mmap_mode='r', allow_pickle=False)
+
+    if mapped.ndim != 1:
+        raise ValueError('Array must be one dimensional')
+
+    if mapped.dtype.kind == 'M':
+        return mapped, False
+
+    if mapped.dtype.kind in 'iu' and mapped.dtype.itemsize == 8:
+        return mapped.view(f'datetime64[{epoch_unit}]'), True
+
+    raise ValueError(f'Unsupported type of array "{mapped.dtype}"')
+
+
+def iterate_mapped_timestamps(
+    mapped: NDArray[datetime64],
+    utc: bool,
+    timezone: BaseTzInfo,
+    chunk_size: int = CHUNK_SIZE
+) -> Iterator[NDArray[datetime64]]:
+    """Iterate over chunks of memory mapped timestamps.
+
+    Parameters
+    ----------
+    mapped : NDArray[datetime64]
+        Mapped array of timestamps (see `map_timestamps_file`)
+
+    utc : bool
+        Whether timestamps are in UTC, such timestamps are converted to
+        naive timestamps of timezone, others are considered to be
+        already in timezone
+
+    timezone : BaseTzInfo
+        Timezone of timestamps
+
+    chunk_size : int, default=CHUNK_SIZE
+        Number of timestamps in chunk
+
+    Yields
+    ------
+    NDArray[datetime64]
+        Non empty chunks of timestamps with `datetime64[us]` type,
+        chunks of timestamps that are already in timezone with such
+        type are slices of mapped array without copying
+    """
+    for offset in range(0, mapped.size, chunk_size):
+        chunk = mapped[offset:offset + chunk_size].astype(
+            'datetime64[us]', copy=False
+        )
+
+        if utc:
+            yield _utc_to_local(chunk, timezone)
+        else:
+            yield chunk
@@ -1,13 +1,19 @@
 import logging
 from datetime import datetime
+from typing import Iterator
 
 from numpy import array, astype, datetime64
 from numpy.typing import NDArray
+from pytz import utc
 
-from eventum.plugins.exceptions import PluginConfigurationError
+from eventum.plugins.exceptions import (PluginConfigurationError,
+                                        PluginRuntimeError)
 from eventum.plugins.input.base.plugin import InputPlugin, InputPluginParams
 from eventum.plugins.input.plugins.timestamps.config import \
     TimestampsInputPluginConfig
+from eventum.plugins.input.plugins.timestamps.parsing import (
+    iterate_mapped_timestamps, iterate_timestamps_file, map_timestamps_file,
+    parse_timestamps)
 from eventum.plugins.input.utils.array_utils import get_future_slice
 from eventum.plugins.input.utils.time_utils import now64, to_naive
 
@@ -15,7 +21,16 @@ logger = logging.getLogger(__name__)
 
 
 class TimestampsInputPlugin(InputPlugin[TimestampsInputPluginConfig]):
-    """Input plugin for generating events at specified timestamps."""
+    """Input plugin for generating events at specified timestamps.
+
+    Notes
+    -----
+    Timestamps from text file are parsed by chunks during generation
+    and binary `.npy` files are memory mapped, so files of any size are
+    replayed with bounded memory.
+    """
+
+    READ_CHUNK_SIZE = 1_000_000
 
     def __init__(
         self,
@@ -24,37 +39,113 @@ class TimestampsInputPlugin(InputPlugin[TimestampsInputPluginConfig]):
     ) -> None:
         super().__init__(config, params)
 
-        if isinstance(config.source, str):
-            timestamps: list[datetime] = [
-                to_naive(ts, self._timezone)
-                for ts in self._read_timestamps_from_file(config.source)
-            ]
-            if not timestamps:
-                raise PluginConfigurationError(
-                    'No timestamps are in the file',
-                    context=dict(self.instance_info, file_path=config.source)
-                )
-            self._logger.info(
-                'Timestamps are read from the file',
-                file_path=config.source,
-                count=len(timestamps)
-            )
+        self._timestamps: NDArray[datetime64] | None = None
+        self._mapped: NDArray[datetime64] | None = None
+        self._mapped_utc = False
+
+        if isinstance(config.source, str) and config.source.endswith('.npy'):
+            self._mapped, self._mapped_utc = self._map_file(config.source)
+        elif isinstance(config.source, str):
+            self._validate_file(config.source)
         else:
-            timestamps = [
-                to_naive(ts, self._timezone) for ts in config.source
-            ]
+            self._timestamps = array(
+                [to_naive(ts, self._timezone) for ts in config.source],
+                dtype='datetime64[us]'
+            )
             self._logger.info(
                 'Timestamps are read from the configuration',
-                count=len(timestamps)
+                count=len(self._timestamps)
+            )
+
+    def _map_file(self, filename: str) -> tuple[NDArray[datetime64], bool]:
+        """Memory map binary file with timestamps.
+
+        Parameters
+        ----------
+        filename : str
+            Path to `.npy` file with timestamps
+
+        Returns
+        -------
+        tuple[NDArray[datetime64], bool]
+            Mapped timestamps and flag whether they are in UTC
+
+        Raises
+        ------
+        PluginConfigurationError
+            If cannot map the specified file or there are no timestamps
+            in the file
+        """
+        try:
+            mapped, is_utc = map_timestamps_file(
+                path=filename,
+                epoch_unit=self._config.epoch_unit
+            )
+        except (OSError, ValueError) as e:
+            raise PluginConfigurationError(
+                'Failed to map timestamps from file',
+                context=dict(
+                    self.instance_info,
+                    file_path=filename,
+                    reason=str(e)
+                )
+            ) from None
+
+        if mapped.size == 0:
+            raise PluginConfigurationError(
+                'No timestamps are in the file',
+                context=dict(self.instance_info, file_path=filename)
+            )
+
+        self._logger.info(
+            'Timestamps are mapped from the file',
+            file_path=filename,
+            count=mapped.size
+        )
+
+        return mapped, is_utc
+
+    def _iterate_mapped_timestamps(self) -> Iterator[NDArray[datetime64]]:
+        """Iterate over chunks of mapped timestamps, past timestamps
+        are skipped in live mode without reading them.
+
+        Yields
+        ------
+        NDArray[datetime64]
+            Chunk of timestamps
+        """
+        mapped = self._mapped
+        assert mapped is not None
+
+        bounds = next(
+            iterate_mapped_timestamps(
+                mapped=mapped[[0, -1]],
+                utc=self._mapped_utc,
+                timezone=self._timezone
+            )
+        )
+        self._log_generation_range(bounds)
+
+        if self._live_mode:
+            future_mapped = get_future_slice(
+                timestamps=mapped,
+                after=now64(utc if self._mapped_utc else self._timezone)
             )
 
-        self._timestamps: NDArray[datetime64] = array(
-            timestamps,
-            dtype='datetime64[us]'
+            if future_mapped.size < mapped.size:
+                self._logger.info('Past timestamp are skipped')
+
+            mapped = future_mapped
+
+        yield from iterate_mapped_timestamps(
+            mapped=mapped,
+            utc=self._mapped_utc,
+            timezone=self._timezone,
+            chunk_size=self.READ_CHUNK_SIZE
         )
 
-    def _read_timestamps_from_file(self, filename: str) -> list[datetime]:
-        """Read timestamps from specified file.
+    def _validate_file(self, filename: str) -> None:
+        """Check that file can be read and starts with valid timestamp.
 
         Parameters
         ----------
@@ -62,23 +153,18 @@ class TimestampsInputPlugin(InputPlugin[TimestampsInputPluginConfig]):
             Path to file with timestamps that are delimited with new
             line
 
-        Returns
-        -------
-        list[datetime]
-            List of datetime objects
-
         Raises
         ------
         PluginConfigurationError
-            If cannot read content of the specified file or parse
-            timestamps
+            If cannot read content of the specified file, parse the
+            first timestamp or there are no timestamps in the file
         """
         try:
             with open(filename) as f:
-                return [
-                    datetime.fromisoformat(line.strip())
-                    for line in f.readlines() if line.strip()
-                ]
+                for line in f:
+                    if line.strip():
+                        parse_timestamps([line], self._timezone)
+                        return
         except (OSError, ValueError) as e:
             raise PluginConfigurationError(
                 'Failed to read timestamps from file',
@@ -89,13 +175,76 @@ class TimestampsInputPlugin(InputPlugin[TimestampsInputPluginConfig]):
                 )
             ) from None
 
-    def _log_generation_range(self) -> None:
-        """Log generation range."""
+        raise PluginConfigurationError(
+            'No timestamps are in the file',
+            context=dict(self.instance_info, file_path=filename)
+        )
+
+    def _iterate_timestamps(self) -> Iterator[NDArray[datetime64]]:
+        """Iterate over chunks of timestamps.
+
+        Yields
+        ------
+        NDArray[datetime64]
+            Chunk of timestamps
+
+        Raises
+        ------
+        PluginRuntimeError
+            If cannot read content of the file or parse timestamps
+        """
+        if self._timestamps is not None:
+            self._log_generation_range(self._timestamps)
+            yield self._timestamps
+            return
+
+        if self._mapped is not None:
+            yield from self._iterate_mapped_timestamps()
+            return
+
+        filename = self._config.source
+        assert isinstance(filename, str)
+
+        self._logger.info('Generating from file', file_path=filename)
+
+        count = 0
+        try:
+            for timestamps in iterate_timestamps_file(
+                path=filename,
+                timezone=self._timezone,
+                chunk_size=self.READ_CHUNK_SIZE
+            ):
+                count += timestamps.size
+                yield timestamps
+        except (OSError, ValueError) as e:
+            raise PluginRuntimeError(
+                'Failed to read timestamps from file',
+                context=dict(
+                    self.instance_info,
+                    file_path=filename,
+                    reason=str(e)
+                )
+            ) from None
+
+        self._logger.info(
+            'Timestamps are read from the file',
+            file_path=filename,
+            count=count
+        )
+
+    def _log_generation_range(self, timestamps: NDArray[datetime64]) -> None:
+        """Log generation range.
+
+        Parameters
+        ----------
+        timestamps : NDArray[datetime64]
+            Timestamps to generate
+        """
         start = self._timezone.localize(
-            astype(self._timestamps[0], datetime)   # type: ignore[arg-type]
+            astype(timestamps[0], datetime)     # type: ignore[arg-type]
         )
         end = self._timezone.localize(
-            astype(self._timestamps[-1], datetime)  # type: ignore[arg-type]
+            astype(timestamps[-1], datetime)    # type: ignore[arg-type]
         )
         self._logger.info(
             'Generating in range',
@@ -104,18 +253,21 @@ class TimestampsInputPlugin(InputPlugin[TimestampsInputPluginConfig]):
         )
 
     def _generate_sample(self) -> None:
-        self._log_generation_range()
-        self._enqueue(self._timestamps)
+        for timestamps in self._iterate_timestamps():
+            self._enqueue(timestamps)
 
     def _generate_live(self) -> None:
-        self._log_generation_range()
+        skipped = False
 
-        future_timestamps = get_future_slice(
-            timestamps=self._timestamps,
-            after=now64(timezone=self._timezone)
-        )
+        for timestamps in self._iterate_timestamps():
+            future_timestamps = get_future_slice(
+                timestamps=timestamps,
+                after=now64(timezone=self._timezone)
+            )
 
-        if len(future_timestamps) < len(self._timestamps):
-            self._logger.info('Past timestamp are skipped')
+            if len(future_timestamps) < len(timestamps) and not skipped:
+                self._logger.info('Past timestamp are skipped')
+                skipped = True
 
-        self._enqueue(future_timestamps)
+            if len(future_timestamps) > 0:
+                self._enqueue(future_timestamps)
@@ -0,0 +1,80 @@
+from datetime import datetime
+
+import numpy as np
+import pytest
+from pytz import timezone
+
+from eventum.plugins.input.plugins.timestamps.parsing import (
+    iterate_timestamps_file, parse_timestamps)
+from eventum.plugins.input.utils.time_utils import to_naive
+
+LINES = [
+    '2024-01-01T00:00:00.050',
+    '2024-03-31T00:30:00Z',
+    '2024-03-31T01:30:00+00:00',
+    '2024-10-27T00:59:59.999999Z',
+    '2024-10-27T01:00:00Z',
+    '2024-06-01 12:00:00-0530',
+    '2024-06-01',
+    '',
+    '  2024-06-01T05:06:07.123456+05:45  \n',
+    '2024-06-01T05:06:07+03',
+]
+
+
+def parse_reference(lines, tz):
+    return np.array(
+        [
+            to_naive(datetime.fromisoformat(line.strip()), tz)
+            for line in lines if line.strip()
+        ],
+        dtype='datetime64[us]'
+    )
+
+
+@pytest.mark.parametrize(
+    'tz',
+    ['UTC', 'Europe/Berlin', 'Asia/Kathmandu', 'America/New_York']
+)
+def test_parse_timestamps(tz):
+    assert np.array_equal(
+        parse_timestamps(LINES, timezone(tz)),
+        parse_reference(LINES, timezone(tz))
+    )
+
+
+def test_parse_timestamps_fallback():
+    lines = ['20240101T000000Z', '20240101T010000+01:00']
+
+    assert np.array_equal(
+        parse_timestamps(lines, timezone('UTC')),
+        parse_reference(lines, timezone('UTC'))
+    )
+
+
+def test_parse_invalid_timestamps():
+    with pytest.raises(ValueError):
+        parse_timestamps(['2024-01-01', 'not a timestamp'], timezone('UTC'))
+
+
+def test_parse_empty_lines():
+    assert parse_timestamps(['', '  \n'], timezone('UTC')).size == 0
+
+
+def test_iterate_timestamps_file(tmp_path):
+    path = tmp_path / 'timestamps.txt'
+    path.write_text('\n'.join(LINES * 10))
+
+    chunks = list(
+        iterate_timestamps_file(
+            path=str(path),
+            timezone=timezone('Europe/Berlin'),
+            chunk_size=7
+        )
+    )
+
+    assert all(chunk.size <= 7 for chunk in chunks)
+    assert np.array_equal(
+        np.concatenate(chunks),
+        parse_reference(LINES * 10, timezone('Europe/Berlin'))
+    )
@@ -2,10 +2,13 @@ import os
 import tempfile
 from datetime import datetime, timedelta
 
+import numpy as np
 import pytest
 from numpy import datetime64
 from pytz import timezone
 
+from eventum.plugins.exceptions import (PluginConfigurationError,
+                                        PluginRuntimeError)
 from eventum.plugins.input.plugins.timestamps.config import \
     TimestampsInputPluginConfig
 from eventum.plugins.input.plugins.timestamps.plugin import \
@@ -100,3 +103,145 @@ def test_timestamps_from_file(timestamps_filename):
         datetime64('2024-01-01T00:00:00.050'),
         datetime64('2024-01-01T00:00:00.100'),
     ]
+
+
+def test_timestamps_from_file_by_chunks(tmp_path):
+    path = tmp_path / 'timestamps.txt'
+    path.write_text(
+        '\n'.join(
+            f'2024-01-01T00:00:{second:02d}+01:00' for second in range(60)
+        )
+    )
+
+    plugin = TimestampsInputPlugin(
+        config=TimestampsInputPluginConfig(source=str(path)),
+        params={
+            'id': 1,
+            'live_mode': False,
+            'timezone': timezone('UTC')
+        }
+    )
+    plugin.READ_CHUNK_SIZE = 7
+
+    timestamps = []
+    for batch in plugin.generate():
+        timestamps.extend(batch)
+
+    assert len(timestamps) == 60
+    assert timestamps[0] == datetime64('2023-12-31T23:00:00')
+    assert timestamps[-1] == datetime64('2023-12-31T23:00:59')
+
+
+def test_timestamps_from_bad_file(tmp_path):
+    empty_path = tmp_path / 'empty.txt'
+    empty_path.write_text('\n\n')
+
+    with pytest.raises(PluginConfigurationError):
+        TimestampsInputPlugin(
+            config=TimestampsInputPluginConfig(source=str(empty_path)),
+            params={
+                'id': 1,
+                'live_mode': False,
+                'timezone': timezone('UTC')
+            }
+        )
+
+    bad_path = tmp_path / 'bad.txt'
+    bad_path.write_text('2024-01-01T00:00:00\nbad timestamp\n')
+
+    plugin = TimestampsInputPlugin(
+        config=TimestampsInputPluginConfig(source=str(bad_path)),
+        params={
+            'id': 1,
+            'live_mode': False,
+            'timezone': timezone('UTC')
+        }
+    )
+
+    with pytest.raises(PluginRuntimeError):
+        list(plugin.generate())
+
+
+def test_timestamps_from_npy_file(tmp_path):
+    path = tmp_path / 'timestamps.npy'
+    expected = (
+        datetime64('2024-01-01T00:00:00', 'ms')
+        + np.arange(100) * np.timedelta64(250, 'ms')
+    )
+    np.save(path, expected)
+
+    plugin = TimestampsInputPlugin(
+        config=TimestampsInputPluginConfig(source=str(path)),
+        params={
+            'id': 1,
+            'live_mode': False,
+            'timezone': timezone('UTC')
+        }
+    )
+    plugin.READ_CHUNK_SIZE = 30
+
+    timestamps = np.concatenate(list(plugin.generate()))
+
+    assert np.array_equal(timestamps, expected.astype('datetime64[us]'))
+
+
+def test_timestamps_from_npy_epoch_file(tmp_path):
+    path = tmp_path / 'timestamps.npy'
+    # 2024-03-31T00:30:00Z and 2024-03-31T01:30:00Z, DST starts between
+    np.save(path, np.array([1711845000, 1711848600], dtype=np.int64))
+
+    plugin = TimestampsInputPlugin(
+        config=TimestampsInputPluginConfig(source=str(path), epoch_unit='s'),
+        params={
+            'id': 1,
+            'live_mode': False,
+            'timezone': timezone('Europe/Berlin')
+        }
+    )
+
+    timestamps = np.concatenate(list(plugin.generate()))
+
+    assert list(timestamps) == [
+        datetime64('2024-03-31T01:30:00'),
+        datetime64('2024-03-31T03:30:00'),
+    ]
+
+
+def test_timestamps_from_npy_file_live(tmp_path):
+    now = np.datetime64(datetime.now(tz=timezone('UTC')).replace(tzinfo=None))
+    path = tmp_path / 'timestamps.npy'
+    np.save(
+        path,
+        (now + np.arange(-5, 3) * np.timedelta64(300, 'ms')).astype(
+            'datetime64[us]'
+        )
+    )
+
+    plugin = TimestampsInputPlugin(
+        config=TimestampsInputPluginConfig(source=str(path)),
+        params={
+            'id': 1,
+            'live_mode': True,
+            'timezone': timezone('UTC')
+        }
+    )
+
+    timestamps = np.concatenate(list(plugin.generate()))
+
+    assert timestamps.size == 2
+    assert timestamps[0] == now + np.timedelta64(300, 'ms')
+
+
+def test_timestamps_from_bad_npy_file(tmp_path):
+    path = tmp_path / 'timestamps.npy'
+    np.save(path, np.zeros((2, 2), dtype=np.int64))
+
+    with pytest.raises(PluginConfigurationError):
+        TimestampsInputPlugin(
+            config=TimestampsInputPluginConfig(source=str(path)),
+            params={
+                'id': 1,
+                'live_mode': False,
+                'timezone': timezone('UTC')
+            }
+        )
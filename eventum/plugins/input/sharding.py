@@ -0,0 +1,194 @@
+from abc import ABC, abstractmethod
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from dataclasses import dataclass
+from typing import Iterator
+
+import numpy as np
+from numpy import datetime64
+from numpy.random import SeedSequence
+from numpy.typing import NDArray
+
+
+@dataclass(frozen=True)
+class RangeGenerator(ABC):
+    """Picklable generator of timestamps of input plugin within
+    arbitrary parts of its whole date range, used to generate parts
+    in separate processes.
+
+    Parameters
+    ----------
+    start : datetime64
+        Start of the whole range
+
+    end : datetime64
+        End of the whole range (exclusive)
+    """
+    start: datetime64
+    end: datetime64
+
+    @abstractmethod
+    def generate(
+        self,
+        start: datetime64,
+        end: datetime64,
+        seed: SeedSequence
+    ) -> NDArray[datetime64]:
+        """Generate timestamps within part of the whole range.
+
+        Parameters
+        ----------
+        start : datetime64
+            Start of the part
+
+        end : datetime64
+            End of the part (exclusive)
+
+        seed : SeedSequence
+            Seed sequence of independent random stream of the part
+
+        Returns
+        -------
+        NDArray[datetime64]
+            Sorted timestamps, concatenation of timestamps generated
+            for consecutive parts is equal to timestamps of the whole
+            range
+        """
+        ...
+
+
+def split_range(
+    start: datetime64,
+    end: datetime64,
+    count: int
+) -> list[tuple[datetime64, datetime64]]:
+    """Split date range into consecutive shards of equal duration.
+
+    Parameters
+    ----------
+    start : datetime64
+        Start of the range
+
+    end : datetime64
+        End of the range (exclusive)
+
+    count : int
+        Number of shards
+
+    Returns
+    -------
+    list[tuple[datetime64, datetime64]]
+        Bounds of shards, there can be less shards than requested if
+        the range is too short
+
+    Raises
+    ------
+    ValueError
+        If `count` is less than 1
+    """
+    if count < 1:
+        raise ValueError('Parameter `count` must be greater than 0')
+
+    start_us = int(start.astype('datetime64[us]').astype(np.int64))
+    end_us = int(end.astype('datetime64[us]').astype(np.int64))
+
+    if end_us <= start_us:
+        return []
+
+    bounds = np.unique(
+        np.linspace(start_us, end_us, num=count + 1).astype(np.int64)
+    ).astype('datetime64[us]')
+
+    return list(zip(bounds[:-1], bounds[1:]))
+
+
+def _generate_shard(
+    generator: RangeGenerator,
+    start: datetime64,
+    end: datetime64,
+    seed: SeedSequence
+) -> NDArray[datetime64]:
+    """Generate timestamps of shard in worker process.
+
+    Parameters
+    ----------
+    generator : RangeGenerator
+        Range generator
+
+    start : datetime64
+        Start of shard
+
+    end : datetime64
+        End of shard (exclusive)
+
+    seed : SeedSequence
+        Seed sequence of shard
+
+    Returns
+    -------
+    NDArray[datetime64]
+        Generated timestamps
+    """
+    return generator.generate(start, end, seed)
+
+
+def generate_sharded(
+    generator: RangeGenerator,
+    workers: int,
+    shards: int,
+    seed: SeedSequence | None = None
+) -> Iterator[NDArray[datetime64]]:
+    """Generate timestamps of the whole range of range generator by
+    shards in process pool.
+
+    Parameters
+    ----------
+    generator : RangeGenerator
+        Range generator
+
+    workers : int
+        Number of worker processes
+
+    shards : int
+        Number of shards to split the range into
+
+    seed : SeedSequence | None, default=None
+        Seed sequence for spawning independent random streams of
+        shards, sequence with fresh entropy is used if value is `None`
+
+    Yields
+    ------
+    NDArray[datetime64]
+        Timestamps of shards in order of shards
+
+    Raises
+    ------
+    ValueError
+        If `workers` or `shards` is less than 1
+
+    Notes
+    -----
+    At most two shards per worker are generated ahead of consumer, so
+    memory is bounded by shard size rather than by the whole range.
+    """
+    if workers < 1:
+        raise ValueError('Parameter `workers` must be greater than 0')
+
+    ranges = split_range(generator.start, generator.end, shards)
+    seeds = (seed or SeedSequence()).spawn(len(ranges))
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures: deque[Future[NDArray[datetime64]]] = deque()
+
+        for (start, end), shard_seed in zip(ranges, seeds):
+            futures.append(
+                executor.submit(
+                    _generate_shard, generator, start, end, shard_seed
+                )
+            )
+
+            if len(futures) >= workers * 2:
+                yield futures.popleft().result()
+
+        while futures:
+            yield futures.popleft().result()
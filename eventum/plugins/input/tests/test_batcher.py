@@ -478,3 +478,97 @@ def test_size_and_delay_batching_with_scheduling_and_sparse_timestamps():
     assert batches[-2].size == 9
     assert batches[-1].size == 1
     assert (end - start) >= 1.2
+
+
+@pytest.mark.parametrize(
+    'policy,expected_size',
+    [('catch-up', 100), ('drop', 50), ('collapse', 51), ('restamp', 100)]
+)
+def test_lag_policy_with_scheduling(policy, expected_size):
+    reports = []
+    batcher = TimestampsBatcher(
+        batch_size=1000,
+        scheduling=True,
+        timezone=timezone('UTC'),
+        lag_policy=policy,
+        max_lag=5,
+        on_lag=lambda *args: reports.append(args)
+    )
+    now = np.datetime64(datetime.now(UTC).replace(tzinfo=None), 'us')
+    lagging = np.full(50, now - np.timedelta64(60, 's'))
+    recent = np.full(50, now - np.timedelta64(1, 's'))
+
+    batcher.add(np.concatenate([lagging, recent]))
+    batcher.close()
+
+    batches = list(batcher.scroll())
+    timestamps = np.concatenate(batches)
+
+    assert timestamps.size == expected_size
+    assert np.all(timestamps[:-1] <= timestamps[1:])
+
+    if policy == 'restamp':
+        assert np.all(timestamps >= recent[0])
+
+    assert len(reports) == 1
+    reported_policy, count, lag = reports[0]
+    assert reported_policy == policy
+    assert count == 50
+    assert lag >= 60
+
+
+def test_invalid_lag_policy():
+    with pytest.raises(ValueError):
+        TimestampsBatcher(lag_policy='skip')
+
+
+def test_no_lag_with_scheduling():
+    reports = []
+    batcher = TimestampsBatcher(
+        batch_size=1000,
+        scheduling=True,
+        timezone=timezone('UTC'),
+        lag_policy='drop',
+        max_lag=5,
+        on_lag=lambda *args: reports.append(args)
+    )
+    now = np.datetime64(datetime.now(UTC).replace(tzinfo=None), 'us')
+
+    batcher.add(np.full(10, now))
+    batcher.close()
+
+    batches = list(batcher.scroll())
+
+    assert sum(batch.size for batch in batches) == 10
+    assert reports == []
+
+
+def test_precise_scheduling():
+    batcher = TimestampsBatcher(
+        batch_size=1,
+        scheduling=True,
+        timezone=timezone('UTC'),
+        scheduling_precision=0.0001
+    )
+    assert batcher.scheduling_precision == 0.0001
+
+    now = np.datetime64(datetime.now(UTC).replace(tzinfo=None), 'us')
+    delays = [0.2, 0.35, 0.5]
+    timestamps = np.array(
+        [now + np.timedelta64(int(delay * 1_000_000), 'us')
+         for delay in delays]
+    )
+
+    batcher.add(timestamps)
+    batcher.close()
+
+    published = []
+    for batch in batcher.scroll():
+        published.append(
+            datetime.now(UTC).replace(tzinfo=None) - batch[0].item()
+        )
+
+    assert len(published) == 3
+    assert all(
+        -0.001 <= delta.total_seconds() < 0.03 for delta in published
+    )
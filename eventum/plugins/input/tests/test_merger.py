@@ -350,3 +350,50 @@ def test_merger_invalid_params():
             batch_size=0,
             ordering=True
         )
+
+
+def test_merger_with_ordering_latency():
+    start = datetime.now(tz=timezone('UTC'))
+
+    plugins_lst = [
+        LinspaceInputPlugin(
+            config=LinspaceInputPluginConfig(
+                start=start + timedelta(seconds=0.3 + i * 0.05),
+                end='+0.5s',
+                count=1000,
+            ),
+            params={
+                'id': i,
+                'live_mode': True,
+                'timezone': timezone('UTC'),
+                'batch_size': 100,
+                'batch_delay': 0.1
+            }
+        )
+        for i in range(3)
+    ]
+
+    merger = InputPluginsLiveMerger(
+        plugins=plugins_lst,
+        target_delay=0.1,
+        batch_size=None,
+        ordering=True
+    )
+
+    latencies = []
+    batches = []
+    for batch in merger.generate(include_id=False):
+        now = np.datetime64(
+            datetime.now(tz=timezone('UTC')).replace(tzinfo=None),
+            'us'
+        )
+        latencies.append((now - batch[-1]) / np.timedelta64(1, 's'))
+        batches.append(batch)
+
+    array = np.concatenate(batches)
+
+    assert array.size == 3000
+    assert np.all(array[:-1] <= array[1:])
+
+    # Ordering delays publishing by about `target_delay` only
+    assert max(latencies) < 0.25
@@ -0,0 +1,97 @@
+from dataclasses import dataclass
+
+import numpy as np
+import pytest
+from numpy import datetime64, timedelta64
+
+from eventum.plugins.input.sharding import (RangeGenerator, generate_sharded,
+                                            split_range)
+
+
+@dataclass(frozen=True)
+class SecondsRangeGenerator(RangeGenerator):
+    def generate(self, start, end, seed):
+        first = start.astype('datetime64[s]')
+        if first < start:
+            first += timedelta64(1, 's')
+
+        return np.arange(first, end, timedelta64(1, 's')).astype(
+            'datetime64[us]'
+        )
+
+
+@dataclass(frozen=True)
+class RandomRangeGenerator(RangeGenerator):
+    def generate(self, start, end, seed):
+        return np.array([np.random.default_rng(seed).random()])
+
+
+def test_split_range():
+    start = datetime64('2024-01-01T00:00:00', 'us')
+    end = datetime64('2024-01-01T00:00:10', 'us')
+
+    ranges = split_range(start, end, 4)
+
+    assert len(ranges) == 4
+    assert ranges[0][0] == start
+    assert ranges[-1][1] == end
+    for (_, left_end), (right_start, _) in zip(ranges, ranges[1:]):
+        assert left_end == right_start
+
+
+def test_split_short_range():
+    start = datetime64('2024-01-01T00:00:00.000000', 'us')
+    end = datetime64('2024-01-01T00:00:00.000002', 'us')
+
+    assert len(split_range(start, end, 10)) == 2
+    assert split_range(end, start, 10) == []
+
+    with pytest.raises(ValueError):
+        split_range(start, end, 0)
+
+
+def test_generate_sharded():
+    generator = SecondsRangeGenerator(
+        start=datetime64('2024-01-01T00:00:00', 'us'),
+        end=datetime64('2024-01-01T01:00:00', 'us')
+    )
+
+    timestamps = np.concatenate(
+        list(generate_sharded(generator, workers=2, shards=7))
+    )
+
+    assert np.array_equal(
+        timestamps,
+        generator.generate(
+            generator.start, generator.end, np.random.SeedSequence()
+        )
+    )
+
+
+def test_generate_sharded_seeds():
+    generator = RandomRangeGenerator(
+        start=datetime64('2024-01-01T00:00:00', 'us'),
+        end=datetime64('2024-01-01T01:00:00', 'us')
+    )
+
+    def generate(seed):
+        return np.concatenate(
+            list(
+                generate_sharded(
+                    generator,
+                    workers=2,
+                    shards=4,
+                    seed=np.random.SeedSequence(seed)
+                )
+            )
+        )
+
+    first = generate(42)
+    second = generate(42)
+
+    assert np.array_equal(first, second)
+    assert np.unique(first).size == 4
+    assert not np.array_equal(first, generate(43))
+
+    with pytest.raises(ValueError):
+        list(generate_sharded(generator, workers=0, shards=4))
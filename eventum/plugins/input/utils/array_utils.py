@@ -1,8 +1,11 @@
 from typing import Sequence
 
-from numpy import concatenate, datetime64, searchsorted, sort
+from numpy import (argsort, array, concatenate, datetime64, empty,
+                   min_scalar_type, repeat, searchsorted, sort)
 from numpy.typing import NDArray
 
+MERGE_CHUNK_SIZE = 65_536
+
 
 def get_future_slice(
     timestamps: NDArray[datetime64],
@@ -71,8 +74,127 @@ def chunk_array(array: NDArray, size: int) -> list[NDArray]:
     return [array[i:i + size] for i in range(0, array.size, size)]
 
 
+def _get_keys(array: NDArray, field: str | None) -> NDArray:
+    """Get keys of array elements used for ordering.
+
+    Parameters
+    ----------
+    array : NDArray
+        Array
+
+    field : str | None
+        Field of structured array to use as key, the first field is
+        used for structured arrays if value is `None`
+
+    Returns
+    -------
+    NDArray
+        Keys
+    """
+    if field is None and array.dtype.names is not None:
+        field = array.dtype.names[0]
+
+    return array if field is None else array[field]
+
+
+def merge_sorted_arrays_with_sources(
+    arrays: Sequence[NDArray],
+    field: str | None = None,
+    chunk_size: int = MERGE_CHUNK_SIZE
+) -> tuple[NDArray, NDArray]:
+    """Merge arrays sorted in ascending order and get index of source
+    array for each element of merged array.
+
+    Parameters
+    ----------
+    arrays : Sequence[NDArray]
+        Sorted one dimensional arrays to merge
+
+    field : str | None, default=None
+        Field of structured arrays to use as key, the first field is
+        used for structured arrays if value is `None`
+
+    chunk_size : int, default=MERGE_CHUNK_SIZE
+        Maximum number of elements taken from head of each array for
+        single merging step
+
+    Returns
+    -------
+    tuple[NDArray, NDArray]
+        Merged sorted array and indices of source arrays of its
+        elements, indices have the smallest unsigned integer type
+        that fits number of arrays
+
+    Raises
+    ------
+    ValueError
+        If arrays sequence is empty
+
+    Notes
+    -----
+    Arrays are merged by steps directly into preallocated result. At
+    each step the cutoff is the smallest of keys at `chunk_size`
+    position of heads of arrays, heads with keys not greater than
+    cutoff are merged with stable sort of their keys and written to
+    result. So besides result only the heads of single step are
+    allocated. Equal elements keep order of arrays they come from.
+    """
+    if not arrays:
+        raise ValueError('At least one array must be provided')
+
+    keys = [_get_keys(array, field) for array in arrays]
+    is_plain = arrays[0].dtype.names is None and field is None
+
+    total = sum(array.size for array in arrays)
+    merged = empty(total, dtype=arrays[0].dtype)
+    sources = empty(total, dtype=min_scalar_type(len(arrays) - 1))
+
+    starts = [0] * len(arrays)
+    offset = 0
+
+    while offset < total:
+        cutoff = min(
+            array_keys[min(start + chunk_size, array_keys.size) - 1]
+            for array_keys, start in zip(keys, starts)
+            if start < array_keys.size
+        )
+
+        # Elements equal to cutoff are taken from all arrays at the
+        # same step, so order of equal elements is stable
+        heads: list[tuple[int, int, int]] = []
+        for index, (array_keys, start) in enumerate(zip(keys, starts)):
+            end = start + int(
+                searchsorted(array_keys[start:], cutoff, side='right')
+            )
+            if end > start:
+                heads.append((index, start, end))
+                starts[index] = end
+
+        head_keys = concatenate(
+            [keys[index][start:end] for index, start, end in heads]
+        )
+        order = argsort(head_keys, kind='stable')
+        step_end = offset + head_keys.size
+
+        if is_plain:
+            merged[offset:step_end] = head_keys[order]
+        else:
+            merged[offset:step_end] = concatenate(
+                [arrays[index][start:end] for index, start, end in heads]
+            )[order]
+
+        sources[offset:step_end] = repeat(
+            array([index for index, _, _ in heads], dtype=sources.dtype),
+            [end - start for _, start, end in heads]
+        )[order]
+
+        offset = step_end
+
+    return merged, sources
+
+
 def merge_arrays(arrays: Sequence[NDArray]) -> NDArray:
-    """Merge sorted arrays.
+    """Merge arrays into sorted array.
 
     Parameters
     ----------
@@ -91,13 +213,17 @@ def merge_arrays(arrays: Sequence[NDArray]) -> NDArray:
 
     Notes
     -----
-    If array is structured or multidimensional then zeroth axis is used
+    Arrays are not required to be sorted. Structured one dimensional
+    arrays are sorted by the first field only with equal elements
+    keeping order of arrays they come from. If array is
+    multidimensional then zeroth axis is used.
     """
     if not arrays:
         raise ValueError('At least one array must be provided')
 
-    return sort(
-        a=concatenate(arrays),
-        kind='mergesort',
-        axis=0
-    )
+    array = concatenate(arrays)
+
+    if array.ndim == 1 and array.dtype.names is not None:
+        return array[argsort(_get_keys(array, None), kind='stable')]
+
+    return sort(a=array, kind='mergesort', axis=0)
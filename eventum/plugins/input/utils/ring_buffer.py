@@ -0,0 +1,247 @@
+from numpy import datetime64, empty, searchsorted
+from numpy.typing import DTypeLike, NDArray
+
+
+class TimestampsRingBuffer:
+    """Ring buffer of timestamps with constant time size accounting
+    and slice based extraction.
+
+    Parameters
+    ----------
+    max_size : int
+        Maximum number of timestamps in buffer
+
+    initial_capacity : int, default=1024
+        Number of timestamps for which storage is preallocated, storage
+        is doubled on demand up to `max_size`
+
+    dtype : DTypeLike, default='datetime64[us]'
+        Type of stored timestamps, added timestamps are casted to it
+
+    Raises
+    ------
+    ValueError
+        If some parameter is out of allowed range
+
+    Notes
+    -----
+    Buffer is not thread safe. It is expected that timestamps are
+    added in ascending order so binary search can be used to count
+    timestamps before some moment.
+    """
+
+    def __init__(
+        self,
+        max_size: int,
+        initial_capacity: int = 1024,
+        dtype: DTypeLike = 'datetime64[us]'
+    ) -> None:
+        if max_size < 1:
+            raise ValueError('Parameter `max_size` must be greater than 0')
+
+        if initial_capacity < 1:
+            raise ValueError(
+                'Parameter `initial_capacity` must be greater than 0'
+            )
+
+        self._max_size = max_size
+        self._buffer: NDArray[datetime64] = empty(
+            min(initial_capacity, max_size),
+            dtype=dtype
+        )
+        self._head = 0
+        self._size = 0
+
+    def _reserve(self, required: int) -> None:
+        """Grow storage to fit required number of timestamps.
+
+        Parameters
+        ----------
+        required : int
+            Required number of timestamps
+
+        Raises
+        ------
+        ValueError
+            If required number exceeds maximum size
+        """
+        if required > self._max_size:
+            raise ValueError('Maximum size of buffer is exceeded')
+
+        capacity = self._buffer.size
+        if required <= capacity:
+            return
+
+        while capacity < required:
+            capacity *= 2
+
+        buffer = empty(min(capacity, self._max_size), dtype=self._buffer.dtype)
+        self._copy_to(buffer, self._size)
+
+        self._buffer = buffer
+        self._head = 0
+
+    def _copy_to(self, target: NDArray[datetime64], count: int) -> None:
+        """Copy the first timestamps to the beginning of target array.
+
+        Parameters
+        ----------
+        target : NDArray[datetime64]
+            Target array
+
+        count : int
+            Number of timestamps to copy
+        """
+        first = min(count, self._buffer.size - self._head)
+        target[:first] = self._buffer[self._head:self._head + first]
+        target[first:count] = self._buffer[:count - first]
+
+    def _write_at(self, index: int, timestamps: NDArray[datetime64]) -> None:
+        """Write timestamps to storage starting from index with
+        wrapping around the end of storage.
+
+        Parameters
+        ----------
+        index : int
+            Index in storage
+
+        timestamps : NDArray[datetime64]
+            Timestamps to write
+        """
+        first = min(timestamps.size, self._buffer.size - index)
+        self._buffer[index:index + first] = timestamps[:first]
+        self._buffer[:timestamps.size - first] = timestamps[first:]
+
+    def push(self, timestamps: NDArray[datetime64]) -> None:
+        """Add timestamps to the end of buffer.
+
+        Parameters
+        ----------
+        timestamps : NDArray[datetime64]
+            Timestamps to add
+
+        Raises
+        ------
+        ValueError
+            If maximum size of buffer is exceeded
+        """
+        self._reserve(self._size + timestamps.size)
+
+        tail = (self._head + self._size) % self._buffer.size
+        self._write_at(tail, timestamps)
+        self._size += timestamps.size
+
+    def push_front(self, timestamps: NDArray[datetime64]) -> None:
+        """Add timestamps to the beginning of buffer (e.g. to return
+        previously popped ones).
+
+        Parameters
+        ----------
+        timestamps : NDArray[datetime64]
+            Timestamps to add
+
+        Raises
+        ------
+        ValueError
+            If maximum size of buffer is exceeded
+        """
+        self._reserve(self._size + timestamps.size)
+
+        self._head = (self._head - timestamps.size) % self._buffer.size
+        self._write_at(self._head, timestamps)
+        self._size += timestamps.size
+
+    def pop(self, count: int) -> NDArray[datetime64]:
+        """Remove the first timestamps from buffer.
+
+        Parameters
+        ----------
+        count : int
+            Number of timestamps to remove, it is truncated to current
+            size of buffer
+
+        Returns
+        -------
+        NDArray[datetime64]
+            Removed timestamps, the array doesn't share memory with
+            buffer
+        """
+        count = min(count, self._size)
+        timestamps = empty(count, dtype=self._buffer.dtype)
+        self._copy_to(timestamps, count)
+
+        self._size -= count
+        self._head = (
+            (self._head + count) % self._buffer.size if self._size else 0
+        )
+
+        return timestamps
+
+    def get(self, index: int) -> datetime64:
+        """Get timestamp by its index in buffer.
+
+        Parameters
+        ----------
+        index : int
+            Index of timestamp starting from the first one
+
+        Returns
+        -------
+        datetime64
+            Timestamp
+
+        Raises
+        ------
+        IndexError
+            If index is out of range
+        """
+        if not 0 <= index < self._size:
+            raise IndexError('Index is out of range')
+
+        return self._buffer[(self._head + index) % self._buffer.size]
+
+    def count_before(self, moment: datetime64) -> int:
+        """Count timestamps that are before the moment or equal to it
+        using binary search.
+
+        Parameters
+        ----------
+        moment : datetime64
+            Cutoff moment
+
+        Returns
+        -------
+        int
+            Number of timestamps
+        """
+        end = self._head + self._size
+        first = self._buffer[self._head:min(end, self._buffer.size)]
+
+        count = int(searchsorted(a=first, v=moment, side='right'))
+        if count < first.size or end <= self._buffer.size:
+            return count
+
+        second = self._buffer[:end - self._buffer.size]
+        return count + int(searchsorted(a=second, v=moment, side='right'))
+
+    def clear(self) -> None:
+        """Remove all timestamps from buffer."""
+        self._head = 0
+        self._size = 0
+
+    @property
+    def size(self) -> int:
+        """Number of timestamps in buffer."""
+        return self._size
+
+    @property
+    def capacity(self) -> int:
+        """Number of timestamps that fit into currently allocated
+        storage.
+        """
+        return self._buffer.size
+
+    @property
+    def max_size(self) -> int:
+        """Maximum number of timestamps in buffer."""
+        return self._max_size
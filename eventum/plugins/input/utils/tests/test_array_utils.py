@@ -1,9 +1,8 @@
 import numpy as np
 
-from eventum.plugins.input.utils.array_utils import (chunk_array,
-                                                     get_future_slice,
-                                                     get_past_slice,
-                                                     merge_arrays)
+from eventum.plugins.input.utils.array_utils import (
+    chunk_array, get_future_slice, get_past_slice, merge_arrays,
+    merge_sorted_arrays_with_sources)
 
 
 def test_get_future_slice():
@@ -101,3 +100,58 @@ def test_merge_arrays():
     assert result.size == 10_000
     assert set(result) == set(values)
     assert np.all(result[:-1] <= result[1:])
+
+
+def test_merge_structured_arrays():
+    dtype = [('timestamp', 'datetime64[us]'), ('id', 'uint16')]
+    arrays = []
+    for i in range(5):
+        arr = np.empty(1000, dtype=dtype)
+        arr['timestamp'] = np.sort(
+            np.random.randint(0, 10_000, 1000)
+        ).astype('datetime64[us]')
+        arr['id'] = i
+        arrays.append(arr)
+
+    result = merge_arrays(arrays)
+
+    assert result.size == 5000
+    assert np.all(result['timestamp'][:-1] <= result['timestamp'][1:])
+    for i in range(5):
+        np.testing.assert_array_equal(
+            result[result['id'] == i]['timestamp'],
+            arrays[i]['timestamp']
+        )
+
+
+def test_merge_sorted_arrays_with_sources():
+    arrays = [
+        np.array([1, 4, 7]),
+        np.array([], dtype=int),
+        np.array([1, 2, 8, 9]),
+    ]
+
+    result, sources = merge_sorted_arrays_with_sources(arrays)
+
+    np.testing.assert_array_equal(result, [1, 1, 2, 4, 7, 8, 9])
+    np.testing.assert_array_equal(sources, [0, 2, 2, 0, 0, 2, 2])
+    assert sources.dtype == np.uint8
+
+
+def test_merge_sorted_arrays_with_sources_by_chunks():
+    rng = np.random.default_rng(0)
+    dtype = [('timestamp', 'datetime64[us]'), ('id', 'uint16')]
+    arrays = []
+    for i, size in enumerate([0, 10, 1000, 3, 500]):
+        arr = np.empty(size, dtype=dtype)
+        arr['timestamp'] = np.sort(rng.integers(0, 100, size))
+        arr['id'] = i
+        arrays.append(arr)
+
+    result, sources = merge_sorted_arrays_with_sources(arrays, chunk_size=7)
+
+    concatenated = np.concatenate(arrays)
+    order = np.argsort(concatenated['timestamp'], kind='stable')
+
+    np.testing.assert_array_equal(result, concatenated[order])
+    np.testing.assert_array_equal(sources, concatenated['id'][order])
@@ -0,0 +1,69 @@
+import numpy as np
+import pytest
+
+from eventum.plugins.input.utils.ring_buffer import TimestampsRingBuffer
+
+
+def make_timestamps(start: int, count: int) -> np.ndarray:
+    return np.arange(start, start + count).astype('datetime64[us]')
+
+
+def test_push_pop():
+    buffer = TimestampsRingBuffer(max_size=10, initial_capacity=4)
+
+    buffer.push(make_timestamps(0, 3))
+    assert buffer.size == 3
+    assert buffer.capacity == 4
+
+    np.testing.assert_array_equal(buffer.pop(2), make_timestamps(0, 2))
+
+    # Wrapping around the end of storage
+    buffer.push(make_timestamps(3, 3))
+    assert buffer.capacity == 4
+
+    np.testing.assert_array_equal(buffer.pop(10), make_timestamps(2, 4))
+    assert buffer.size == 0
+
+
+def test_growth():
+    buffer = TimestampsRingBuffer(max_size=10, initial_capacity=2)
+
+    buffer.push(make_timestamps(0, 1))
+    buffer.pop(1)
+    buffer.push(make_timestamps(1, 7))
+
+    assert buffer.capacity == 8
+    np.testing.assert_array_equal(buffer.pop(7), make_timestamps(1, 7))
+
+    buffer.push(make_timestamps(0, 10))
+    assert buffer.capacity == 10
+
+    with pytest.raises(ValueError):
+        buffer.push(make_timestamps(10, 1))
+
+
+def test_push_front():
+    buffer = TimestampsRingBuffer(max_size=10, initial_capacity=4)
+
+    buffer.push(make_timestamps(0, 4))
+    popped = buffer.pop(3)
+    buffer.push(make_timestamps(4, 2))
+    buffer.push_front(popped[1:])
+
+    np.testing.assert_array_equal(buffer.pop(5), make_timestamps(1, 5))
+
+
+def test_count_before():
+    buffer = TimestampsRingBuffer(max_size=8, initial_capacity=8)
+
+    buffer.push(make_timestamps(0, 6))
+    buffer.pop(4)
+    buffer.push(make_timestamps(6, 4))
+
+    assert buffer.count_before(np.datetime64(3, 'us')) == 0
+    assert buffer.count_before(np.datetime64(5, 'us')) == 2
+    assert buffer.count_before(np.datetime64(7, 'us')) == 4
+    assert buffer.count_before(np.datetime64(100, 'us')) == 6
+
+    buffer.clear()
+    assert buffer.count_before(np.datetime64(100, 'us')) == 0
@@ -4,7 +4,9 @@ from pydantic import Field
 
 from eventum.plugins.base.config import PluginConfig
 from eventum.plugins.output.fields import (Format, FormatterConfigT,
-                                           SimpleFormatterConfig)
+                                           RoutingConfig,
+                                           SimpleFormatterConfig,
+                                           SpoolConfig)
 
 
 class OutputPluginConfig(PluginConfig, ABC, frozen=True):
@@ -14,9 +16,19 @@ class OutputPluginConfig(PluginConfig, ABC, frozen=True):
     ----------
     formatter : FormatterConfigT, default=SimpleFormatterConfig(...)
         Formatter configuration
+
+    routing : RoutingConfig | None, default=None
+        Routing configuration, all events are routed to output if
+        value is `None`
+
+    spool : SpoolConfig | None, default=None
+        Configuration of on-disk spool for batches that failed to be
+        written, failed batches are lost if value is `None`
     """
     formatter: FormatterConfigT = Field(
         default_factory=lambda: SimpleFormatterConfig(format=Format.PLAIN),
         validate_default=True,
         discriminator='format'
     )
+    routing: RoutingConfig | None = Field(default=None)
+    spool: SpoolConfig | None = Field(default=None)
@@ -8,9 +8,14 @@ from eventum.plugins.base.plugin import Plugin, PluginParams
 from eventum.plugins.exceptions import (PluginConfigurationError,
                                         PluginRuntimeError)
 from eventum.plugins.output.base.config import OutputPluginConfig
-from eventum.plugins.output.fields import FormatterConfigT
+from eventum.plugins.output.exceptions import (PartialWriteError,
+                                               PermanentWriteError)
+from eventum.plugins.output.fields import (FormatterConfigT, RoutingConfig,
+                                           SpoolConfig)
 from eventum.plugins.output.formatters import (Formatter, FormattingResult,
                                                get_formatter_class)
+from eventum.plugins.output.spool import (SegmentSpool, SpooledBatch,
+                                          append_dead_letters)
 
 
 class OutputPluginParams(PluginParams):
@@ -52,6 +57,10 @@ class OutputPlugin(Plugin[ConfigT, ParamsT], register=False):
         self._formatter_config = self._get_formatter_config()
         self._formatter = self._get_formatter(self._formatter_config)
 
+        self._spool: SegmentSpool | None = None
+        self._spool_event: asyncio.Event
+        self._replaying_task: asyncio.Task | None = None
+
     def _get_formatter_config(self) -> FormatterConfigT:
         """Get formatter config.
 
@@ -124,21 +133,359 @@ class OutputPlugin(Plugin[ConfigT, ParamsT], register=False):
 
             if not self._is_opened:
                 await self._open()
+                await self._open_spool()
                 self._is_opened = True
 
         await self._logger.ainfo('Plugin is opened for writing')
 
+    async def warm_up(self) -> None:
+        """Open plugin and prepare it for writing ahead of the first
+        events (e.g. establish connections to target), so the first
+        events are not delayed by initialization.
+
+        Raises
+        ------
+        PluginRuntimeError
+            If error occurs during opening
+        """
+        await self.open()
+        await self._warm_up()
+        await self._logger.ainfo('Plugin is warmed up')
+
     async def close(self) -> None:
         """Close plugin for writing with releasing resources and
         flushing events.
         """
         async with self._lock:
             if self._is_opened:
+                await self._close_spool()
                 await self._close()
                 self._is_opened = False
 
         await self._logger.ainfo('Plugin is closed')
 
+    async def _open_spool(self) -> None:
+        """Open spool and start replaying it if spool is configured.
+
+        Raises
+        ------
+        PluginRuntimeError
+            If spool cannot be opened
+        """
+        config = self.spool_config
+        if config is None:
+            return
+
+        self._spool_event = asyncio.Event()
+
+        try:
+            self._spool = await self._loop.run_in_executor(
+                executor=None,
+                func=lambda: SegmentSpool(
+                    path=config.path,
+                    segment_size=config.segment_size,
+                    max_size=config.max_size
+                )
+            )
+        except OSError as e:
+            raise PluginRuntimeError(
+                'Failed to open spool',
+                context=dict(
+                    self.instance_info,
+                    reason=str(e),
+                    file_path=config.path
+                )
+            ) from e
+
+        if self._spool.batches > 0:
+            await self._logger.ainfo(
+                'Spooled batches are recovered',
+                count=self._spool.batches
+            )
+            self._spool_event.set()
+
+        self._replaying_task = self._loop.create_task(
+            self._replay_spool(config)
+        )
+
+    async def _stop_replaying(self) -> None:
+        """Stop replaying spool, batches that are being written remain
+        in spool.
+        """
+        if self._replaying_task is not None:
+            self._replaying_task.cancel()
+            try:
+                await self._replaying_task
+            except asyncio.CancelledError:
+                pass
+            self._replaying_task = None
+
+    async def _close_spool(self) -> None:
+        """Close spool, batches that are not replayed remain on disk."""
+        await self._stop_replaying()
+
+        if self._spool is not None:
+            if self._spool.batches > 0:
+                await self._logger.awarning(
+                    'Spool is not drained, batches remain on disk',
+                    count=self._spool.batches
+                )
+            self._spool.close()
+            self._spool = None
+
+    async def _spool_events(self, events: Sequence[str]) -> None:
+        """Append events to spool.
+
+        Parameters
+        ----------
+        events : Sequence[str]
+            Formatted events
+        """
+        assert self._spool is not None
+
+        try:
+            evicted = self._spool.append(events)
+        except (ValueError, OSError) as e:
+            await self._logger.aerror(
+                'Failed to spool events, events are lost',
+                reason=str(e),
+                count=len(events)
+            )
+            return
+
+        if evicted > 0:
+            await self._logger.awarning(
+                'The oldest spooled batches are evicted due to size limit',
+                count=evicted
+            )
+
+        self._spool_event.set()
+
+    async def _dead_letter(self, events: Sequence[str], reason: str) -> None:
+        """Append events that cannot be written to dead letter file or
+        drop them if dead letter file is not configured.
+
+        Parameters
+        ----------
+        events : Sequence[str]
+            Formatted events
+
+        reason : str
+            Reason why events cannot be written
+        """
+        config = self.spool_config
+        assert config is not None
+
+        path = config.dead_letter_path
+        if path is None:
+            await self._logger.aerror(
+                'Events cannot be written, events are dropped',
+                reason=reason,
+                count=len(events)
+            )
+            return
+
+        try:
+            await self._loop.run_in_executor(
+                executor=None,
+                func=lambda: append_dead_letters(path, events)
+            )
+        except OSError as e:
+            await self._logger.aerror(
+                'Failed to write events to dead letter file, '
+                'events are lost',
+                reason=str(e),
+                count=len(events),
+                file_path=path
+            )
+            return
+
+        await self._logger.aerror(
+            'Events cannot be written, events are moved to dead letter file',
+            reason=reason,
+            count=len(events),
+            file_path=path
+        )
+
+    async def _write_or_spool(self, events: Sequence[str]) -> int:
+        """Write events or append them to spool if writing fails or
+        spool is not drained yet. Events rejected by target are not
+        spooled and moved to dead letter file.
+
+        Parameters
+        ----------
+        events : Sequence[str]
+            Formatted events
+
+        Returns
+        -------
+        int
+            Number of successfully written events, spooled events are
+            not counted
+        """
+        assert self._spool is not None
+
+        # Keep order of batches while spooled ones are replayed
+        if self._spool.batches > 0:
+            await self._spool_events(events)
+            return 0
+
+        try:
+            return await self._write(events)
+        except PartialWriteError as e:
+            if e.rejected_events:
+                await self._dead_letter(e.rejected_events, reason=str(e))
+
+            if e.failed_events:
+                await self._logger.awarning(
+                    'Failed to write some of events, they are spooled',
+                    reason=str(e),
+                    count=len(e.failed_events)
+                )
+                await self._spool_events(e.failed_events)
+
+            return e.written
+        except PermanentWriteError as e:
+            await self._dead_letter(events, reason=str(e))
+            return 0
+        except PluginRuntimeError as e:
+            await self._logger.awarning(
+                'Failed to write events, events are spooled',
+                reason=str(e),
+                count=len(events)
+            )
+            await self._spool_events(events)
+            return 0
+
+    async def _replay_spool(self, config: SpoolConfig) -> None:
+        """Continuously replay spooled batches.
+
+        Parameters
+        ----------
+        config : SpoolConfig
+            Spool configuration
+
+        Notes
+        -----
+        Batches are removed from spool only after they are written, so
+        failed batches stay at the head of spool and batches that are
+        being written during cancellation or crash are replayed again.
+        New batches are spooled behind the replayed ones until spool is
+        drained. Replaying doesn't hold the lock while batches are
+        written, since spool is accessed only by synchronous calls
+        between awaits, so writing new batches to spool is not delayed
+        by replaying to unavailable target. Failed rounds are retried
+        with exponential backoff. Batches that are rejected by target
+        or exceed maximum number of attempts are moved to dead letter
+        file, so they do not block the rest ones. Numbers of attempts
+        are not persisted between restarts.
+        """
+        assert self._spool is not None
+
+        failed_rounds = 0
+
+        # Events of partially written batches that are left to write
+        remaining: dict[SpooledBatch, Sequence[str]] = dict()
+
+        # Numbers of failed attempts of batches at the head of spool
+        attempts: dict[SpooledBatch, int] = dict()
+
+        while True:
+            await self._spool_event.wait()
+
+            batches = self._spool.peek(config.replay_concurrency)
+
+            if not batches:
+                self._spool_event.clear()
+                continue
+
+            results = await asyncio.gather(
+                *[
+                    self._write(remaining.get(batch, batch.events))
+                    for batch in batches
+                ],
+                return_exceptions=True
+            )
+
+            remaining = {
+                batch: events
+                for batch, events in remaining.items()
+                if batch in batches
+            }
+            attempts = {
+                batch: count
+                for batch, count in attempts.items()
+                if batch in batches
+            }
+            replayed = 0
+            errors: list[BaseException] = []
+            for batch, result in zip(batches, results):
+                if isinstance(result, PartialWriteError):
+                    if result.rejected_events:
+                        await self._dead_letter(
+                            result.rejected_events,
+                            reason=str(result)
+                        )
+
+                    if not result.failed_events:
+                        remaining.pop(batch, None)
+                        self._spool.ack(batch)
+                        continue
+
+                    remaining[batch] = result.failed_events
+                elif isinstance(result, PermanentWriteError):
+                    await self._dead_letter(
+                        remaining.pop(batch, batch.events),
+                        reason=str(result)
+                    )
+                    self._spool.ack(batch)
+                    continue
+                elif not isinstance(result, BaseException):
+                    remaining.pop(batch, None)
+                    self._spool.ack(batch)
+                    replayed += 1
+                    continue
+
+                attempts[batch] = attempts.get(batch, 0) + 1
+                if (
+                    config.max_attempts is not None
+                    and attempts[batch] >= config.max_attempts
+                ):
+                    await self._dead_letter(
+                        remaining.pop(batch, batch.events),
+                        reason=(
+                            'Maximum number of attempts is reached, '
+                            f'last error: {result}'
+                        )
+                    )
+                    attempts.pop(batch)
+                    self._spool.ack(batch)
+                    continue
+
+                errors.append(result)
+
+            if not errors:
+                failed_rounds = 0
+                await self._logger.adebug(
+                    'Spooled batches are replayed',
+                    count=replayed
+                )
+                continue
+
+            delay = min(
+                config.replay_interval * 2 ** failed_rounds,
+                config.replay_max_interval
+            )
+            failed_rounds += 1
+
+            await self._logger.awarning(
+                'Failed to replay spooled batches',
+                reason=str(errors[0]),
+                count=len(errors),
+                retry_after=delay
+            )
+            await asyncio.sleep(delay)
+
     async def _format_events(self, events: Sequence[str]) -> FormattingResult:
         """Format events.
 
@@ -154,7 +501,8 @@ class OutputPlugin(Plugin[ConfigT, ParamsT], register=False):
 
         Notes
         -----
-        All errors from formatting result are logged
+        Errors from formatting result are logged as single message with
+        number of errors and details of the first one
         """
 
         formatting_result = await self._loop.run_in_executor(
@@ -163,25 +511,19 @@ class OutputPlugin(Plugin[ConfigT, ParamsT], register=False):
         )
 
         if formatting_result.errors:
-            contexts: list[dict] = []
-
-            for error in formatting_result.errors:
-                context = {
-                    'format': self._formatter_config.format,
-                    'reason': str(error)
-                }
-
-                if error.original_event is not None:
-                    context['original_event'] = error.original_event
+            # Errors are aggregated to a single message per batch to
+            # not flood the log with per event messages
+            first_error = formatting_result.errors[0]
+            context = {
+                'format': self._formatter_config.format,
+                'count': len(formatting_result.errors),
+                'reason': str(first_error)
+            }
 
-                contexts.append(context)
+            if first_error.original_event is not None:
+                context['original_event'] = first_error.original_event
 
-            await asyncio.gather(
-                *[
-                    self._logger.aerror('Failed to format event', **context)
-                    for context in contexts
-                ]
-            )
+            await self._logger.aerror('Failed to format events', **context)
 
         return formatting_result
 
@@ -222,7 +564,13 @@ class OutputPlugin(Plugin[ConfigT, ParamsT], register=False):
             if not formatting_result.events:
                 return 0
 
-            return await self._write(formatting_result.events)
+            if self._spool is not None:
+                return await self._write_or_spool(formatting_result.events)
+
+            try:
+                return await self._write(formatting_result.events)
+            except PartialWriteError as e:
+                return e.written
 
     @abstractmethod
     async def _open(self) -> None:
@@ -240,6 +588,17 @@ class OutputPlugin(Plugin[ConfigT, ParamsT], register=False):
         """Perform actions for plugin closing."""
         ...
 
+    async def _warm_up(self) -> None:
+        """Perform actions for plugin warming up. Nothing is done by
+        default.
+
+        Notes
+        -----
+        Failures of warming up must be logged and not raised since
+        they are expected to be handled by writing
+        """
+        pass
+
     @abstractmethod
     async def _write(self, events: Sequence[str]) -> int:
         """Perform writing of formatted events.
@@ -256,7 +615,27 @@ class OutputPlugin(Plugin[ConfigT, ParamsT], register=False):
 
         Raises
         ------
+        PartialWriteError
+            If some of events failed to be written, failures are
+            expected to be logged by plugin
+
         PluginRuntimeError
             If error occurs during writing events
         """
         ...
+
+    @property
+    def routing(self) -> RoutingConfig | None:
+        """Routing config of output."""
+        if isinstance(self._config, RootModel):
+            return self._config.root.routing
+
+        return self._config.routing
+
+    @property
+    def spool_config(self) -> SpoolConfig | None:
+        """Spool config of output."""
+        if isinstance(self._config, RootModel):
+            return self._config.root.spool
+
+        return self._config.spool
@@ -1,3 +1,8 @@
+from typing import Any, Sequence
+
+from eventum.plugins.exceptions import PluginRuntimeError
+
+
 class FormatError(Exception):
     """Exception for formatting errors.
 
@@ -14,3 +19,40 @@ class FormatError(Exception):
     ) -> None:
         super().__init__(*args)
         self.original_event = original_event
+
+
+class PermanentWriteError(PluginRuntimeError):
+    """Events are rejected by target (e.g. due to invalid content), so
+    writing them again is pointless.
+    """
+
+
+class PartialWriteError(PluginRuntimeError):
+    """Some of events failed to be written.
+
+    Parameters
+    ----------
+    failed_events : Sequence[str]
+        Events that failed to be written and can be written again
+        later (e.g. after connection errors)
+
+    written : int
+        Number of successfully written events
+
+    rejected_events : Sequence[str], default=()
+        Events that are rejected by target and must not be written
+        again (see `PermanentWriteError`)
+    """
+
+    def __init__(
+        self,
+        *args: Any,
+        context: dict[str, Any],
+        failed_events: Sequence[str],
+        written: int,
+        rejected_events: Sequence[str] = ()
+    ) -> None:
+        super().__init__(*args, context=context)
+        self.failed_events = failed_events
+        self.written = written
+        self.rejected_events = rejected_events
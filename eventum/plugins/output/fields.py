@@ -121,3 +121,144 @@ class TemplateFormatterConfig(BaseFormatterConfig, frozen=True):
 FormatterConfigT = (
     SimpleFormatterConfig | JsonFormatterConfig | TemplateFormatterConfig
 )
+
+
+class RoutingConfig(BaseModel, frozen=True, extra='forbid'):
+    """Config of events routing to output. Event is routed to output
+    if it matches all specified conditions.
+
+    Parameters
+    ----------
+    tags_any : tuple[str, ...], default=()
+        Tags of input plugin, event matches if at least one of them is
+        present, condition is not applied if no tags specified
+
+    tags_all : tuple[str, ...], default=()
+        Tags of input plugin, event matches if all of them are present,
+        condition is not applied if no tags specified
+
+    template_aliases : tuple[str, ...], default=()
+        Aliases of templates, event matches if it is rendered from one
+        of them, condition is not applied if no aliases specified
+
+    Notes
+    -----
+    At least one condition must be specified
+    """
+    tags_any: tuple[str, ...] = Field(default=tuple())
+    tags_all: tuple[str, ...] = Field(default=tuple())
+    template_aliases: tuple[str, ...] = Field(default=tuple())
+
+    @model_validator(mode='after')
+    def validate_some_condition_provided(self) -> Self:
+        if not (self.tags_any or self.tags_all or self.template_aliases):
+            raise ValueError('At least one routing condition must be provided')
+
+        return self
+
+
+class SpoolConfig(BaseModel, frozen=True, extra='forbid'):
+    """Config of durable on-disk spool for batches that failed to be
+    written.
+
+    Parameters
+    ----------
+    path : str
+        Path to directory with spool segment files, it must be unique
+        for each output
+
+    segment_size : int, default=16777216
+        Size (in bytes) of single segment file
+
+    max_size : int, default=1073741824
+        Maximum total size (in bytes) of segment files, the oldest
+        batches are evicted once it is exceeded
+
+    replay_concurrency : int, default=1
+        Maximum number of spooled batches that are written concurrently
+        during replaying
+
+    replay_interval : float, default=5
+        Time (in seconds) to wait before next replaying attempt after
+        failed one, it is doubled for every next failed attempt
+
+    replay_max_interval : float, default=60
+        Maximum time (in seconds) to wait before next replaying attempt
+
+    max_attempts : int | None, default=None
+        Maximum number of replaying attempts of single batch after
+        which batch is considered as permanently failed, not limited
+        if value is `None`
+
+    dead_letter_path : str | None, default=None
+        Path to file where events of permanently failed batches are
+        appended (each event is followed by line separator), such
+        events are dropped if value is `None`
+    """
+    path: str = Field(min_length=1)
+    segment_size: int = Field(default=16 * 1024 * 1024, ge=1024)
+    max_size: int = Field(default=1024 * 1024 * 1024, ge=1024)
+    replay_concurrency: int = Field(default=1, ge=1)
+    replay_interval: float = Field(default=5, gt=0)
+    replay_max_interval: float = Field(default=60, gt=0)
+    max_attempts: int | None = Field(default=None, ge=1)
+    dead_letter_path: str | None = Field(default=None, min_length=1)
+
+    @model_validator(mode='after')
+    def validate_sizes(self) -> Self:
+        if self.max_size < self.segment_size:
+            raise ValueError(
+                'Maximum size must be greater or equal to segment size'
+            )
+
+        return self
+
+    @model_validator(mode='after')
+    def validate_intervals(self) -> Self:
+        if self.replay_max_interval < self.replay_interval:
+            raise ValueError(
+                'Maximum replay interval must be greater or equal to '
+                'replay interval'
+            )
+
+        return self
+
+
+class RetryConfig(BaseModel, frozen=True, extra='forbid'):
+    """Config of retrying HTTP requests and circuit breaking.
+
+    Parameters
+    ----------
+    max_attempts : int, default=3
+        Maximum number of attempts of single request
+
+    initial_backoff : float, default=0.5
+        Upper bound (in seconds) of random delay before the first
+        retry, it is doubled for every next retry
+
+    max_backoff : float, default=30
+        Maximum upper bound (in seconds) of random delay before retry
+
+    retry_statuses : tuple[int, ...], default=(429, 502, 503, 504)
+        Response statuses that are considered retryable along with
+        connection errors
+
+    budget_ratio : float, default=0.2
+        Maximum ratio of retries to requests, retries exceeding the
+        budget are not performed
+
+    breaker_threshold : int, default=5
+        Number of consecutive failures of host after which circuit
+        breaker of the host opens and requests to it are rejected
+
+    breaker_cooldown : float, default=30
+        Time (in seconds) after which open circuit breaker lets trial
+        request through
+    """
+    max_attempts: int = Field(default=3, ge=1)
+    initial_backoff: float = Field(default=0.5, gt=0)
+    max_backoff: float = Field(default=30, gt=0)
+    retry_statuses: tuple[int, ...] = Field(default=(429, 502, 503, 504))
+    budget_ratio: float = Field(default=0.2, ge=0)
+    breaker_threshold: int = Field(default=5, ge=1)
+    breaker_cooldown: float = Field(default=30, gt=0)
@@ -1,7 +1,17 @@
+import asyncio
+import random
 import ssl
-from typing import Any
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Hashable, Literal, TypeAlias
 
 import aiohttp
+from yarl import URL
+
+from eventum.plugins.output.fields import RetryConfig
+from eventum.plugins.output.sharing import SharedResourcesPool
+
+BreakerState: TypeAlias = Literal['closed', 'open', 'half-open']
 
 
 def create_ssl_context(
@@ -127,3 +137,475 @@ def create_session(
             sock_read=request_timeout
         )
     )
+
+
+def is_retryable_status(status: int) -> bool:
+    """Check whether response status indicates failure that can be
+    resolved by writing again later (e.g. overloaded or unavailable
+    server), other failed statuses mean that request is rejected.
+
+    Parameters
+    ----------
+    status : int
+        Response status code
+
+    Returns
+    -------
+    bool
+        Whether status is retryable
+    """
+    return status in (408, 429) or status >= 500
+
+
+shared_sessions: SharedResourcesPool[
+    Hashable,
+    aiohttp.ClientSession
+] = SharedResourcesPool(close=lambda session: session.close())
+"""Pool of client HTTP sessions shared between output plugins that
+target the same endpoint with the same connection parameters.
+"""
+
+
+class CircuitOpenError(aiohttp.ClientError):
+    """Request is rejected due to open circuit breaker of host."""
+
+
+@dataclass(frozen=True, eq=False)
+class BreakerPermit:
+    """Permit of single request issued by circuit breaker, permits are
+    compared by identity.
+
+    Parameters
+    ----------
+    is_trial : bool
+        Whether request is the trial one of half-open breaker
+    """
+    is_trial: bool
+
+
+class CircuitBreaker:
+    """Circuit breaker of single host.
+
+    Parameters
+    ----------
+    threshold : int
+        Number of consecutive failures after which breaker opens
+
+    cooldown : float
+        Time (in seconds) after which open breaker lets single trial
+        request through
+
+    clock : Callable[[], float], default=time.monotonic
+        Function returning current time
+    """
+
+    def __init__(
+        self,
+        threshold: int,
+        cooldown: float,
+        clock: Callable[[], float] = time.monotonic
+    ) -> None:
+        self._threshold = threshold
+        self._cooldown = cooldown
+        self._clock = clock
+
+        self._failures = 0
+        self._opened_at: float | None = None
+        self._trial: BreakerPermit | None = None
+
+    @property
+    def state(self) -> BreakerState:
+        """Current state of breaker."""
+        if self._opened_at is None:
+            return 'closed'
+
+        if self._clock() - self._opened_at >= self._cooldown:
+            return 'half-open'
+
+        return 'open'
+
+    def allow(self) -> BreakerPermit | None:
+        """Check whether request is allowed, in half-open state only
+        single trial request is allowed until its result is recorded
+        or its permit is released.
+
+        Returns
+        -------
+        BreakerPermit | None
+            Permit of allowed request or `None` if request is rejected
+        """
+        match self.state:
+            case 'closed':
+                return BreakerPermit(is_trial=False)
+            case 'open':
+                return None
+            case 'half-open':
+                if self._trial is not None:
+                    return None
+
+                self._trial = BreakerPermit(is_trial=True)
+                return self._trial
+
+    def release(self, permit: BreakerPermit) -> None:
+        """Release permit without recording result of request (e.g. if
+        request is cancelled), trial slot is freed only if permit is
+        the one of current trial request.
+
+        Parameters
+        ----------
+        permit : BreakerPermit
+            Permit of request
+        """
+        if permit is self._trial:
+            self._trial = None
+
+    def record_success(self) -> None:
+        """Record successful request and close breaker, successful
+        request of any permit frees trial slot since host is available.
+        """
+        self._failures = 0
+        self._opened_at = None
+        self._trial = None
+
+    def record_failure(self, permit: BreakerPermit) -> None:
+        """Record failed request and open breaker if threshold is
+        reached or breaker is not closed.
+
+        Parameters
+        ----------
+        permit : BreakerPermit
+            Permit of request
+        """
+        self._failures += 1
+        self.release(permit)
+
+        if self._opened_at is not None or self._failures >= self._threshold:
+            self._opened_at = self._clock()
+
+
+class CircuitBreakers:
+    """Circuit breakers of hosts.
+
+    Parameters
+    ----------
+    threshold : int
+        Number of consecutive failures after which breaker of host
+        opens
+
+    cooldown : float
+        Time (in seconds) after which open breaker of host lets single
+        trial request through
+    """
+
+    def __init__(self, threshold: int, cooldown: float) -> None:
+        self._threshold = threshold
+        self._cooldown = cooldown
+        self._breakers: dict[tuple[str | None, int | None], CircuitBreaker] = (
+            dict()
+        )
+
+    def get(self, url: URL) -> CircuitBreaker:
+        """Get circuit breaker of host, breaker is created on first
+        request.
+
+        Parameters
+        ----------
+        url : URL
+            URL of request
+
+        Returns
+        -------
+        CircuitBreaker
+            Circuit breaker of host
+        """
+        key = (url.host, url.port)
+        breaker = self._breakers.get(key)
+
+        if breaker is None:
+            breaker = CircuitBreaker(
+                threshold=self._threshold,
+                cooldown=self._cooldown
+            )
+            self._breakers[key] = breaker
+
+        return breaker
+
+
+shared_breakers: SharedResourcesPool[
+    Hashable,
+    CircuitBreakers
+] = SharedResourcesPool()
+"""Pool of circuit breakers shared between output plugins that share
+client HTTP session, so state of hosts is common for all of them.
+"""
+
+
+class RetryBudget:
+    """Budget limiting ratio of retries to requests.
+
+    Parameters
+    ----------
+    ratio : float
+        Number of retries earned by single request
+
+    min_retries : int, default=10
+        Number of retries available initially, it is also minimal
+        capacity of budget
+
+    Notes
+    -----
+    Capacity of budget is `max(min_retries, 100 * ratio)` retries
+    """
+
+    def __init__(self, ratio: float, min_retries: int = 10) -> None:
+        self._ratio = ratio
+        self._capacity = max(float(min_retries), 100 * ratio)
+        self._tokens = float(min_retries)
+
+    def deposit(self) -> None:
+        """Deposit retries earned by request."""
+        self._tokens = min(self._capacity, self._tokens + self._ratio)
+
+    def withdraw(self) -> bool:
+        """Withdraw single retry.
+
+        Returns
+        -------
+        bool
+            Whether retry is available
+        """
+        if self._tokens < 1:
+            return False
+
+        self._tokens -= 1
+        return True
+
+
+@dataclass(frozen=True)
+class Response:
+    """Response of performed request.
+
+    Parameters
+    ----------
+    status : int
+        Status code
+
+    text : str
+        Body of response
+    """
+    status: int
+    text: str
+
+
+class ResilientRequester:
+    """Performer of HTTP requests with retries using exponential
+    backoff with full jitter, retry budget and per host circuit
+    breakers.
+
+    Parameters
+    ----------
+    session : aiohttp.ClientSession
+        Session to use for requests
+
+    config : RetryConfig | None
+        Retry config, each request is performed once without circuit
+        breaking if value is `None`
+
+    breakers : CircuitBreakers | None, default=None
+        Circuit breakers of hosts (e.g. shared with other requesters
+        using the same session), new ones are created according to
+        config if value is `None`
+    """
+
+    def __init__(
+        self,
+        session: aiohttp.ClientSession,
+        config: RetryConfig | None,
+        breakers: CircuitBreakers | None = None
+    ) -> None:
+        self._session = session
+        self._config = config
+
+        if breakers is None and config is not None:
+            breakers = CircuitBreakers(
+                threshold=config.breaker_threshold,
+                cooldown=config.breaker_cooldown
+            )
+
+        self._breakers = breakers if config is not None else None
+        self._budget = (
+            RetryBudget(ratio=config.budget_ratio)
+            if config is not None else None
+        )
+
+    def _get_breaker(self, url: URL) -> CircuitBreaker | None:
+        """Get circuit breaker of host.
+
+        Parameters
+        ----------
+        url : URL
+            URL of request
+
+        Returns
+        -------
+        CircuitBreaker | None
+            Circuit breaker or `None` if circuit breaking is disabled
+        """
+        if self._breakers is None:
+            return None
+
+        return self._breakers.get(url)
+
+    def is_available(self, url: URL) -> bool:
+        """Check whether circuit breaker of host is not open.
+
+        Parameters
+        ----------
+        url : URL
+            URL of host
+
+        Returns
+        -------
+        bool
+            Whether host is available for requests
+        """
+        breaker = self._get_breaker(url)
+        return breaker is None or breaker.state != 'open'
+
+    def _get_backoff(self, attempt: int) -> float:
+        """Get random delay before retry.
+
+        Parameters
+        ----------
+        attempt : int
+            Number of failed attempt
+
+        Returns
+        -------
+        float
+            Delay in seconds
+        """
+        assert self._config is not None
+
+        bound = min(
+            self._config.max_backoff,
+            self._config.initial_backoff * 2 ** (attempt - 1)
+        )
+        return random.uniform(0, bound)
+
+    async def request(
+        self,
+        method: str,
+        url: URL | str,
+        next_url: Callable[[URL], URL] | None = None,
+        **kwargs: Any
+    ) -> Response:
+        """Perform request.
+
+        Parameters
+        ----------
+        method : str
+            HTTP method
+
+        url : URL | str
+            URL of request
+
+        next_url : Callable[[URL], URL] | None, default=None
+            Callback returning URL for retry by URL of failed attempt
+            (e.g. the same path on another node of cluster), retries
+            are performed to the same URL if value is `None`
+
+        **kwargs : Any
+            Other parameters of `aiohttp.ClientSession.request`
+
+        Returns
+        -------
+        Response
+            Response of the last attempt, it can have retryable status
+            if attempts or retry budget are exhausted
+
+        Raises
+        ------
+        CircuitOpenError
+            If circuit breaker of host of attempt is open
+
+        aiohttp.ClientError
+            If the last attempt fails with connection error
+
+        asyncio.TimeoutError
+            If the last attempt is timed out
+        """
+        url = URL(url)
+
+        if self._budget is not None:
+            self._budget.deposit()
+
+        attempt = 0
+        while True:
+            attempt += 1
+            breaker = self._get_breaker(url)
+
+            permit = breaker.allow() if breaker is not None else None
+            if breaker is not None and permit is None:
+                raise CircuitOpenError(
+                    f'Circuit breaker of host "{url.host}" is open'
+                )
+
+            error: Exception | None = None
+            response: Response | None = None
+            try:
+                async with self._session.request(
+                    method, url, **kwargs
+                ) as client_response:
+                    response = Response(
+                        status=client_response.status,
+                        text=await client_response.text()
+                    )
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                error = e
+            finally:
+                # Result of attempt interrupted by other exception or
+                # cancellation is not recorded, but its permit must be
+                # released to not reject requests forever if it is the
+                # trial one
+                if (
+                    breaker is not None
+                    and permit is not None
+                    and error is None
+                    and response is None
+                ):
+                    breaker.release(permit)
+
+            if self._config is None:
+                if error is not None:
+                    raise error
+
+                assert response is not None
+                return response
+
+            if (
+                response is not None
+                and response.status not in self._config.retry_statuses
+            ):
+                if breaker is not None:
+                    breaker.record_success()
+                return response
+
+            if breaker is not None and permit is not None:
+                breaker.record_failure(permit)
+
+            assert self._budget is not None
+            if (
+                attempt >= self._config.max_attempts
+                or not self._budget.withdraw()
+            ):
+                if error is not None:
+                    raise error
+
+                assert response is not None
+                return response
+
+            if next_url is not None:
+                url = next_url(url)
+
+            await asyncio.sleep(self._get_backoff(attempt))
@@ -85,6 +85,18 @@ class ClickhouseOutputPluginConfig(OutputPluginConfig, frozen=True):
     separator : str, default='\\n'
         Separator between events for constructing request body
 
+    shared_pool : bool, default=False
+        Whether to share client and insert writer with other output
+        plugins that target the same server with the same connection
+        parameters within the process, inserts of all such plugins
+        into the same table are coalesced into fewer larger inserts
+
+    coalescing_delay : float, default=0
+        Time (in seconds) to wait for inserts of other plugins before
+        performing coalesced insert (actual only with shared pool),
+        zero value means that only inserts submitted at the same
+        moment are coalesced
+
     Notes
     -----
     To see full documentation of parameters:
@@ -115,6 +127,8 @@ class ClickhouseOutputPluginConfig(OutputPluginConfig, frozen=True):
         validate_default=True
     )
     separator: str = Field(default='\n')
+    shared_pool: bool = Field(default=False)
+    coalescing_delay: float = Field(default=0, ge=0)
     formatter: FormatterConfigT = Field(
         default_factory=lambda: JsonFormatterConfig(
             format=Format.JSON,
@@ -1,6 +1,7 @@
 import contextlib
+import inspect
 import re
-from typing import Sequence
+from typing import Hashable, Sequence
 
 from clickhouse_connect import get_async_client
 from clickhouse_connect.driver.asyncclient import AsyncClient
@@ -10,6 +11,193 @@ from eventum.plugins.exceptions import PluginRuntimeError
 from eventum.plugins.output.base.plugin import OutputPlugin, OutputPluginParams
 from eventum.plugins.output.plugins.clickhouse.config import \
     ClickhouseOutputPluginConfig
+from eventum.plugins.output.sharing import (BatchCoalescer,
+                                            SharedResourcesPool)
+
+_FMT_ERROR_ROW_PATTERN = re.compile(r'\(at row (?P<row>\d+)\)')
+
+
+async def _close_client(client: AsyncClient) -> None:
+    """Close ClickHouse client.
+
+    Parameters
+    ----------
+    client : AsyncClient
+        Client to close
+    """
+    result = client.close()
+
+    # depending on version of driver `close` can be coroutine function
+    if inspect.isawaitable(result):
+        await result
+
+
+async def _insert_events(
+    client: AsyncClient,
+    table: str,
+    events: Sequence[str],
+    separator: str,
+    input_format: str,
+    host: str
+) -> int:
+    """Insert events to ClickHouse table.
+
+    Parameters
+    ----------
+    client : AsyncClient
+        Client to use for inserting
+
+    table : str
+        Fully qualified table name
+
+    events : Sequence[str]
+        Formatted events to insert
+
+    separator : str
+        Separator between events
+
+    input_format : str
+        ClickHouse input format
+
+    host : str
+        Host of the server (used in error context)
+
+    Returns
+    -------
+    int
+        Number of written rows
+
+    Raises
+    ------
+    PluginRuntimeError
+        If inserting fails, context of exception doesn't include
+        plugin instance information
+    """
+    try:
+        response = await client.raw_insert(
+            table=table,
+            insert_block=(separator.join(events) + '\n'),
+            fmt=input_format
+        )
+    except Exception as e:
+        context = dict(reason=str(e), host=host)
+
+        # try to enrich exception with original (formatted) event
+        pos_match = re.search(_FMT_ERROR_ROW_PATTERN, str(e))
+        if pos_match is not None:
+            row = int(pos_match.group('row'))
+            with contextlib.suppress(IndexError):
+                context.update(formatted_event=events[row - 1])
+
+        raise PluginRuntimeError(
+            'Failed to insert events to ClickHouse',
+            context=context
+        ) from e
+
+    return response.written_rows
+
+
+class _SharedInsertWriter:
+    """Insert writer shared between plugins targeting the same table,
+    inserts of all plugins are coalesced into fewer larger inserts.
+
+    Parameters
+    ----------
+    client : AsyncClient
+        Client to use for inserting
+
+    table : str
+        Fully qualified table name
+
+    separator : str
+        Separator between events
+
+    input_format : str
+        ClickHouse input format
+
+    host : str
+        Host of the server
+
+    coalescing_delay : float
+        Time (in seconds) to wait for inserts of other plugins
+    """
+
+    def __init__(
+        self,
+        client: AsyncClient,
+        table: str,
+        separator: str,
+        input_format: str,
+        host: str,
+        coalescing_delay: float
+    ) -> None:
+        self._client = client
+        self._table = table
+        self._separator = separator
+        self._input_format = input_format
+        self._host = host
+        self._coalescer: BatchCoalescer[str, bool] = BatchCoalescer(
+            flush=self._flush,
+            delay=coalescing_delay
+        )
+
+    async def _flush(self, events: list[str]) -> list[bool]:
+        """Flush coalesced events.
+
+        Parameters
+        ----------
+        events : list[str]
+            Events to insert
+
+        Returns
+        -------
+        list[bool]
+            Statuses of insertion for each event
+        """
+        await _insert_events(
+            client=self._client,
+            table=self._table,
+            events=events,
+            separator=self._separator,
+            input_format=self._input_format,
+            host=self._host
+        )
+        return [True] * len(events)
+
+    async def write(self, events: Sequence[str]) -> int:
+        """Write events as part of coalesced insert.
+
+        Parameters
+        ----------
+        events : Sequence[str]
+            Events to insert
+
+        Returns
+        -------
+        int
+            Number of written events
+
+        Raises
+        ------
+        PluginRuntimeError
+            If inserting fails
+        """
+        return sum(await self._coalescer.submit(events))
+
+    async def close(self) -> None:
+        """Close writer with flushing pending events."""
+        await self._coalescer.flush()
+
+
+_shared_clients: SharedResourcesPool[
+    Hashable,
+    AsyncClient
+] = SharedResourcesPool(close=_close_client)
+
+_shared_insert_writers: SharedResourcesPool[
+    Hashable,
+    _SharedInsertWriter
+] = SharedResourcesPool(close=lambda writer: writer.close())
 
 
 class ClickhouseOutputPlugin(
@@ -28,13 +216,45 @@ class ClickhouseOutputPlugin(
             [quote(config.database), quote(config.table)]
         )
 
-        self._fmt_error_row_pattern = re.compile(r'\(at row (?P<row>\d+)\)')
-
         self._client: AsyncClient
+        self._insert_writer: _SharedInsertWriter
 
-    async def _open(self) -> None:
+    @property
+    def _client_key(self) -> Hashable:
+        """Key of client in pool of shared clients."""
+        return self._config.model_dump_json(
+            exclude={
+                'table', 'input_format', 'separator', 'formatter',
+                'shared_pool', 'coalescing_delay'
+            }
+        )
+
+    @property
+    def _insert_writer_key(self) -> Hashable:
+        """Key of insert writer in pool of shared insert writers."""
+        return (
+            self._client_key,
+            self._fq_table_name,
+            self._config.input_format,
+            self._config.separator,
+            self._config.coalescing_delay
+        )
+
+    async def _create_client(self) -> AsyncClient:
+        """Create ClickHouse client.
+
+        Returns
+        -------
+        AsyncClient
+            Created client
+
+        Raises
+        ------
+        PluginRuntimeError
+            If client cannot be initialized
+        """
         try:
-            self._client = await get_async_client(
+            client = await get_async_client(
                 host=self._config.host,
                 port=self._config.port,
                 interface=self._config.protocol,
@@ -67,34 +287,60 @@ class ClickhouseOutputPlugin(
             )
 
         await self._logger.ainfo('ClickHouse client is initialized')
+        return client
+
+    async def _create_insert_writer(self) -> _SharedInsertWriter:
+        """Create shared insert writer.
+
+        Returns
+        -------
+        _SharedInsertWriter
+            Created insert writer
+        """
+        return _SharedInsertWriter(
+            client=self._client,
+            table=self._fq_table_name,
+            separator=self._config.separator,
+            input_format=self._config.input_format,
+            host=self._config.host,
+            coalescing_delay=self._config.coalescing_delay
+        )
+
+    async def _open(self) -> None:
+        if self._config.shared_pool:
+            self._client = await _shared_clients.acquire(
+                key=self._client_key,
+                create=self._create_client
+            )
+            self._insert_writer = await _shared_insert_writers.acquire(
+                key=self._insert_writer_key,
+                create=self._create_insert_writer
+            )
+        else:
+            self._client = await self._create_client()
 
     async def _close(self) -> None:
-        self._client.close
+        if self._config.shared_pool:
+            await _shared_insert_writers.release(self._insert_writer_key)
+            await _shared_clients.release(self._client_key)
+        else:
+            await _close_client(self._client)
 
     async def _write(self, events: Sequence[str]) -> int:
         try:
-            response = await self._client.raw_insert(
+            if self._config.shared_pool:
+                return await self._insert_writer.write(events)
+
+            return await _insert_events(
+                client=self._client,
                 table=self._fq_table_name,
-                insert_block=(self._config.separator.join(events) + '\n'),
-                fmt=self._config.input_format
-            )
-        except Exception as e:
-            context = dict(
-                self.instance_info,
-                reason=str(e),
+                events=events,
+                separator=self._config.separator,
+                input_format=self._config.input_format,
                 host=self._config.host
             )
-
-            # try to enrich exception with original (formatted) event
-            pos_match = re.search(self._fmt_error_row_pattern, str(e))
-            if pos_match is not None:
-                row = int(pos_match.group('row'))
-                with contextlib.suppress(IndexError):
-                    context.update(formatted_event=events[row - 1])
-
+        except PluginRuntimeError as e:
             raise PluginRuntimeError(
-                'Failed to insert events to ClickHouse',
-                context=context
+                str(e),
+                context=dict(self.instance_info, **e.context)
             ) from e
-
-        return response.written_rows
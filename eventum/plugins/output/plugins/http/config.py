@@ -5,7 +5,7 @@ from pydantic import Field, HttpUrl, field_validator, model_validator
 
 from eventum.plugins.output.base.config import OutputPluginConfig
 from eventum.plugins.output.fields import (Format, FormatterConfigT,
-                                           JsonFormatterConfig)
+                                           JsonFormatterConfig, RetryConfig)
 
 
 class HttpOutputPluginConfig(OutputPluginConfig, frozen=True):
@@ -50,6 +50,14 @@ class HttpOutputPluginConfig(OutputPluginConfig, frozen=True):
     proxy_url : HttpUrl
         HTTP(S) proxy address
 
+    shared_pool : bool, default=False
+        Whether to share connection pool with other output plugins
+        that use the same connection parameters within the process
+
+    retry : RetryConfig | None, default=None
+        Retry and circuit breaking parameters, each request is
+        performed once if value is `None`
+
     Notes
     -----
     By default one line JSON batch formatter is used for events
@@ -69,6 +77,8 @@ class HttpOutputPluginConfig(OutputPluginConfig, frozen=True):
     client_cert: str | None = Field(default=None, min_length=1)
     client_cert_key: str | None = Field(default=None, min_length=1)
     proxy_url: HttpUrl | None = Field(default=None)
+    shared_pool: bool = Field(default=False)
+    retry: RetryConfig | None = Field(default=None)
     formatter: FormatterConfigT = Field(
         default_factory=lambda: JsonFormatterConfig(
             format=Format.JSON_BATCH,
@@ -1,13 +1,20 @@
 import asyncio
-from typing import Sequence
+from typing import Hashable, Sequence
 
 import aiohttp
 
 from eventum.plugins.exceptions import (PluginConfigurationError,
                                         PluginRuntimeError)
 from eventum.plugins.output.base.plugin import OutputPlugin, OutputPluginParams
-from eventum.plugins.output.http_session import (create_session,
-                                                 create_ssl_context)
+from eventum.plugins.output.exceptions import (PartialWriteError,
+                                               PermanentWriteError)
+from eventum.plugins.output.http_session import (CircuitBreakers,
+                                                 ResilientRequester,
+                                                 create_session,
+                                                 create_ssl_context,
+                                                 is_retryable_status,
+                                                 shared_breakers,
+                                                 shared_sessions)
 from eventum.plugins.output.plugins.http.config import HttpOutputPluginConfig
 
 
@@ -37,9 +44,59 @@ class HttpOutputPlugin(
             )
 
         self._session: aiohttp.ClientSession
+        self._breakers: CircuitBreakers | None = None
+        self._requester: ResilientRequester
 
-    async def _open(self) -> None:
-        self._session = create_session(
+    @property
+    def _session_key(self) -> Hashable:
+        """Key of session in pool of shared sessions."""
+        return (
+            self.plugin_name,
+            self._config.verify,
+            self._config.ca_cert,
+            self._config.client_cert,
+            self._config.client_cert_key,
+            self._config.username,
+            self._config.password,
+            tuple(
+                sorted(
+                    (key, str(value))
+                    for key, value in self._config.headers.items()
+                )
+            ),
+            self._config.connect_timeout,
+            self._config.request_timeout
+        )
+
+    @property
+    def _breakers_key(self) -> Hashable:
+        """Key of circuit breakers in pool of shared breakers."""
+        return (self._session_key, self._config.retry)
+
+    async def _create_breakers(self) -> CircuitBreakers:
+        """Create circuit breakers of hosts.
+
+        Returns
+        -------
+        CircuitBreakers
+            Created circuit breakers
+        """
+        assert self._config.retry is not None
+
+        return CircuitBreakers(
+            threshold=self._config.retry.breaker_threshold,
+            cooldown=self._config.retry.breaker_cooldown
+        )
+
+    async def _create_session(self) -> aiohttp.ClientSession:
+        """Create client session.
+
+        Returns
+        -------
+        aiohttp.ClientSession
+            Created session
+        """
+        return create_session(
             ssl_context=self._ssl_context,
             username=self._config.username,
             password=self._config.password,
@@ -48,8 +105,36 @@ class HttpOutputPlugin(
             request_timeout=self._config.request_timeout
         )
 
+    async def _open(self) -> None:
+        if self._config.shared_pool:
+            self._session = await shared_sessions.acquire(
+                key=self._session_key,
+                create=self._create_session
+            )
+
+            if self._config.retry is not None:
+                self._breakers = await shared_breakers.acquire(
+                    key=self._breakers_key,
+                    create=self._create_breakers
+                )
+        else:
+            self._session = await self._create_session()
+
+        self._requester = ResilientRequester(
+            session=self._session,
+            config=self._config.retry,
+            breakers=self._breakers
+        )
+
     async def _close(self) -> None:
-        await self._session.close()
+        if self._config.shared_pool:
+            if self._breakers is not None:
+                await shared_breakers.release(self._breakers_key)
+                self._breakers = None
+
+            await shared_sessions.release(self._session_key)
+        else:
+            await self._session.close()
 
     async def _perform_request(self, data: str) -> None:
         """Perform request with provided data.
@@ -61,12 +146,16 @@ class HttpOutputPlugin(
 
         Raises
         ------
+        PermanentWriteError
+            If response status code differs from expected one and it
+            is not retryable (e.g. 400)
+
         PluginRuntimeError
             If request failed or response status code differs from
-            expected one
+            expected one and it is retryable (e.g. 503)
         """
         try:
-            response = await self._session.request(
+            response = await self._requester.request(
                 method=self._config.method,
                 url=str(self._config.url),
                 data=data,
@@ -75,7 +164,7 @@ class HttpOutputPlugin(
                     if self._config.proxy_url else None
                 )
             )
-        except aiohttp.ClientError as e:
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
             raise PluginRuntimeError(
                 'Request failed',
                 context=dict(
@@ -86,7 +175,12 @@ class HttpOutputPlugin(
             ) from e
 
         if response.status != self._config.success_code:
-            raise PluginRuntimeError(
+            error_cls = (
+                PluginRuntimeError
+                if is_retryable_status(response.status)
+                else PermanentWriteError
+            )
+            raise error_cls(
                 'Server returned not expected status code',
                 context=dict(
                     self.instance_info,
@@ -106,31 +200,58 @@ class HttpOutputPlugin(
 
         errors: list[PluginRuntimeError] = []
         unexpected_errors: list[Exception] = []
+        failed_events: list[str] = []
+        rejected_events: list[str] = []
 
-        for result in results:
-            if isinstance(result, PluginRuntimeError):
+        for event, result in zip(events, results):
+            if isinstance(result, PermanentWriteError):
+                errors.append(result)
+                rejected_events.append(event)
+            elif isinstance(result, PluginRuntimeError):
                 errors.append(result)
+                failed_events.append(event)
             elif isinstance(result, Exception):
+                # Outcome of request is unknown, so event is considered
+                # as failed to not lose it
                 unexpected_errors.append(result)
+                failed_events.append(event)
 
         if errors:
-            await asyncio.gather(
-                *[
-                    self._logger.aerror(str(error), **error.context)
-                    for error in errors
-                ]
-            )
+            # Similar errors are aggregated to a single message with
+            # context of the first one to not flood the log
+            grouped_errors: dict[str, list[PluginRuntimeError]] = dict()
+            for error in errors:
+                grouped_errors.setdefault(str(error), []).append(error)
+
+            for message, group in grouped_errors.items():
+                await self._logger.aerror(
+                    message,
+                    **dict(group[0].context, count=len(group))
+                )
 
         if unexpected_errors:
-            raise PluginRuntimeError(
+            await self._logger.aerror(
                 'Error during performing request',
+                reason=(
+                    f'First 3/{len(unexpected_errors)} errors are shown: '
+                    f'{unexpected_errors[:3]}'
+                ),
+                count=len(unexpected_errors)
+            )
+
+        if failed_events or rejected_events:
+            raise PartialWriteError(
+                'Some of requests failed',
                 context=dict(
                     self.instance_info,
-                    reason=(
-                        f'First 3/{len(unexpected_errors)} errors are shown: '
-                        f'{unexpected_errors[:3]}'
-                    )
-                )
+                    reason=str(errors[0] if errors else unexpected_errors[0]),
+                    count=len(failed_events) + len(rejected_events)
+                ),
+                failed_events=failed_events,
+                written=(
+                    len(events) - len(failed_events) - len(rejected_events)
+                ),
+                rejected_events=rejected_events
             )
 
-        return len(events) - len(errors)
+        return len(events)
@@ -1,10 +1,15 @@
+import asyncio
+import os
 import re
 
 import pytest
-from aioresponses import aioresponses
+import aiohttp
+from aioresponses import CallbackResult, aioresponses
 from pydantic import HttpUrl
+from yarl import URL
 
-from eventum.plugins.output.fields import Format, JsonFormatterConfig
+from eventum.plugins.output.fields import (Format, JsonFormatterConfig,
+                                           RetryConfig, SpoolConfig)
 from eventum.plugins.output.plugins.http.config import HttpOutputPluginConfig
 from eventum.plugins.output.plugins.http.plugin import HttpOutputPlugin
 
@@ -73,3 +78,171 @@ async def test_plugin_wrong_code():
             '{"@timestamp": "2024-01-01T00:00:00.000Z", "value": 1}'
         )
         assert written == 0
+
+
+@pytest.mark.asyncio
+async def test_plugin_spools_failed_events(tmp_path):
+    config = HttpOutputPluginConfig(
+        url=HttpUrl('http://localhost:8000/endpoint'),   # type: ignore
+        headers={'Content-Type': 'application/json'},
+        formatter=JsonFormatterConfig(format=Format.JSON, indent=0),
+        spool=SpoolConfig(path=str(tmp_path), replay_interval=0.05)
+    )
+    plugin = HttpOutputPlugin(config=config, params={'id': 1})
+
+    await plugin.open()
+
+    received: list[str] = []
+    is_down = True
+
+    def callback(url, **kwargs):
+        if is_down and kwargs['data'] == '{"value": 2}':
+            return CallbackResult(status=500)
+
+        received.append(kwargs['data'])
+        return CallbackResult(status=201)
+
+    with aioresponses() as m:
+        m.post(
+            url=re.compile(r'http://localhost:8000/.*'),
+            callback=callback,
+            repeat=True
+        )
+        written = await plugin.write(
+            events=['{"value": 1}', '{"value": 2}', '{"value": 3}']
+        )
+        assert written == 2
+
+        is_down = False
+        for _ in range(100):
+            if len(received) == 3:
+                break
+            await asyncio.sleep(0.01)
+
+        await plugin.close()
+
+    assert sorted(received) == [
+        '{"value": 1}', '{"value": 2}', '{"value": 3}'
+    ]
+
+
+@pytest.mark.asyncio
+async def test_plugin_dead_letters_rejected_events(tmp_path):
+    dead_letter_path = tmp_path / 'dead_letters.txt'
+    config = HttpOutputPluginConfig(
+        url=HttpUrl('http://localhost:8000/endpoint'),   # type: ignore
+        headers={'Content-Type': 'application/json'},
+        formatter=JsonFormatterConfig(format=Format.JSON, indent=0),
+        spool=SpoolConfig(
+            path=str(tmp_path / 'spool'),
+            replay_interval=0.05,
+            dead_letter_path=str(dead_letter_path)
+        )
+    )
+    plugin = HttpOutputPlugin(config=config, params={'id': 1})
+
+    await plugin.open()
+
+    received: list[str] = []
+
+    def callback(url, **kwargs):
+        if kwargs['data'] == '{"value": 2}':
+            return CallbackResult(status=400)
+
+        received.append(kwargs['data'])
+        return CallbackResult(status=201)
+
+    with aioresponses() as m:
+        m.post(
+            url=re.compile(r'http://localhost:8000/.*'),
+            callback=callback,
+            repeat=True
+        )
+        written = await plugin.write(
+            events=['{"value": 1}', '{"value": 2}', '{"value": 3}']
+        )
+        assert written == 2
+
+        # Rejected event is not spooled, so next events are written
+        # immediately
+        assert await plugin.write(events=['{"value": 4}']) == 1
+
+        await plugin.close()
+
+    assert received == ['{"value": 1}', '{"value": 3}', '{"value": 4}']
+    assert dead_letter_path.read_text() == '{"value": 2}' + os.linesep
+
+
+@pytest.mark.asyncio
+async def test_plugin_spools_events_of_unexpected_errors(tmp_path):
+    config = HttpOutputPluginConfig(
+        url=HttpUrl('http://localhost:8000/endpoint'),   # type: ignore
+        headers={'Content-Type': 'application/json'},
+        formatter=JsonFormatterConfig(format=Format.JSON, indent=0),
+        spool=SpoolConfig(path=str(tmp_path), replay_interval=0.05)
+    )
+    plugin = HttpOutputPlugin(config=config, params={'id': 1})
+
+    await plugin.open()
+
+    received: list[str] = []
+    is_broken = True
+
+    def callback(url, **kwargs):
+        if is_broken and kwargs['data'] == '{"value": 2}':
+            raise RuntimeError('Unexpected error')
+
+        received.append(kwargs['data'])
+        return CallbackResult(status=201)
+
+    with aioresponses() as m:
+        m.post(
+            url=re.compile(r'http://localhost:8000/.*'),
+            callback=callback,
+            repeat=True
+        )
+        written = await plugin.write(
+            events=['{"value": 1}', '{"value": 2}', '{"value": 3}']
+        )
+        assert written == 2
+
+        is_broken = False
+        for _ in range(100):
+            if len(received) == 3:
+                break
+            await asyncio.sleep(0.01)
+
+        await plugin.close()
+
+    # Only the failed event is replayed, written ones are not duplicated
+    assert received == ['{"value": 1}', '{"value": 3}', '{"value": 2}']
+
+
+@pytest.mark.asyncio
+async def test_plugins_share_breakers():
+    config = HttpOutputPluginConfig(
+        url=HttpUrl('http://localhost:8000/endpoint'),   # type: ignore
+        formatter=JsonFormatterConfig(format=Format.JSON, indent=0),
+        shared_pool=True,
+        retry=RetryConfig(max_attempts=1, breaker_threshold=1)
+    )
+    first = HttpOutputPlugin(config=config, params={'id': 1})
+    second = HttpOutputPlugin(config=config, params={'id': 2})
+
+    await first.open()
+    await second.open()
+
+    with aioresponses() as m:
+        m.post(
+            url=re.compile(r'http://localhost:8000/.*'),
+            exception=aiohttp.ClientConnectionError(),
+            repeat=True
+        )
+        assert await first.write(events=['{"value": 1}']) == 0
+
+    # Host is unavailable for the second plugin sharing the session
+    url = URL('http://localhost:8000/endpoint')
+    assert not second._requester.is_available(url)
+
+    await first.close()
+    await second.close()
@@ -0,0 +1,20 @@
+from pydantic import Field
+
+from eventum.plugins.output.base.config import OutputPluginConfig
+from eventum.plugins.output.fields import Encoding
+
+
+class NullOutputPluginConfig(OutputPluginConfig, frozen=True):
+    """Configuration for `null` output plugin.
+
+    Attributes
+    ----------
+    formatting : bool, default=False
+        Whether to format events using configured formatter, if value
+        is `False` then events are counted as is without any formatting
+
+    encoding : Encoding, default='utf_8'
+        Encoding used to count bytes of events
+    """
+    formatting: bool = Field(default=False)
+    encoding: Encoding = Field(default='utf_8')
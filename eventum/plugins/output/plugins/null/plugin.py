@@ -0,0 +1,64 @@
+from typing import Sequence
+
+from eventum.plugins.output.base.plugin import OutputPlugin, OutputPluginParams
+from eventum.plugins.output.formatters import FormattingResult
+from eventum.plugins.output.plugins.null.config import NullOutputPluginConfig
+
+
+class NullOutputPlugin(
+    OutputPlugin[NullOutputPluginConfig, OutputPluginParams]
+):
+    """Output plugin that discards events and only counts them, used
+    for measuring throughput of other stages of pipeline.
+    """
+
+    def __init__(
+        self,
+        config: NullOutputPluginConfig,
+        params: OutputPluginParams
+    ) -> None:
+        super().__init__(config, params)
+
+        self._written_count = 0
+        self._written_bytes = 0
+
+    async def _format_events(self, events: Sequence[str]) -> FormattingResult:
+        if self._config.formatting:
+            return await super()._format_events(events)
+
+        return FormattingResult(
+            events=list(events),
+            formatted_count=len(events),
+            errors=[]
+        )
+
+    async def _open(self) -> None:
+        self._written_count = 0
+        self._written_bytes = 0
+
+    async def _close(self) -> None:
+        await self._logger.ainfo(
+            'Events are discarded',
+            count=self._written_count,
+            bytes=self._written_bytes
+        )
+
+    async def _write(self, events: Sequence[str]) -> int:
+        encoding = self._config.encoding
+
+        self._written_count += len(events)
+        self._written_bytes += sum(
+            len(event.encode(encoding, errors='replace')) for event in events
+        )
+
+        return len(events)
+
+    @property
+    def written_count(self) -> int:
+        """Number of written events since plugin is opened."""
+        return self._written_count
+
+    @property
+    def written_bytes(self) -> int:
+        """Number of bytes of written events since plugin is opened."""
+        return self._written_bytes
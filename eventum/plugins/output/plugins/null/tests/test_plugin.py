@@ -0,0 +1,44 @@
+import pytest
+
+from eventum.plugins.output.fields import Format, JsonFormatterConfig
+from eventum.plugins.output.plugins.null.config import NullOutputPluginConfig
+from eventum.plugins.output.plugins.null.plugin import NullOutputPlugin
+
+pytest_plugins = ('pytest_asyncio',)
+
+
+@pytest.mark.asyncio
+async def test_null_write():
+    plugin = NullOutputPlugin(
+        config=NullOutputPluginConfig(),
+        params={'id': 1}
+    )
+    await plugin.open()
+
+    written = await plugin.write(['first', 'second', 'ünïcode'])
+
+    assert written == 3
+    assert plugin.written_count == 3
+    assert plugin.written_bytes == 5 + 6 + 9
+
+    await plugin.close()
+
+
+@pytest.mark.asyncio
+async def test_null_write_with_formatting():
+    plugin = NullOutputPlugin(
+        config=NullOutputPluginConfig(
+            formatting=True,
+            formatter=JsonFormatterConfig(format=Format.JSON)
+        ),
+        params={'id': 1}
+    )
+    await plugin.open()
+
+    written = await plugin.write(['{"a": 1}', 'not json'])
+
+    assert written == 1
+    assert plugin.written_count == 1
+    assert plugin.written_bytes == len('{"a": 1}')
+
+    await plugin.close()
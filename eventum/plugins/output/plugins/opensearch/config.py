@@ -4,7 +4,7 @@ from pydantic import Field, HttpUrl, field_validator, model_validator
 
 from eventum.plugins.output.base.config import OutputPluginConfig
 from eventum.plugins.output.fields import (Format, FormatterConfigT,
-                                           JsonFormatterConfig)
+                                           JsonFormatterConfig, RetryConfig)
 
 
 class OpensearchOutputPluginConfig(OutputPluginConfig, frozen=True):
@@ -49,6 +49,23 @@ class OpensearchOutputPluginConfig(OutputPluginConfig, frozen=True):
     proxy_url : HttpUrl
         HTTP(S) proxy address
 
+    shared_pool : bool, default=False
+        Whether to share connection pool and bulk writer with other
+        output plugins that target the same cluster with the same
+        connection parameters within the process, bulks of all such
+        plugins are coalesced into fewer larger bulk requests
+
+    coalescing_delay : float, default=0
+        Time (in seconds) to wait for bulks of other plugins before
+        performing coalesced bulk request (actual only with shared
+        pool), zero value means that only bulks submitted at the same
+        moment are coalesced
+
+    retry : RetryConfig | None, default=None
+        Retry and circuit breaking parameters, each request is
+        performed once if value is `None`, hosts with open circuit
+        breaker are skipped during load balancing
+
     Notes
     -----
     By default one line JSON formatter is used for events
@@ -64,6 +81,9 @@ class OpensearchOutputPluginConfig(OutputPluginConfig, frozen=True):
     client_cert: str | None = Field(default=None, min_length=1)
     client_cert_key: str | None = Field(default=None, min_length=1)
     proxy_url: HttpUrl | None = Field(default=None)
+    shared_pool: bool = Field(default=False)
+    coalescing_delay: float = Field(default=0, ge=0)
+    retry: RetryConfig | None = Field(default=None)
     formatter: FormatterConfigT = Field(
         default_factory=lambda: JsonFormatterConfig(
             format=Format.JSON,
@@ -1,6 +1,7 @@
+import asyncio
 import itertools
 import json
-from typing import Iterable, Iterator, Sequence
+from typing import Callable, Hashable, Iterable, Iterator, Sequence
 
 import aiohttp
 from yarl import URL
@@ -8,10 +9,316 @@ from yarl import URL
 from eventum.plugins.exceptions import (PluginConfigurationError,
                                         PluginRuntimeError)
 from eventum.plugins.output.base.plugin import OutputPlugin, OutputPluginParams
-from eventum.plugins.output.http_session import (create_session,
-                                                 create_ssl_context)
+from eventum.plugins.output.exceptions import PermanentWriteError
+from eventum.plugins.output.http_session import (CircuitBreakers,
+                                                 ResilientRequester,
+                                                 create_session,
+                                                 create_ssl_context,
+                                                 is_retryable_status,
+                                                 shared_breakers,
+                                                 shared_sessions)
 from eventum.plugins.output.plugins.opensearch.config import \
     OpensearchOutputPluginConfig
+from eventum.plugins.output.sharing import (BatchCoalescer,
+                                            SharedResourcesPool)
+
+
+def _get_bulk_response_item_errors(bulk_response: dict) -> list[str | None]:
+    """Get errors of each item in bulk response.
+
+    Parameters
+    ----------
+    bulk_response : dict
+        Original response of bulk request
+
+    Return
+    ------
+    list[str | None]
+        List of error messages in order of bulk items, `None` is used
+        for successfully processed items
+
+    Raises
+    ------
+    ValueError
+        If bulk response has invalid structure
+    """
+    if 'errors' not in bulk_response or 'items' not in bulk_response:
+        raise ValueError(
+            'Invalid bulk response structure, '
+            '"errors" and "items" fields must be presented'
+        )
+
+    items = bulk_response['items']
+
+    if not bulk_response['errors']:
+        return [None] * len(items)
+
+    errors: list[str | None] = []
+    try:
+        for item in items:
+            info = item['index']
+            if 'error' in info:
+                error = info['error']
+                errors.append(f'{error["type"]} - {error["reason"]}')
+            else:
+                errors.append(None)
+    except KeyError:
+        raise ValueError(
+            'Invalid bulk response structure, '
+            '"type" and "reason" must be presented in error info'
+        )
+
+    return errors
+
+
+def _next_available_host(
+    hosts: Iterator[URL],
+    count: int,
+    requester: ResilientRequester
+) -> URL:
+    """Get next host with not open circuit breaker.
+
+    Parameters
+    ----------
+    hosts : Iterator[URL]
+        Cyclic iterator of hosts
+
+    count : int
+        Number of distinct hosts in iterator
+
+    requester : ResilientRequester
+        Requester holding circuit breakers of hosts
+
+    Returns
+    -------
+    URL
+        Next available host or just next host if all hosts are
+        unavailable
+    """
+    for _ in range(count):
+        host = next(hosts)
+        if requester.is_available(host):
+            return host
+
+    return next(hosts)
+
+
+async def _post_bulk_entries(
+    requester: ResilientRequester,
+    host: URL,
+    entries: Sequence[str],
+    proxy: str | None,
+    next_host: Callable[[], URL] | None = None
+) -> list[str | None]:
+    """Index bulk entries using `_bulk` API.
+
+    Parameters
+    ----------
+    requester : ResilientRequester
+        Requester to use for request
+
+    host : URL
+        Host of the cluster node
+
+    entries : Sequence[str]
+        Bulk entries, each entry consists of operation line and
+        document line
+
+    proxy : str | None
+        HTTP(S) proxy address
+
+    next_host : Callable[[], URL] | None, default=None
+        Callback returning host of another cluster node for retries,
+        retries are performed to the same host if value is `None`
+
+    Returns
+    -------
+    list[str | None]
+        List of error messages in order of entries, `None` is used
+        for successfully indexed entries
+
+    Raises
+    ------
+    PermanentWriteError
+        If bulk request is rejected, context of exception doesn't
+        include plugin instance information
+
+    PluginRuntimeError
+        If bulk indexing fails, context of exception doesn't include
+        plugin instance information
+    """
+    def next_url(url: URL) -> URL:
+        nonlocal host
+        assert next_host is not None
+
+        host = next_host()
+        return host.with_path(url.path)
+
+    try:
+        response = await requester.request(
+            method='POST',
+            url=host.with_path('_bulk'),
+            next_url=next_url if next_host is not None else None,
+            data='\n'.join(entries) + '\n',
+            proxy=proxy
+        )
+    except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+        raise PluginRuntimeError(
+            'Failed to perform bulk indexing',
+            context=dict(reason=str(e), url=host.host)
+        ) from e
+
+    if response.status != 200:
+        error_cls = (
+            PluginRuntimeError
+            if is_retryable_status(response.status)
+            else PermanentWriteError
+        )
+        raise error_cls(
+            'Failed to perform bulk indexing',
+            context=dict(
+                reason=response.text,
+                http_status=response.status,
+                url=host.host
+            )
+        )
+
+    try:
+        result = json.loads(response.text)
+    except json.JSONDecodeError as e:
+        raise PluginRuntimeError(
+            'Failed to decode bulk response',
+            context=dict(reason=str(e), url=host.host)
+        ) from None
+
+    try:
+        errors = _get_bulk_response_item_errors(result)
+    except ValueError as e:
+        raise PluginRuntimeError(
+            'Failed to process bulk response',
+            context=dict(reason=str(e), url=host.host)
+        ) from None
+
+    if not any(errors):
+        return [None] * len(entries)
+
+    if len(errors) != len(entries):
+        raise PluginRuntimeError(
+            'Failed to process bulk response',
+            context=dict(
+                reason=(
+                    f'Number of items in response ({len(errors)}) '
+                    f'differs from number of entries ({len(entries)})'
+                ),
+                url=host.host
+            )
+        )
+
+    return errors
+
+
+class _SharedBulkWriter:
+    """Bulk writer shared between plugins targeting the same cluster,
+    bulks of all plugins are coalesced into fewer larger requests.
+
+    Parameters
+    ----------
+    requester : ResilientRequester
+        Requester to use for requests
+
+    hosts : Iterable[URL]
+        Hosts of the cluster nodes for load balancing
+
+    proxy : str | None
+        HTTP(S) proxy address
+
+    coalescing_delay : float
+        Time (in seconds) to wait for bulks of other plugins
+    """
+
+    def __init__(
+        self,
+        requester: ResilientRequester,
+        hosts: Iterable[URL],
+        proxy: str | None,
+        coalescing_delay: float
+    ) -> None:
+        self._requester = requester
+        hosts = list(hosts)
+        self._hosts_count = len(hosts)
+        self._hosts = itertools.cycle(hosts)
+        self._proxy = proxy
+        self._coalescer: BatchCoalescer[str, str | None] = BatchCoalescer(
+            flush=self._flush,
+            delay=coalescing_delay
+        )
+
+    async def _flush(self, entries: list[str]) -> list[str | None]:
+        """Flush coalesced bulk entries.
+
+        Parameters
+        ----------
+        entries : list[str]
+            Bulk entries
+
+        Returns
+        -------
+        list[str | None]
+            Errors of entries
+        """
+        return await _post_bulk_entries(
+            requester=self._requester,
+            host=self._next_host(),
+            entries=entries,
+            proxy=self._proxy,
+            next_host=self._next_host
+        )
+
+    def _next_host(self) -> URL:
+        """Get next host for request skipping hosts with open circuit
+        breaker.
+
+        Returns
+        -------
+        URL
+            Host URL
+        """
+        return _next_available_host(
+            hosts=self._hosts,
+            count=self._hosts_count,
+            requester=self._requester
+        )
+
+    async def write(self, entries: Sequence[str]) -> list[str | None]:
+        """Write bulk entries as part of coalesced bulk request.
+
+        Parameters
+        ----------
+        entries : Sequence[str]
+            Bulk entries
+
+        Returns
+        -------
+        list[str | None]
+            List of error messages in order of entries, `None` is used
+            for successfully indexed entries
+
+        Raises
+        ------
+        PluginRuntimeError
+            If bulk indexing fails
+        """
+        return await self._coalescer.submit(entries)
+
+    async def close(self) -> None:
+        """Close writer with flushing pending entries."""
+        await self._coalescer.flush()
+
+
+_shared_bulk_writers: SharedResourcesPool[
+    Hashable,
+    _SharedBulkWriter
+] = SharedResourcesPool(close=lambda writer: writer.close())
 
 
 class OpensearchOutputPlugin(
@@ -42,9 +349,50 @@ class OpensearchOutputPlugin(
             )
 
         self._session: aiohttp.ClientSession
+        self._breakers: CircuitBreakers | None = None
+        self._requester: ResilientRequester
+        self._bulk_writer: _SharedBulkWriter
+
+    @property
+    def _session_key(self) -> Hashable:
+        """Key of session in pool of shared sessions."""
+        return (
+            self.plugin_name,
+            self._config.verify,
+            self._config.ca_cert,
+            self._config.client_cert,
+            self._config.client_cert_key,
+            self._config.username,
+            self._config.password,
+            self._config.connect_timeout,
+            self._config.request_timeout
+        )
 
-    async def _open(self) -> None:
-        self._session = create_session(
+    @property
+    def _breakers_key(self) -> Hashable:
+        """Key of circuit breakers in pool of shared breakers."""
+        return (self._session_key, self._config.retry)
+
+    @property
+    def _bulk_writer_key(self) -> Hashable:
+        """Key of bulk writer in pool of shared bulk writers."""
+        return (
+            self._session_key,
+            tuple(str(host) for host in self._config.hosts),
+            str(self._config.proxy_url) if self._config.proxy_url else None,
+            self._config.coalescing_delay,
+            self._config.retry
+        )
+
+    async def _create_session(self) -> aiohttp.ClientSession:
+        """Create client session.
+
+        Returns
+        -------
+        aiohttp.ClientSession
+            Created session
+        """
+        return create_session(
             ssl_context=self._ssl_context,
             username=self._config.username,
             password=self._config.password,
@@ -56,8 +404,101 @@ class OpensearchOutputPlugin(
             request_timeout=self._config.request_timeout
         )
 
+    async def _create_breakers(self) -> CircuitBreakers:
+        """Create circuit breakers of hosts.
+
+        Returns
+        -------
+        CircuitBreakers
+            Created circuit breakers
+        """
+        assert self._config.retry is not None
+
+        return CircuitBreakers(
+            threshold=self._config.retry.breaker_threshold,
+            cooldown=self._config.retry.breaker_cooldown
+        )
+
+    async def _create_bulk_writer(self) -> _SharedBulkWriter:
+        """Create shared bulk writer.
+
+        Returns
+        -------
+        _SharedBulkWriter
+            Created bulk writer
+        """
+        return _SharedBulkWriter(
+            requester=ResilientRequester(
+                session=self._session,
+                config=self._config.retry,
+                breakers=self._breakers
+            ),
+            hosts=[URL(str(host)) for host in self._config.hosts],
+            proxy=(
+                str(self._config.proxy_url)
+                if self._config.proxy_url else None
+            ),
+            coalescing_delay=self._config.coalescing_delay
+        )
+
+    async def _open(self) -> None:
+        if self._config.shared_pool:
+            self._session = await shared_sessions.acquire(
+                key=self._session_key,
+                create=self._create_session
+            )
+
+            if self._config.retry is not None:
+                self._breakers = await shared_breakers.acquire(
+                    key=self._breakers_key,
+                    create=self._create_breakers
+                )
+
+            self._bulk_writer = await _shared_bulk_writers.acquire(
+                key=self._bulk_writer_key,
+                create=self._create_bulk_writer
+            )
+        else:
+            self._session = await self._create_session()
+
+        self._requester = ResilientRequester(
+            session=self._session,
+            config=self._config.retry,
+            breakers=self._breakers
+        )
+
     async def _close(self) -> None:
-        await self._session.close()
+        if self._config.shared_pool:
+            await _shared_bulk_writers.release(self._bulk_writer_key)
+
+            if self._breakers is not None:
+                await shared_breakers.release(self._breakers_key)
+                self._breakers = None
+
+            await shared_sessions.release(self._session_key)
+        else:
+            await self._session.close()
+
+    async def _warm_up(self) -> None:
+        # Requests to root endpoints establish connections to all
+        # hosts, so they are reused for first bulk requests
+        for host in self._config.hosts:
+            url = URL(str(host))
+            try:
+                async with self._session.get(
+                    url=url,
+                    proxy=(
+                        str(self._config.proxy_url)
+                        if self._config.proxy_url else None
+                    )
+                ) as response:
+                    await response.read()
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                await self._logger.awarning(
+                    'Failed to establish connection during warming up',
+                    reason=str(e),
+                    url=url.host
+                )
 
     def _choose_host(self) -> Iterator[URL]:
         """Choose host from hosts list specified in config.
@@ -72,9 +513,26 @@ class OpensearchOutputPlugin(
         for host in itertools.cycle(host_urls):
             yield host
 
-    def _create_bulk_data(self, events: Iterable[str]) -> str:
-        """Create body for bulk request. It is expected that events
-        are already formatted as single line serialized json document.
+    def _next_host(self) -> URL:
+        """Get next host for request skipping hosts with open circuit
+        breaker.
+
+        Returns
+        -------
+        URL
+            Host URL
+        """
+        return _next_available_host(
+            hosts=self._hosts,
+            count=len(self._config.hosts),
+            requester=self._requester
+        )
+
+    def _create_bulk_entries(self, events: Iterable[str]) -> list[str]:
+        """Create entries of bulk request body, where each entry
+        consists of operation line and event line. It is expected that
+        events are already formatted as single line serialized json
+        document.
 
         Parameters
         ----------
@@ -83,17 +541,11 @@ class OpensearchOutputPlugin(
 
         Returns
         -------
-        str
-            Bulk data for request body
+        list[str]
+            Bulk entries
         """
-        bulk_lines = []
         operation = json.dumps({'index': {'_index': self._config.index}})
-
-        for event in events:
-            bulk_lines.append(operation)
-            bulk_lines.append(event)
-
-        return '\n'.join(bulk_lines) + '\n'
+        return [f'{operation}\n{event}' for event in events]
 
     @staticmethod
     def _get_bulk_response_errors(bulk_response: dict) -> list[str]:
@@ -113,36 +565,55 @@ class OpensearchOutputPlugin(
         ValueError
             If bulk response has invalid structure
         """
-        if 'errors' not in bulk_response or 'items' not in bulk_response:
-            raise ValueError(
-                'Invalid bulk response structure, '
-                '"errors" and "items" fields must be presented'
-            )
+        return [
+            error
+            for error in _get_bulk_response_item_errors(bulk_response)
+            if error is not None
+        ]
 
-        has_errors = bulk_response['errors']
+    async def _post_bulk(self, events: Sequence[str]) -> int:
+        """Index events using `_bulk` API.
+
+        Parameters
+        ----------
+        events : Sequence[str]
+            Events to index
 
-        if not has_errors:
-            return []
+        Returns
+        -------
+        int
+            Number of successfully written events
 
-        items = bulk_response['items']
+        Raises
+        ------
+        PermanentWriteError
+            If events are rejected
 
-        errors = []
+        PluginRuntimeError
+            If events indexing fails
+        """
         try:
-            for item in items:
-                info = item['index']
-                if 'error' in info:
-                    error = info['error']
-                    errors.append(f'{error["type"]} - {error["reason"]}')
-        except KeyError:
-            raise ValueError(
-                'Invalid bulk response structure, '
-                '"type" and "reason" must be presented in error info'
+            item_errors = await _post_bulk_entries(
+                requester=self._requester,
+                host=self._next_host(),
+                entries=self._create_bulk_entries(events),
+                proxy=(
+                    str(self._config.proxy_url)
+                    if self._config.proxy_url else None
+                ),
+                next_host=self._next_host
             )
+        except PluginRuntimeError as e:
+            raise type(e)(
+                str(e),
+                context=dict(self.instance_info, **e.context)
+            ) from e
 
-        return errors
+        return await self._count_written(item_errors)
 
-    async def _post_bulk(self, events: Sequence[str]) -> int:
-        """Index events using `_bulk` API.
+    async def _post_coalesced_bulk(self, events: Sequence[str]) -> int:
+        """Index events using `_bulk` API of shared bulk writer, that
+        coalesces bulks of all plugins sharing it.
 
         Parameters
         ----------
@@ -156,65 +627,39 @@ class OpensearchOutputPlugin(
 
         Raises
         ------
+        PermanentWriteError
+            If events are rejected
+
         PluginRuntimeError
             If events indexing fails
         """
-        host = next(self._hosts)
-
         try:
-            response = await self._session.post(
-                url=host.with_path('_bulk'),
-                data=self._create_bulk_data(events),
-                proxy=(
-                    str(self._config.proxy_url)
-                    if self._config.proxy_url else None
-                )
+            item_errors = await self._bulk_writer.write(
+                self._create_bulk_entries(events)
             )
-            text = await response.text()
-        except aiohttp.ClientError as e:
-            raise PluginRuntimeError(
-                'Failed to perform bulk indexing',
-                context=dict(
-                    self.instance_info,
-                    reason=str(e),
-                    url=host.host
-                )
+        except PluginRuntimeError as e:
+            raise type(e)(
+                str(e),
+                context=dict(self.instance_info, **e.context)
             ) from e
 
-        if response.status != 200:
-            raise PluginRuntimeError(
-                'Failed to perform bulk indexing',
-                context=dict(
-                    self.instance_info,
-                    reason=text,
-                    http_status=response.status,
-                    url=host.host
-                )
-            )
+        return await self._count_written(item_errors)
 
-        try:
-            result = json.loads(text)
-        except json.JSONDecodeError as e:
-            raise PluginRuntimeError(
-                'Failed to decode bulk response',
-                context=dict(
-                    self.instance_info,
-                    reason=str(e),
-                    url=host.host
-                )
-            ) from None
+    async def _count_written(self, item_errors: Sequence[str | None]) -> int:
+        """Count successfully written events with logging errors of
+        failed ones.
 
-        try:
-            errors = self._get_bulk_response_errors(result)
-        except ValueError as e:
-            raise PluginRuntimeError(
-                'Failed to process bulk response',
-                context=dict(
-                    self.instance_info,
-                    reason=str(e),
-                    url=host.host
-                )
-            ) from None
+        Parameters
+        ----------
+        item_errors : Sequence[str | None]
+            Errors of bulk items, `None` for successful items
+
+        Returns
+        -------
+        int
+            Number of successfully written events
+        """
+        errors = [error for error in item_errors if error is not None]
 
         if errors:
             await self._logger.aerror(
@@ -222,7 +667,7 @@ class OpensearchOutputPlugin(
                 reason=f'First 3/{len(errors)} errors are shown: {errors[:3]}'
             )
 
-        return len(events) - len(errors)
+        return len(item_errors) - len(errors)
 
     async def _post_doc(self, event: str) -> int:
         """Index event using `_doc` API.
@@ -239,22 +684,31 @@ class OpensearchOutputPlugin(
 
         Raises
         ------
+        PermanentWriteError
+            If events are rejected
+
         PluginRuntimeError
             If events indexing fails
         """
-        host = next(self._hosts)
+        host = self._next_host()
+
+        def next_url(url: URL) -> URL:
+            nonlocal host
+            host = self._next_host()
+            return host.with_path(url.path)
 
         try:
-            response = await self._session.post(
+            response = await self._requester.request(
+                method='POST',
                 url=host.with_path(f'{self._config.index}/_doc'),
+                next_url=next_url,
                 data=event,
                 proxy=(
                     str(self._config.proxy_url)
                     if self._config.proxy_url else None
                 )
             )
-            text = await response.text()
-        except aiohttp.ClientError as e:
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
             raise PluginRuntimeError(
                 'Failed to post document',
                 context=dict(
@@ -265,11 +719,16 @@ class OpensearchOutputPlugin(
             ) from e
 
         if response.status != 201:
-            raise PluginRuntimeError(
+            error_cls = (
+                PluginRuntimeError
+                if is_retryable_status(response.status)
+                else PermanentWriteError
+            )
+            raise error_cls(
                 'Failed to post document',
                 context=dict(
                     self.instance_info,
-                    reason=text,
+                    reason=response.text,
                     http_status=response.status,
                     url=host.host
                 )
@@ -278,7 +737,9 @@ class OpensearchOutputPlugin(
         return 1
 
     async def _write(self, events: Sequence[str]) -> int:
-        if len(events) > 1:
+        if self._config.shared_pool:
+            return await self._post_coalesced_bulk(events)
+        elif len(events) > 1:
             return await self._post_bulk(events)
         else:
             return await self._post_doc(events[0])
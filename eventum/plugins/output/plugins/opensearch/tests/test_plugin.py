@@ -1,9 +1,12 @@
+import asyncio
 import json
 import re
 
+import aiohttp
 import pytest
 from aioresponses import aioresponses
 
+from eventum.plugins.output.fields import RetryConfig
 from eventum.plugins.output.plugins.opensearch.config import \
     OpensearchOutputPluginConfig
 from eventum.plugins.output.plugins.opensearch.plugin import \
@@ -180,3 +183,150 @@ async def test_opensearch_write_many_partially_corrupted(
             '{"@timestamp": "2024-01-01T00:00:00.000Z", "value": 1}'
         )
         assert written == 1
+
+
+@pytest.mark.asyncio
+async def test_opensearch_retry_on_another_host(write_response):
+    config = OpensearchOutputPluginConfig(
+        hosts=[
+            'https://localhost:9200',   # type: ignore[list-item]
+            'https://localhost:9201'    # type: ignore[list-item]
+        ],
+        username='admin',
+        password='pass',
+        index='test_index',
+        verify=False,
+        retry=RetryConfig(max_attempts=2, initial_backoff=0.001)
+    )
+    plugin = OpensearchOutputPlugin(config=config, params={'id': 1})
+    await plugin.open()
+
+    with aioresponses() as m:
+        m.post(
+            url=re.compile(r'https://localhost:9200/.*'),
+            exception=aiohttp.ClientConnectionError(),
+            repeat=True
+        )
+        m.post(
+            url=re.compile(r'https://localhost:9201/.*'),
+            status=201,
+            body=write_response
+        )
+        written = await plugin.write(events=['{"value": 1}'])
+        await plugin.close()
+
+        urls = [str(url) for _, url in m.requests]
+
+    assert written == 1
+    assert urls == [
+        'https://localhost:9200/test_index/_doc',
+        'https://localhost:9201/test_index/_doc'
+    ]
+
+
+@pytest.mark.asyncio
+async def test_opensearch_shared_pool():
+    configs = [
+        OpensearchOutputPluginConfig(
+            hosts=['https://localhost:9200'],   # type: ignore[arg-type]
+            username='admin',
+            password='pass',
+            index=index,
+            verify=False,
+            shared_pool=True
+        )
+        for index in ('first_index', 'second_index')
+    ]
+    plugins = [
+        OpensearchOutputPlugin(config=config, params={'id': i})
+        for i, config in enumerate(configs)
+    ]
+
+    for plugin in plugins:
+        await plugin.open()
+
+    assert plugins[0]._session is plugins[1]._session
+
+    response = json.dumps({
+        'took': 10,
+        'errors': True,
+        'items': [
+            {'index': {'status': 201}},
+            {
+                'index': {
+                    'status': 400,
+                    'error': {'type': 'mapper_parsing_exception',
+                              'reason': 'failed to parse'}
+                }
+            },
+            {'index': {'status': 201}}
+        ]
+    })
+
+    with aioresponses() as m:
+        m.post(
+            url=re.compile(r'https://localhost:9200/.*'),
+            status=200,
+            body=response
+        )
+        written = await asyncio.gather(
+            plugins[0].write(
+                ['{"value": 1}', '{"value": 2}']
+            ),
+            plugins[1].write(
+                ['{"value": 3}']
+            )
+        )
+
+        for plugin in plugins:
+            await plugin.close()
+
+        (method, url), requests = m.requests.popitem()
+        assert method == 'POST'
+        assert str(url) == 'https://localhost:9200/_bulk'
+        assert len(requests) == 1
+        assert requests[0].kwargs['data'] == (
+            '{"index": {"_index": "first_index"}}\n'
+            '{"value": 1}\n'
+            '{"index": {"_index": "first_index"}}\n'
+            '{"value": 2}\n'
+            '{"index": {"_index": "second_index"}}\n'
+            '{"value": 3}\n'
+        )
+        assert written == [1, 1]
+
+
+@pytest.mark.asyncio
+async def test_opensearch_warm_up(config):
+    plugin = OpensearchOutputPlugin(config=config, params={'id': 1})
+
+    with aioresponses() as m:
+        m.get(url='https://localhost:9200', status=200, body='{}')
+
+        await plugin.warm_up()
+
+        assert len(m.requests) == 1
+
+    await plugin.close()
+
+
+@pytest.mark.asyncio
+async def test_opensearch_warm_up_unreachable(config):
+    plugin = OpensearchOutputPlugin(config=config, params={'id': 1})
+
+    with aioresponses():
+        await plugin.warm_up()
+
+    await plugin.close()
+
+
+@pytest.mark.asyncio
+async def test_opensearch_warm_up_timeout(config):
+    plugin = OpensearchOutputPlugin(config=config, params={'id': 1})
+
+    with aioresponses() as m:
+        m.get(url='https://localhost:9200', exception=asyncio.TimeoutError())
+
+        await plugin.warm_up()
+
+    await plugin.close()
@@ -0,0 +1,136 @@
+from typing import Sequence, TypeAlias
+
+from eventum.plugins.output.fields import RoutingConfig
+
+RouteKey: TypeAlias = tuple[tuple[str, ...], str | None]
+"""Routing key of event consisting of tags of input plugin and alias
+of template that event is rendered from (if any)."""
+
+
+def matches_route(config: RoutingConfig, key: RouteKey) -> bool:
+    """Check whether event with specified routing key matches routing
+    config.
+
+    Parameters
+    ----------
+    config : RoutingConfig
+        Routing config
+
+    key : RouteKey
+        Routing key of event
+
+    Returns
+    -------
+    bool
+        Whether event matches config
+    """
+    tags, alias = key
+
+    if config.tags_any and not set(config.tags_any).intersection(tags):
+        return False
+
+    if config.tags_all and not set(config.tags_all).issubset(tags):
+        return False
+
+    if config.template_aliases and alias not in config.template_aliases:
+        return False
+
+    return True
+
+
+class EventsRouter:
+    """Router of events to outputs.
+
+    Parameters
+    ----------
+    routes : Sequence[RoutingConfig | None]
+        Routing configs of outputs, `None` means that all events are
+        routed to corresponding output
+
+    Notes
+    -----
+    Routing configs are matched once for each distinct routing key,
+    results of matching are cached, so routing of batch costs single
+    pass over its events
+    """
+
+    def __init__(self, routes: Sequence[RoutingConfig | None]) -> None:
+        self._routes = tuple(routes)
+        self._is_broadcast = all(route is None for route in self._routes)
+        self._targets_cache: dict[RouteKey, tuple[int, ...]] = dict()
+
+    def _get_targets(self, key: RouteKey) -> tuple[int, ...]:
+        """Get indices of outputs that event with specified routing key
+        is routed to.
+
+        Parameters
+        ----------
+        key : RouteKey
+            Routing key of event
+
+        Returns
+        -------
+        tuple[int, ...]
+            Indices of outputs
+        """
+        targets = self._targets_cache.get(key)
+
+        if targets is None:
+            targets = tuple(
+                i for i, route in enumerate(self._routes)
+                if route is None or matches_route(route, key)
+            )
+            self._targets_cache[key] = targets
+
+        return targets
+
+    def route(
+        self,
+        events: Sequence[str],
+        keys: Sequence[RouteKey]
+    ) -> list[list[str]]:
+        """Partition batch of events between outputs.
+
+        Parameters
+        ----------
+        events : Sequence[str]
+            Events to route
+
+        keys : Sequence[RouteKey]
+            Routing keys of events in the same order
+
+        Returns
+        -------
+        list[list[str]]
+            Partitions of events for each output in the same order as
+            routes are provided, relative order of events is preserved
+
+        Raises
+        ------
+        ValueError
+            If number of keys does not match number of events
+        """
+        if len(events) != len(keys):
+            raise ValueError(
+                f'Number of keys ({len(keys)}) does not match '
+                f'number of events ({len(events)})'
+            )
+
+        if self._is_broadcast:
+            # Partitions are not modified by outputs, so the same list
+            # is shared to avoid copying
+            batch = list(events)
+            return [batch for _ in self._routes]
+
+        partitions: list[list[str]] = [[] for _ in self._routes]
+
+        for event, key in zip(events, keys):
+            for i in self._get_targets(key):
+                partitions[i].append(event)
+
+        return partitions
+
+    @property
+    def routes(self) -> tuple[RoutingConfig | None, ...]:
+        """Routing configs of outputs."""
+        return self._routes
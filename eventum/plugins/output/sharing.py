@@ -0,0 +1,345 @@
+import asyncio
+import weakref
+from dataclasses import dataclass
+from typing import (Awaitable, Callable, Generic, Hashable, Sequence,
+                    TypeVar)
+
+K = TypeVar('K', bound=Hashable)
+R = TypeVar('R')
+T = TypeVar('T')
+U = TypeVar('U')
+
+
+@dataclass
+class _SharedResource(Generic[R]):
+    """Shared resource with number of its holders.
+
+    Parameters
+    ----------
+    resource : R
+        Resource
+
+    holders : int
+        Number of holders that acquired resource
+    """
+    resource: R
+    holders: int
+
+
+class SharedResourcesPool(Generic[K, R]):
+    """Pool of reference counted resources (e.g. client sessions)
+    shared between output plugins that are running in the same event
+    loop and targeting the same endpoint.
+
+    Parameters
+    ----------
+    close : Callable[[R], Awaitable[None]] | None, default=None
+        Callback for releasing resource once the last holder of it
+        releases the resource, nothing is done if value is `None`
+
+    Notes
+    -----
+    Resources are bound to event loop they are created in, so key of
+    resource is complemented with identity of current running loop.
+    Access to resources is synchronized by lock of current running
+    loop, so pool can be used from several loops (e.g. in different
+    threads)
+    """
+
+    def __init__(
+        self,
+        close: Callable[[R], Awaitable[None]] | None = None
+    ) -> None:
+        self._close = close
+        self._resources: dict[tuple[int, K], _SharedResource[R]] = dict()
+        self._locks: weakref.WeakKeyDictionary[
+            asyncio.AbstractEventLoop,
+            asyncio.Lock
+        ] = weakref.WeakKeyDictionary()
+
+    def _get_lock(self) -> asyncio.Lock:
+        """Get lock of current running loop, lock is created on first
+        use in the loop.
+
+        Returns
+        -------
+        asyncio.Lock
+            Lock of current running loop
+        """
+        loop = asyncio.get_running_loop()
+        lock = self._locks.get(loop)
+
+        if lock is None:
+            lock = asyncio.Lock()
+            self._locks[loop] = lock
+
+        return lock
+
+    @staticmethod
+    def _loop_key(key: K) -> tuple[int, K]:
+        """Complement resource key with identity of running loop.
+
+        Parameters
+        ----------
+        key : K
+            Resource key
+
+        Returns
+        -------
+        tuple[int, K]
+            Complemented key
+        """
+        return (id(asyncio.get_running_loop()), key)
+
+    async def acquire(self, key: K, create: Callable[[], Awaitable[R]]) -> R:
+        """Acquire resource by key, resource is created if no one
+        holds it yet.
+
+        Parameters
+        ----------
+        key : K
+            Resource key
+
+        create : Callable[[], Awaitable[R]]
+            Callback for creating resource
+
+        Returns
+        -------
+        R
+            Acquired resource
+
+        Raises
+        ------
+        Exception
+            If exception is raised in `create` callback
+        """
+        loop_key = self._loop_key(key)
+
+        async with self._get_lock():
+            shared = self._resources.get(loop_key)
+
+            if shared is None:
+                shared = _SharedResource(resource=await create(), holders=0)
+                self._resources[loop_key] = shared
+
+            shared.holders += 1
+            return shared.resource
+
+    async def release(self, key: K) -> None:
+        """Release resource by key, resource is closed once the last
+        holder releases it.
+
+        Parameters
+        ----------
+        key : K
+            Resource key
+
+        Raises
+        ------
+        KeyError
+            If resource with specified key is not acquired
+        """
+        loop_key = self._loop_key(key)
+
+        async with self._get_lock():
+            shared = self._resources[loop_key]
+            shared.holders -= 1
+
+            if shared.holders > 0:
+                return
+
+            del self._resources[loop_key]
+
+        if self._close is not None:
+            await self._close(shared.resource)
+
+    def holders(self, key: K) -> int:
+        """Get number of holders of resource in current running loop.
+
+        Parameters
+        ----------
+        key : K
+            Resource key
+
+        Returns
+        -------
+        int
+            Number of holders, zero if resource is not acquired
+        """
+        shared = self._resources.get(self._loop_key(key))
+        return 0 if shared is None else shared.holders
+
+
+@dataclass
+class _Submission(Generic[T, U]):
+    """Items submitted to coalescer by single writer.
+
+    Parameters
+    ----------
+    items : Sequence[T]
+        Submitted items
+
+    future : asyncio.Future[list[U]]
+        Future for results of the submitted items
+    """
+    items: Sequence[T]
+    future: asyncio.Future[list[U]]
+
+
+class BatchCoalescer(Generic[T, U]):
+    """Coalescer of batches submitted by several writers into fewer
+    and larger batches that are flushed at once.
+
+    Parameters
+    ----------
+    flush : Callable[[list[T]], Awaitable[list[U]]]
+        Callback for flushing coalesced items, it must return results
+        for each of provided items in the same order
+
+    delay : float, default=0
+        Time (in seconds) to wait for submissions of other writers
+        before flushing, zero value means that only submissions
+        performed within the same event loop iteration are coalesced
+
+    max_size : int | None, default=None
+        Number of pending items that triggers flush immediately, not
+        limited if value is `None`
+
+    Raises
+    ------
+    ValueError
+        If some parameter is out of allowed range
+    """
+
+    def __init__(
+        self,
+        flush: Callable[[list[T]], Awaitable[list[U]]],
+        delay: float = 0,
+        max_size: int | None = None
+    ) -> None:
+        if delay < 0:
+            raise ValueError('Parameter `delay` must be non negative')
+
+        if max_size is not None and max_size < 1:
+            raise ValueError('Parameter `max_size` must be greater than 0')
+
+        self._flush = flush
+        self._delay = delay
+        self._max_size = max_size
+
+        self._pending: list[_Submission[T, U]] = []
+        self._pending_size = 0
+        self._flush_task: asyncio.Task | None = None
+        self._flushing_tasks: set[asyncio.Task] = set()
+
+    async def submit(self, items: Sequence[T]) -> list[U]:
+        """Submit items and wait until they are flushed as part of
+        coalesced batch.
+
+        Parameters
+        ----------
+        items : Sequence[T]
+            Items to submit
+
+        Returns
+        -------
+        list[U]
+            Results of the submitted items in the same order
+
+        Raises
+        ------
+        Exception
+            If exception is raised in `flush` callback during flushing
+            batch containing the submitted items
+        """
+        if not items:
+            return []
+
+        loop = asyncio.get_running_loop()
+        submission: _Submission[T, U] = _Submission(
+            items=items,
+            future=loop.create_future()
+        )
+        self._pending.append(submission)
+        self._pending_size += len(items)
+
+        if (
+            self._max_size is not None
+            and self._pending_size >= self._max_size
+        ):
+            task = loop.create_task(self._flush_pending())
+            self._flushing_tasks.add(task)
+            task.add_done_callback(self._flushing_tasks.discard)
+        elif self._flush_task is None:
+            self._flush_task = loop.create_task(self._flush_delayed())
+
+        return await submission.future
+
+    async def _flush_delayed(self) -> None:
+        """Flush pending submissions after delay."""
+        await asyncio.sleep(self._delay)
+        self._flush_task = None
+        await self._flush_pending()
+
+    async def flush(self) -> None:
+        """Flush pending submissions immediately."""
+        if self._flush_task is not None:
+            self._flush_task.cancel()
+            self._flush_task = None
+
+        await self._flush_pending()
+
+    async def _flush_pending(self) -> None:
+        """Flush all pending submissions as one batch and distribute
+        results between submitters. Submitters are cancelled if
+        flushing is cancelled, so they never wait forever.
+        """
+        submissions = self._pending
+        self._pending = []
+        self._pending_size = 0
+
+        if not submissions:
+            return
+
+        items: list[T] = []
+        for submission in submissions:
+            items.extend(submission.items)
+
+        try:
+            try:
+                results = await self._flush(items)
+            except Exception as e:
+                for submission in submissions:
+                    if not submission.future.done():
+                        submission.future.set_exception(e)
+                return
+
+            if len(results) != len(items):
+                error = RuntimeError(
+                    f'Flush returned {len(results)} results '
+                    f'for {len(items)} items'
+                )
+                for submission in submissions:
+                    if not submission.future.done():
+                        submission.future.set_exception(error)
+                return
+
+            offset = 0
+            for submission in submissions:
+                size = len(submission.items)
+                if not submission.future.done():
+                    submission.future.set_result(
+                        results[offset:offset + size]
+                    )
+                offset += size
+        finally:
+            # Futures are left unresolved only if flushing is
+            # interrupted (e.g. cancelled on closing)
+            for submission in submissions:
+                if not submission.future.done():
+                    submission.future.cancel()
+
+    @property
+    def pending_size(self) -> int:
+        """Number of pending items."""
+        return self._pending_size
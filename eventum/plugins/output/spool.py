@@ -0,0 +1,450 @@
+import mmap
+import os
+import struct
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Iterator, Sequence
+
+import msgspec
+
+_HEADER = struct.Struct('<I')
+_CONSUMED_FLAG = 1 << 31
+_SEGMENT_SUFFIX = '.seg'
+
+_encoder = msgspec.msgpack.Encoder()
+_decoder = msgspec.msgpack.Decoder(list[str])
+
+
+class _Segment:
+    """Memory mapped segment file of spool.
+
+    Parameters
+    ----------
+    path : str
+        Path to segment file
+
+    index : int
+        Index of segment used to order segments
+
+    size : int
+        Size of segment file, existing files keep their size
+
+    Raises
+    ------
+    OSError
+        If segment file cannot be opened or mapped
+    """
+
+    def __init__(self, path: str, index: int, size: int) -> None:
+        self.path = path
+        self.index = index
+
+        fd = os.open(path, os.O_RDWR | os.O_CREAT, 0o600)
+        try:
+            if os.fstat(fd).st_size == 0:
+                os.ftruncate(fd, size)
+
+            self.size = os.fstat(fd).st_size
+            self._mmap = mmap.mmap(fd, self.size)
+        finally:
+            os.close(fd)
+
+        self.read_offset = 0
+        self.write_offset = 0
+        self.records = 0
+        self._recover()
+
+    def _recover(self) -> None:
+        """Find end of written records, skip leading consumed ones and
+        count the rest that are not consumed.
+        """
+        offset = 0
+        while offset + _HEADER.size <= self.size:
+            (header, ) = _HEADER.unpack_from(self._mmap, offset)
+            length = header & ~_CONSUMED_FLAG
+            if length == 0 or offset + _HEADER.size + length > self.size:
+                break
+
+            offset += _HEADER.size + length
+
+            if not header & _CONSUMED_FLAG:
+                self.records += 1
+            elif self.records == 0:
+                self.read_offset = offset
+
+        self.write_offset = offset
+
+    def fits(self, length: int) -> bool:
+        """Check whether record with payload of specified length fits
+        into remaining space of segment.
+        """
+        return self.write_offset + _HEADER.size + length <= self.size
+
+    def append(self, payload: bytes) -> None:
+        """Append record with payload to segment, it is expected that
+        record fits into segment.
+        """
+        _HEADER.pack_into(self._mmap, self.write_offset, len(payload))
+        start = self.write_offset + _HEADER.size
+        self._mmap[start:start + len(payload)] = payload
+
+        self.write_offset = start + len(payload)
+        self.records += 1
+
+    def iterate(self) -> Iterator[tuple[int, bytes]]:
+        """Iterate over records that are not consumed.
+
+        Yields
+        ------
+        tuple[int, bytes]
+            Offset of record and its payload
+        """
+        offset = self.read_offset
+        while offset < self.write_offset:
+            (header, ) = _HEADER.unpack_from(self._mmap, offset)
+            length = header & ~_CONSUMED_FLAG
+            start = offset + _HEADER.size
+
+            if not header & _CONSUMED_FLAG:
+                yield offset, self._mmap[start:start + length]
+
+            offset = start + length
+
+    def ack(self, offset: int) -> None:
+        """Mark record at specified offset as consumed, so it is
+        skipped after restart.
+        """
+        (header, ) = _HEADER.unpack_from(self._mmap, offset)
+        if header & _CONSUMED_FLAG:
+            return
+
+        _HEADER.pack_into(self._mmap, offset, header | _CONSUMED_FLAG)
+        self.records -= 1
+
+        while self.read_offset < self.write_offset:
+            (header, ) = _HEADER.unpack_from(self._mmap, self.read_offset)
+            if not header & _CONSUMED_FLAG:
+                break
+
+            self.read_offset += _HEADER.size + (header & ~_CONSUMED_FLAG)
+
+    def flush(self) -> None:
+        """Flush written records to disk."""
+        self._mmap.flush()
+
+    def close(self) -> None:
+        """Unmap segment file."""
+        self._mmap.close()
+
+    def remove(self) -> None:
+        """Unmap and delete segment file."""
+        self.close()
+        os.remove(self.path)
+
+
+@dataclass(frozen=True)
+class SpooledBatch:
+    """Batch of events read from spool.
+
+    Parameters
+    ----------
+    events : list[str]
+        Events of batch
+
+    segment : int
+        Index of segment with batch
+
+    offset : int
+        Offset of batch record in segment
+    """
+    events: list[str] = field(compare=False)
+    segment: int
+    offset: int
+
+
+class SegmentSpool:
+    """Durable append-only spool of event batches stored in memory
+    mapped segment files.
+
+    Parameters
+    ----------
+    path : str
+        Path to directory with segment files, directory is created if
+        it does not exist, segments left from previous runs are
+        recovered
+
+    segment_size : int, default=16 * 1024 * 1024
+        Size (in bytes) of segment file, batches that do not fit into
+        empty segment get dedicated segment of required size
+
+    max_size : int, default=1024 * 1024 * 1024
+        Maximum total size (in bytes) of segment files, the oldest
+        segments are evicted once it is exceeded
+
+    Raises
+    ------
+    ValueError
+        If some parameter is out of allowed range
+
+    OSError
+        If directory or segment files cannot be accessed
+
+    Notes
+    -----
+    Spool is not thread safe. Batches are peeked in order they are
+    appended and remain in spool until they are acknowledged, so
+    batches that were being written during crash are replayed again
+    after restart. Acknowledged batches are marked as consumed in place
+    and segments are deleted once all their batches are acknowledged.
+    Unflushed changes can be lost only if the whole system crashes.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        segment_size: int = 16 * 1024 * 1024,
+        max_size: int = 1024 * 1024 * 1024
+    ) -> None:
+        if segment_size <= _HEADER.size:
+            raise ValueError(
+                f'Parameter `segment_size` must be greater than {_HEADER.size}'
+            )
+
+        if max_size < segment_size:
+            raise ValueError(
+                'Parameter `max_size` must be greater or equal to '
+                '`segment_size`'
+            )
+
+        self._path = path
+        self._segment_size = segment_size
+        self._max_size = max_size
+
+        os.makedirs(path, exist_ok=True)
+        self._segments: deque[_Segment] = deque(self._recover_segments())
+
+        # Indices are never reused within one run, so acknowledging of
+        # batches from evicted segments cannot affect new segments
+        self._next_index = (
+            self._segments[-1].index + 1 if self._segments else 0
+        )
+
+    def _segment_path(self, index: int) -> str:
+        """Get path of segment file with specified index."""
+        return os.path.join(self._path, f'{index:012d}{_SEGMENT_SUFFIX}')
+
+    def _recover_segments(self) -> list[_Segment]:
+        """Open segment files left from previous runs.
+
+        Returns
+        -------
+        list[_Segment]
+            Recovered segments ordered by index
+        """
+        indices = sorted(
+            int(name.removesuffix(_SEGMENT_SUFFIX))
+            for name in os.listdir(self._path)
+            if (
+                name.endswith(_SEGMENT_SUFFIX)
+                and name.removesuffix(_SEGMENT_SUFFIX).isdigit()
+            )
+        )
+
+        segments: list[_Segment] = []
+        for index in indices:
+            segment = _Segment(
+                path=self._segment_path(index),
+                index=index,
+                size=self._segment_size
+            )
+            if segment.records == 0:
+                segment.remove()
+            else:
+                segments.append(segment)
+
+        return segments
+
+    def _evict(self, required: int) -> int:
+        """Evict the oldest segments to free space.
+
+        Parameters
+        ----------
+        required : int
+            Required space (in bytes)
+
+        Returns
+        -------
+        int
+            Number of evicted batches
+        """
+        evicted = 0
+        while self._segments and self.size + required > self._max_size:
+            segment = self._segments.popleft()
+            evicted += segment.records
+            segment.remove()
+
+        return evicted
+
+    def append(self, events: Sequence[str]) -> int:
+        """Append batch of events to spool.
+
+        Parameters
+        ----------
+        events : Sequence[str]
+            Events to append
+
+        Returns
+        -------
+        int
+            Number of the oldest batches evicted to free space for
+            appended batch
+
+        Raises
+        ------
+        ValueError
+            If batch exceeds maximum size of spool
+
+        OSError
+            If segment file cannot be created
+        """
+        payload = _encoder.encode(list(events))
+        record_size = _HEADER.size + len(payload)
+
+        if record_size > self._max_size or len(payload) >= _CONSUMED_FLAG:
+            raise ValueError('Batch exceeds maximum size of spool')
+
+        if self._segments and self._segments[-1].fits(len(payload)):
+            self._segments[-1].append(payload)
+            return 0
+
+        if self._segments:
+            self._segments[-1].flush()
+
+        size = max(self._segment_size, record_size)
+        evicted = self._evict(required=size)
+
+        index = self._next_index
+        self._next_index += 1
+        segment = _Segment(
+            path=self._segment_path(index),
+            index=index,
+            size=size
+        )
+        segment.append(payload)
+        self._segments.append(segment)
+
+        return evicted
+
+    def peek(self, count: int = 1) -> list[SpooledBatch]:
+        """Read the oldest batches without removing them from spool.
+
+        Parameters
+        ----------
+        count : int, default=1
+            Maximum number of batches to read
+
+        Returns
+        -------
+        list[SpooledBatch]
+            Batches in order they were appended, batches must be
+            acknowledged after processing to remove them from spool
+        """
+        batches: list[SpooledBatch] = []
+
+        for segment in self._segments:
+            for offset, payload in segment.iterate():
+                if len(batches) >= count:
+                    return batches
+
+                batches.append(
+                    SpooledBatch(
+                        events=_decoder.decode(payload),
+                        segment=segment.index,
+                        offset=offset
+                    )
+                )
+
+        return batches
+
+    def ack(self, batch: SpooledBatch) -> None:
+        """Remove processed batch from spool. Nothing is done if batch
+        was already evicted.
+
+        Parameters
+        ----------
+        batch : SpooledBatch
+            Batch obtained by `peek`
+        """
+        for segment in self._segments:
+            if segment.index != batch.segment:
+                continue
+
+            segment.ack(batch.offset)
+
+            # Fully consumed segments are removed immediately, so they
+            # are not read again after restart
+            if segment.records == 0:
+                self._segments.remove(segment)
+                segment.remove()
+
+            return
+
+    def pop(self) -> list[str] | None:
+        """Read the oldest batch and remove it from spool.
+
+        Returns
+        -------
+        list[str] | None
+            Batch of events or `None` if spool is empty
+        """
+        batches = self.peek()
+        if not batches:
+            return None
+
+        self.ack(batches[0])
+        return batches[0].events
+
+    def flush(self) -> None:
+        """Flush written batches to disk."""
+        for segment in self._segments:
+            segment.flush()
+
+    def close(self) -> None:
+        """Flush written batches and unmap segment files."""
+        for segment in self._segments:
+            segment.flush()
+            segment.close()
+
+        self._segments.clear()
+
+    @property
+    def size(self) -> int:
+        """Total size (in bytes) of segment files."""
+        return sum(segment.size for segment in self._segments)
+
+    @property
+    def batches(self) -> int:
+        """Number of batches in spool."""
+        return sum(segment.records for segment in self._segments)
+
+
+def append_dead_letters(path: str, events: Sequence[str]) -> None:
+    """Append events that cannot be written to dead letter file.
+
+    Parameters
+    ----------
+    path : str
+        Path to dead letter file, file is created if it does not exist
+
+    events : Sequence[str]
+        Events to append, each event is followed by line separator
+
+    Raises
+    ------
+    OSError
+        If file cannot be written
+    """
+    with open(path, 'a', encoding='utf-8', newline='') as f:
+        f.writelines(event + os.linesep for event in events)
+        f.flush()
+        os.fsync(f.fileno())
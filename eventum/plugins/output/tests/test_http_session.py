@@ -0,0 +1,249 @@
+import asyncio
+
+import aiohttp
+import pytest
+from aioresponses import aioresponses
+from yarl import URL
+
+from eventum.plugins.output.fields import RetryConfig
+from eventum.plugins.output.http_session import (CircuitBreaker,
+                                                 CircuitBreakers,
+                                                 CircuitOpenError,
+                                                 ResilientRequester,
+                                                 RetryBudget)
+
+pytest_plugins = ('pytest_asyncio',)
+
+ENDPOINT = 'http://localhost:8000/endpoint'
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_circuit_breaker():
+    clock = FakeClock()
+    breaker = CircuitBreaker(threshold=2, cooldown=10, clock=clock)
+
+    assert breaker.state == 'closed'
+    permit = breaker.allow()
+    assert permit is not None and not permit.is_trial
+    breaker.record_failure(permit)
+
+    permit = breaker.allow()
+    assert permit is not None
+    breaker.record_failure(permit)
+    assert breaker.state == 'open'
+    assert breaker.allow() is None
+
+    clock.now = 10
+    assert breaker.state == 'half-open'
+    trial = breaker.allow()
+    assert trial is not None and trial.is_trial
+    assert breaker.allow() is None
+
+    breaker.record_failure(trial)
+    assert breaker.state == 'open'
+
+    clock.now = 20
+    assert breaker.allow() is not None
+    breaker.record_success()
+    assert breaker.state == 'closed'
+
+
+def test_circuit_breaker_releases_only_own_trial():
+    clock = FakeClock()
+    breaker = CircuitBreaker(threshold=1, cooldown=10, clock=clock)
+
+    stale = breaker.allow()
+    assert stale is not None
+
+    permit = breaker.allow()
+    assert permit is not None
+    breaker.record_failure(permit)
+
+    clock.now = 10
+    trial = breaker.allow()
+    assert trial is not None
+
+    # Interrupted request started before breaker opened doesn't free
+    # slot of running trial request
+    breaker.release(stale)
+    assert breaker.allow() is None
+
+    breaker.release(trial)
+    assert breaker.allow() is not None
+
+
+def test_retry_budget():
+    budget = RetryBudget(ratio=0.5, min_retries=1)
+
+    assert budget.withdraw()
+    assert not budget.withdraw()
+
+    budget.deposit()
+    budget.deposit()
+    assert budget.withdraw()
+    assert not budget.withdraw()
+
+
+@pytest.mark.asyncio
+async def test_requester_retries():
+    config = RetryConfig(max_attempts=3, initial_backoff=0.001)
+
+    with aioresponses() as m:
+        m.post(ENDPOINT, status=503)
+        m.post(ENDPOINT, status=201, body='Ok.')
+
+        async with aiohttp.ClientSession() as session:
+            requester = ResilientRequester(session=session, config=config)
+            response = await requester.request('POST', ENDPOINT, data='data')
+
+    assert response.status == 201
+    assert response.text == 'Ok.'
+
+
+@pytest.mark.asyncio
+async def test_requester_retries_next_url():
+    config = RetryConfig(max_attempts=2, initial_backoff=0.001)
+    other_endpoint = 'http://localhost:8001/endpoint'
+
+    with aioresponses() as m:
+        m.post(ENDPOINT, exception=aiohttp.ClientConnectionError())
+        m.post(other_endpoint, status=201, body='Ok.')
+
+        async with aiohttp.ClientSession() as session:
+            requester = ResilientRequester(session=session, config=config)
+            response = await requester.request(
+                'POST',
+                ENDPOINT,
+                next_url=lambda url: url.with_port(8001)
+            )
+
+    assert response.status == 201
+
+
+@pytest.mark.asyncio
+async def test_requester_attempts_exhausted():
+    config = RetryConfig(max_attempts=2, initial_backoff=0.001)
+
+    with aioresponses() as m:
+        m.post(ENDPOINT, status=503, repeat=True)
+
+        async with aiohttp.ClientSession() as session:
+            requester = ResilientRequester(session=session, config=config)
+            response = await requester.request('POST', ENDPOINT)
+
+        (_, requests), = m.requests.items()
+
+    assert response.status == 503
+    assert len(requests) == 2
+
+
+@pytest.mark.asyncio
+async def test_requester_circuit_open():
+    config = RetryConfig(
+        max_attempts=1,
+        breaker_threshold=2,
+        breaker_cooldown=60
+    )
+
+    with aioresponses() as m:
+        m.post(
+            ENDPOINT,
+            exception=aiohttp.ClientConnectionError(),
+            repeat=True
+        )
+
+        async with aiohttp.ClientSession() as session:
+            requester = ResilientRequester(session=session, config=config)
+
+            for _ in range(2):
+                with pytest.raises(aiohttp.ClientConnectionError):
+                    await requester.request('POST', ENDPOINT)
+
+            assert not requester.is_available(URL(ENDPOINT))
+
+            with pytest.raises(CircuitOpenError):
+                await requester.request('POST', ENDPOINT)
+
+
+@pytest.mark.asyncio
+async def test_requesters_share_breakers():
+    config = RetryConfig(
+        max_attempts=1,
+        breaker_threshold=2,
+        breaker_cooldown=60
+    )
+    breakers = CircuitBreakers(threshold=2, cooldown=60)
+
+    with aioresponses() as m:
+        m.post(
+            ENDPOINT,
+            exception=aiohttp.ClientConnectionError(),
+            repeat=True
+        )
+
+        async with aiohttp.ClientSession() as session:
+            first = ResilientRequester(
+                session=session, config=config, breakers=breakers
+            )
+            second = ResilientRequester(
+                session=session, config=config, breakers=breakers
+            )
+
+            with pytest.raises(aiohttp.ClientConnectionError):
+                await first.request('POST', ENDPOINT)
+
+            with pytest.raises(aiohttp.ClientConnectionError):
+                await second.request('POST', ENDPOINT)
+
+            assert not first.is_available(URL(ENDPOINT))
+            assert not second.is_available(URL(ENDPOINT))
+
+
+@pytest.mark.asyncio
+async def test_requester_cancelled_trial():
+    config = RetryConfig(
+        max_attempts=1,
+        breaker_threshold=1,
+        breaker_cooldown=0.05
+    )
+
+    with aioresponses() as m:
+        m.post(ENDPOINT, exception=aiohttp.ClientConnectionError())
+        m.post(ENDPOINT, exception=asyncio.CancelledError())
+        m.post(ENDPOINT, status=201)
+
+        async with aiohttp.ClientSession() as session:
+            requester = ResilientRequester(session=session, config=config)
+
+            with pytest.raises(aiohttp.ClientConnectionError):
+                await requester.request('POST', ENDPOINT)
+
+            await asyncio.sleep(0.05)
+
+            # Trial request of half-open breaker is cancelled
+            with pytest.raises(asyncio.CancelledError):
+                await requester.request('POST', ENDPOINT)
+
+            response = await requester.request('POST', ENDPOINT)
+            assert response.status == 201
+            assert requester.is_available(URL(ENDPOINT))
+
+
+@pytest.mark.asyncio
+async def test_requester_without_retry():
+    with aioresponses() as m:
+        m.post(ENDPOINT, status=503)
+
+        async with aiohttp.ClientSession() as session:
+            requester = ResilientRequester(session=session, config=None)
+            response = await requester.request('POST', ENDPOINT)
+
+            assert response.status == 503
+            assert requester.is_available(URL(ENDPOINT))
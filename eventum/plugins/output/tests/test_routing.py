@@ -0,0 +1,65 @@
+import pytest
+from pydantic import ValidationError
+
+from eventum.plugins.output.fields import RoutingConfig
+from eventum.plugins.output.routing import EventsRouter, matches_route
+
+
+def test_routing_config_empty():
+    with pytest.raises(ValidationError):
+        RoutingConfig()
+
+
+def test_matches_route():
+    config = RoutingConfig(tags_any=('auth', 'network'))
+    assert matches_route(config, (('auth', 'linux'), None))
+    assert not matches_route(config, (('linux', ), None))
+
+    config = RoutingConfig(tags_all=('auth', 'linux'))
+    assert matches_route(config, (('auth', 'linux', 'prod'), None))
+    assert not matches_route(config, (('auth', ), None))
+
+    config = RoutingConfig(tags_any=('auth', ), template_aliases=('login', ))
+    assert matches_route(config, (('auth', ), 'login'))
+    assert not matches_route(config, (('auth', ), 'logout'))
+    assert not matches_route(config, (('auth', ), None))
+
+
+def test_router():
+    router = EventsRouter(
+        routes=[
+            RoutingConfig(tags_any=('auth', )),
+            RoutingConfig(template_aliases=('flow', )),
+            None
+        ]
+    )
+
+    events = ['e1', 'e2', 'e3', 'e4']
+    keys = [
+        (('auth', ), 'login'),
+        (('network', ), 'flow'),
+        (('auth', ), 'flow'),
+        ((), None),
+    ]
+
+    assert router.route(events, keys) == [
+        ['e1', 'e3'],
+        ['e2', 'e3'],
+        ['e1', 'e2', 'e3', 'e4'],
+    ]
+
+
+def test_router_broadcast():
+    router = EventsRouter(routes=[None, None])
+
+    assert router.route(['e1', 'e2'], [((), None), ((), None)]) == [
+        ['e1', 'e2'],
+        ['e1', 'e2'],
+    ]
+
+
+def test_router_keys_mismatch():
+    router = EventsRouter(routes=[None])
+
+    with pytest.raises(ValueError):
+        router.route(['e1'], [])
@@ -0,0 +1,154 @@
+import asyncio
+
+import pytest
+
+from eventum.plugins.output.sharing import BatchCoalescer, SharedResourcesPool
+
+pytest_plugins = ('pytest_asyncio',)
+
+
+@pytest.mark.asyncio
+async def test_shared_resources_pool():
+    created = []
+    closed = []
+
+    async def create():
+        resource = object()
+        created.append(resource)
+        return resource
+
+    async def close(resource):
+        closed.append(resource)
+
+    pool: SharedResourcesPool[str, object] = SharedResourcesPool(close=close)
+
+    first = await pool.acquire('key', create)
+    second = await pool.acquire('key', create)
+    other = await pool.acquire('other', create)
+
+    assert first is second
+    assert first is not other
+    assert len(created) == 2
+    assert pool.holders('key') == 2
+
+    await pool.release('key')
+    assert closed == []
+
+    await pool.release('key')
+    assert closed == [first]
+    assert pool.holders('key') == 0
+
+    await pool.release('other')
+    assert closed == [first, other]
+
+    with pytest.raises(KeyError):
+        await pool.release('key')
+
+
+def test_shared_resources_pool_in_several_loops():
+    async def create():
+        await asyncio.sleep(0.01)
+        return object()
+
+    pool: SharedResourcesPool[str, object] = SharedResourcesPool()
+
+    async def use_pool():
+        # Concurrent acquiring makes lock contended, so it is bound to
+        # the running loop
+        first, second = await asyncio.gather(
+            pool.acquire('key', create),
+            pool.acquire('key', create)
+        )
+        assert first is second
+
+        await pool.release('key')
+        await pool.release('key')
+
+    asyncio.run(use_pool())
+    asyncio.run(use_pool())
+
+
+@pytest.mark.asyncio
+async def test_batch_coalescer():
+    flushed = []
+
+    async def flush(items):
+        flushed.append(list(items))
+        return [item * 2 for item in items]
+
+    coalescer: BatchCoalescer[int, int] = BatchCoalescer(flush=flush)
+
+    results = await asyncio.gather(
+        coalescer.submit([1, 2]),
+        coalescer.submit([3]),
+        coalescer.submit([4, 5, 6])
+    )
+
+    assert flushed == [[1, 2, 3, 4, 5, 6]]
+    assert results == [[2, 4], [6], [8, 10, 12]]
+
+
+@pytest.mark.asyncio
+async def test_batch_coalescer_max_size():
+    flushed = []
+
+    async def flush(items):
+        flushed.append(list(items))
+        return items
+
+    coalescer: BatchCoalescer[int, int] = BatchCoalescer(
+        flush=flush,
+        delay=10,
+        max_size=3
+    )
+
+    results = await asyncio.gather(
+        coalescer.submit([1, 2]),
+        coalescer.submit([3])
+    )
+
+    assert flushed == [[1, 2, 3]]
+    assert results == [[1, 2], [3]]
+
+    await coalescer.flush()
+    assert flushed == [[1, 2, 3]]
+
+
+@pytest.mark.asyncio
+async def test_batch_coalescer_error():
+    async def flush(items):
+        raise RuntimeError('Flush failed')
+
+    coalescer: BatchCoalescer[int, int] = BatchCoalescer(flush=flush)
+
+    results = await asyncio.gather(
+        coalescer.submit([1]),
+        coalescer.submit([2]),
+        return_exceptions=True
+    )
+
+    assert all(isinstance(result, RuntimeError) for result in results)
+
+
+@pytest.mark.asyncio
+async def test_batch_coalescer_cancelled_flush():
+    is_flushing = asyncio.Event()
+
+    async def flush(items):
+        is_flushing.set()
+        await asyncio.sleep(10)
+        return items
+
+    coalescer: BatchCoalescer[int, int] = BatchCoalescer(flush=flush)
+
+    submission = asyncio.create_task(coalescer.submit([1]))
+    await asyncio.sleep(0)
+
+    flush_task = coalescer._flush_task
+    assert flush_task is not None
+
+    await is_flushing.wait()
+    flush_task.cancel()
+
+    with pytest.raises(asyncio.CancelledError):
+        await asyncio.wait_for(submission, timeout=1)
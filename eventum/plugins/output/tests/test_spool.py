@@ -0,0 +1,393 @@
+import asyncio
+import os
+from typing import Sequence
+
+import pytest
+
+from eventum.plugins.exceptions import PluginRuntimeError
+from eventum.plugins.output.base.config import OutputPluginConfig
+from eventum.plugins.output.base.plugin import OutputPlugin, OutputPluginParams
+from eventum.plugins.output.exceptions import PermanentWriteError
+from eventum.plugins.output.fields import SpoolConfig
+from eventum.plugins.output.spool import SegmentSpool
+
+pytest_plugins = ('pytest_asyncio',)
+
+
+def test_spool_order(tmp_path):
+    spool = SegmentSpool(path=str(tmp_path), segment_size=64, max_size=1024)
+
+    for i in range(10):
+        assert spool.append([f'event{i}', 'x' * i]) == 0
+
+    assert spool.batches == 10
+    assert len(os.listdir(tmp_path)) > 1
+
+    for i in range(10):
+        assert spool.pop() == [f'event{i}', 'x' * i]
+
+    assert spool.pop() is None
+    assert spool.batches == 0
+    assert os.listdir(tmp_path) == []
+
+
+def test_spool_recovery(tmp_path):
+    spool = SegmentSpool(path=str(tmp_path), segment_size=64, max_size=1024)
+    for i in range(5):
+        spool.append([f'event{i}'])
+
+    assert spool.pop() == ['event0']
+    spool.close()
+
+    spool = SegmentSpool(path=str(tmp_path), segment_size=64, max_size=1024)
+
+    assert [spool.pop() for _ in range(5)] == [
+        ['event1'], ['event2'], ['event3'], ['event4'], None
+    ]
+
+
+def test_spool_peek_and_ack(tmp_path):
+    spool = SegmentSpool(path=str(tmp_path), segment_size=64, max_size=1024)
+    for i in range(5):
+        spool.append([f'event{i}'])
+
+    batches = spool.peek(3)
+    assert [batch.events for batch in batches] == [
+        ['event0'], ['event1'], ['event2']
+    ]
+    assert spool.batches == 5
+
+    # Acknowledged not in order, the first batch stays at the head
+    spool.ack(batches[1])
+    assert [batch.events for batch in spool.peek(2)] == [
+        ['event0'], ['event2']
+    ]
+    spool.close()
+
+    spool = SegmentSpool(path=str(tmp_path), segment_size=64, max_size=1024)
+
+    assert spool.batches == 4
+    assert [spool.pop() for _ in range(5)] == [
+        ['event0'], ['event2'], ['event3'], ['event4'], None
+    ]
+
+
+def test_spool_eviction(tmp_path):
+    spool = SegmentSpool(path=str(tmp_path), segment_size=64, max_size=128)
+
+    evicted = sum(spool.append(['x' * 40]) for _ in range(10))
+
+    assert evicted > 0
+    assert spool.batches == 10 - evicted
+    assert spool.size <= 128
+    assert spool.pop() == ['x' * 40]
+
+
+def test_spool_large_batch(tmp_path):
+    spool = SegmentSpool(path=str(tmp_path), segment_size=64, max_size=1024)
+
+    spool.append(['x' * 500])
+    assert spool.pop() == ['x' * 500]
+
+    with pytest.raises(ValueError):
+        spool.append(['x' * 2000])
+
+
+class FlakyOutputPluginConfig(OutputPluginConfig, frozen=True):
+    pass
+
+
+class FlakyOutputPlugin(
+    OutputPlugin[FlakyOutputPluginConfig, OutputPluginParams],
+    register=False
+):
+    def __init__(
+        self,
+        config: FlakyOutputPluginConfig,
+        params: OutputPluginParams
+    ) -> None:
+        super().__init__(config, params)
+        self.is_down = False
+        self.delay = 0.0
+        self.attempts = 0
+        self.written: list[str] = []
+        self.failing: set[str] = set()
+        self.rejected: set[str] = set()
+
+    async def _open(self) -> None:
+        pass
+
+    async def _close(self) -> None:
+        pass
+
+    async def _write(self, events: Sequence[str]) -> int:
+        self.attempts += 1
+        await asyncio.sleep(self.delay)
+
+        if self.is_down or self.failing.intersection(events):
+            raise PluginRuntimeError('Sink is down', context={})
+
+        if self.rejected.intersection(events):
+            raise PermanentWriteError('Events are rejected', context={})
+
+        self.written.extend(events)
+        return len(events)
+
+
+@pytest.mark.asyncio
+async def test_output_spooling(tmp_path):
+    plugin = FlakyOutputPlugin(
+        config=FlakyOutputPluginConfig(
+            spool=SpoolConfig(path=str(tmp_path), replay_interval=0.05)
+        ),
+        params={'id': 1}
+    )
+    await plugin.open()
+
+    assert await plugin.write(['1', '2']) == 2
+
+    plugin.is_down = True
+    assert await plugin.write(['3']) == 0
+    assert await plugin.write(['4', '5']) == 0
+
+    plugin.is_down = False
+    assert await plugin.write(['6']) == 0
+
+    for _ in range(100):
+        if len(plugin.written) == 6:
+            break
+        await asyncio.sleep(0.01)
+
+    assert plugin.written == ['1', '2', '3', '4', '5', '6']
+    assert await plugin.write(['7']) == 1
+
+    await plugin.close()
+
+
+@pytest.mark.asyncio
+async def test_output_spool_survives_restart(tmp_path):
+    config = FlakyOutputPluginConfig(
+        spool=SpoolConfig(path=str(tmp_path), replay_interval=10)
+    )
+
+    plugin = FlakyOutputPlugin(config=config, params={'id': 1})
+    plugin.is_down = True
+    await plugin.open()
+    await plugin.write(['1'])
+    await plugin.close()
+
+    plugin = FlakyOutputPlugin(config=config, params={'id': 1})
+    await plugin.open()
+
+    for _ in range(100):
+        if plugin.written:
+            break
+        await asyncio.sleep(0.01)
+
+    assert plugin.written == ['1']
+
+    await plugin.close()
+
+
+@pytest.mark.asyncio
+async def test_output_spool_replay_is_not_lost_on_cancel(tmp_path):
+    config = FlakyOutputPluginConfig(
+        spool=SpoolConfig(path=str(tmp_path), replay_interval=10)
+    )
+
+    plugin = FlakyOutputPlugin(config=config, params={'id': 1})
+    plugin.is_down = True
+    await plugin.open()
+    await plugin.write(['1'])
+    await plugin.close()
+
+    plugin = FlakyOutputPlugin(config=config, params={'id': 1})
+    plugin.delay = 10
+    await plugin.open()
+
+    for _ in range(100):
+        if plugin.attempts > 0:
+            break
+        await asyncio.sleep(0.01)
+
+    # Plugin is closed while spooled batch is being replayed
+    await plugin.close()
+    assert plugin.written == []
+
+    plugin = FlakyOutputPlugin(config=config, params={'id': 1})
+    await plugin.open()
+
+    for _ in range(100):
+        if plugin.written:
+            break
+        await asyncio.sleep(0.01)
+
+    assert plugin.written == ['1']
+
+    await plugin.close()
+
+
+@pytest.mark.asyncio
+async def test_output_spool_write_is_not_blocked_by_replay(tmp_path):
+    config = FlakyOutputPluginConfig(
+        spool=SpoolConfig(path=str(tmp_path), replay_interval=10)
+    )
+
+    plugin = FlakyOutputPlugin(config=config, params={'id': 1})
+    plugin.is_down = True
+    await plugin.open()
+    await plugin.write(['1'])
+    await plugin.close()
+
+    plugin = FlakyOutputPlugin(config=config, params={'id': 1})
+    plugin.delay = 10
+    await plugin.open()
+
+    for _ in range(100):
+        if plugin.attempts > 0:
+            break
+        await asyncio.sleep(0.01)
+
+    # Spooled batch is being replayed to unresponsive target, new
+    # batches are spooled behind it without waiting
+    assert await asyncio.wait_for(plugin.write(['2']), timeout=1) == 0
+    assert plugin.attempts == 1
+
+    await plugin.close()
+
+    plugin = FlakyOutputPlugin(config=config, params={'id': 1})
+    await plugin.open()
+
+    for _ in range(100):
+        if len(plugin.written) == 2:
+            break
+        await asyncio.sleep(0.01)
+
+    assert plugin.written == ['1', '2']
+
+    await plugin.close()
+
+
+@pytest.mark.asyncio
+async def test_output_spool_keeps_order_of_failed_batches(tmp_path):
+    plugin = FlakyOutputPlugin(
+        config=FlakyOutputPluginConfig(
+            spool=SpoolConfig(
+                path=str(tmp_path),
+                replay_interval=0.01,
+                replay_concurrency=2
+            )
+        ),
+        params={'id': 1}
+    )
+    plugin.is_down = True
+    await plugin.open()
+
+    for i in range(5):
+        await plugin.write([str(i)])
+
+    await asyncio.sleep(0.1)
+    plugin.is_down = False
+
+    for _ in range(100):
+        if len(plugin.written) == 5:
+            break
+        await asyncio.sleep(0.01)
+
+    assert plugin.written == ['0', '1', '2', '3', '4']
+
+    await plugin.close()
+
+
+@pytest.mark.asyncio
+async def test_output_spool_replay_backoff(tmp_path):
+    plugin = FlakyOutputPlugin(
+        config=FlakyOutputPluginConfig(
+            spool=SpoolConfig(
+                path=str(tmp_path),
+                replay_interval=0.05,
+                replay_max_interval=0.1
+            )
+        ),
+        params={'id': 1}
+    )
+    plugin.is_down = True
+    await plugin.open()
+
+    await plugin.write(['1'])
+    attempts = plugin.attempts
+
+    await asyncio.sleep(0.5)
+
+    # Replay rounds are delayed by 0.05, 0.1, 0.1 ... seconds
+    assert 2 <= plugin.attempts - attempts <= 7
+
+    await plugin.close()
+
+
+@pytest.mark.asyncio
+async def test_output_spool_dead_letters_rejected_batches(tmp_path):
+    dead_letter_path = tmp_path / 'dead_letters.txt'
+    plugin = FlakyOutputPlugin(
+        config=FlakyOutputPluginConfig(
+            spool=SpoolConfig(
+                path=str(tmp_path / 'spool'),
+                replay_interval=0.01,
+                dead_letter_path=str(dead_letter_path)
+            )
+        ),
+        params={'id': 1}
+    )
+    plugin.rejected = {'bad1', 'bad2'}
+    await plugin.open()
+
+    # Rejected batch is not spooled and doesn't block next ones
+    assert await plugin.write(['bad1']) == 0
+    assert await plugin.write(['1']) == 1
+
+    plugin.is_down = True
+    for events in (['2'], ['bad2'], ['3']):
+        await plugin.write(events)
+
+    plugin.is_down = False
+
+    for _ in range(100):
+        if len(plugin.written) == 3:
+            break
+        await asyncio.sleep(0.01)
+
+    assert plugin.written == ['1', '2', '3']
+    assert dead_letter_path.read_text() == f'bad1{os.linesep}bad2{os.linesep}'
+
+    await plugin.close()
+
+
+@pytest.mark.asyncio
+async def test_output_spool_max_attempts(tmp_path):
+    plugin = FlakyOutputPlugin(
+        config=FlakyOutputPluginConfig(
+            spool=SpoolConfig(
+                path=str(tmp_path),
+                replay_interval=0.01,
+                max_attempts=3
+            )
+        ),
+        params={'id': 1}
+    )
+    plugin.failing = {'bad'}
+    await plugin.open()
+
+    await plugin.write(['bad'])
+    await plugin.write(['1'])
+
+    for _ in range(100):
+        if plugin.written:
+            break
+        await asyncio.sleep(0.01)
+
+    # The first attempt is performed by writing, then batch is
+    # replayed until maximum number of attempts is reached
+    assert plugin.written == ['1']
+    assert plugin.attempts == 1 + 3 + 1
+
+    await plugin.close()
@@ -0,0 +1,467 @@
+import signal
+from dataclasses import dataclass
+from threading import Event, Lock
+from typing import (Any, Awaitable, Callable, Generic, Hashable, Mapping,
+                    TypeVar)
+
+from pydantic import BaseModel, TypeAdapter, ValidationError
+
+from eventum.plugins.base.plugin import Plugin, PluginParams
+from eventum.plugins.exceptions import PluginConfigurationError
+from eventum.plugins.registry import PluginInfo
+
+K = TypeVar('K', bound=Hashable)
+P = TypeVar('P')
+
+
+@dataclass(frozen=True)
+class ReloadPlan(Generic[K]):
+    """Plan of configuration reload.
+
+    Parameters
+    ----------
+    unchanged : tuple[K, ...]
+        Keys of plugins with unchanged configs, these plugins are kept
+        running
+
+    changed : tuple[K, ...]
+        Keys of plugins with changed configs, these plugins are
+        replaced with new instances
+
+    added : tuple[K, ...]
+        Keys of plugins that are present only in new configuration
+
+    removed : tuple[K, ...]
+        Keys of plugins that are present only in current configuration
+    """
+    unchanged: tuple[K, ...]
+    changed: tuple[K, ...]
+    added: tuple[K, ...]
+    removed: tuple[K, ...]
+
+    @property
+    def is_empty(self) -> bool:
+        """Whether reload changes nothing."""
+        return not (self.changed or self.added or self.removed)
+
+
+def plan_reload(
+    current: Mapping[K, BaseModel],
+    new: Mapping[K, BaseModel]
+) -> ReloadPlan[K]:
+    """Compare current and new plugin configs and plan reload.
+
+    Parameters
+    ----------
+    current : Mapping[K, BaseModel]
+        Current configs of plugins by their keys (e.g. plugin ids)
+
+    new : Mapping[K, BaseModel]
+        New (already validated) configs of plugins by their keys
+
+    Returns
+    -------
+    ReloadPlan[K]
+        Plan of reload
+    """
+    unchanged: list[K] = []
+    changed: list[K] = []
+
+    for key, config in new.items():
+        if key not in current:
+            continue
+
+        if current[key] == config:
+            unchanged.append(key)
+        else:
+            changed.append(key)
+
+    return ReloadPlan(
+        unchanged=tuple(unchanged),
+        changed=tuple(changed),
+        added=tuple(key for key in new if key not in current),
+        removed=tuple(key for key in current if key not in new)
+    )
+
+
+class PluginSlot(Generic[P]):
+    """Holder of plugin instance that can be replaced in place between
+    batches without interrupting the stage it belongs to.
+
+    Parameters
+    ----------
+    plugin : P
+        Initial plugin instance
+
+    Notes
+    -----
+    Replacement is staged by reloading side and applied by the stage
+    itself between batches via `swap_staged`, so a batch is always
+    processed by single plugin instance. Replacement instance is
+    expected to be fully initialized (e.g. opened and warmed up for
+    output plugins) before staging and the replaced instance is
+    expected to be finalized by the stage after swapping.
+    """
+
+    def __init__(self, plugin: P) -> None:
+        self._plugin = plugin
+        self._staged: P | None = None
+        self._lock = Lock()
+
+    def stage(self, plugin: P) -> P | None:
+        """Stage plugin instance to replace current one.
+
+        Parameters
+        ----------
+        plugin : P
+            Replacement plugin instance
+
+        Returns
+        -------
+        P | None
+            Previously staged instance that is not applied and
+            discarded, it should be finalized by caller
+        """
+        with self._lock:
+            discarded = self._staged
+            self._staged = plugin
+
+        return discarded
+
+    def swap_staged(self) -> P | None:
+        """Replace current plugin instance with staged one if any.
+
+        Returns
+        -------
+        P | None
+            Replaced plugin instance or `None` if nothing is staged
+        """
+        with self._lock:
+            if self._staged is None:
+                return None
+
+            replaced = self._plugin
+            self._plugin = self._staged
+            self._staged = None
+
+        return replaced
+
+    @property
+    def plugin(self) -> P:
+        """Current plugin instance."""
+        return self._plugin
+
+    @property
+    def has_staged(self) -> bool:
+        """Whether replacement is staged."""
+        return self._staged is not None
+
+
+class ReloadSignal:
+    """Flag of requested configuration reload that can be set by
+    signal (e.g. SIGHUP) or by control endpoint.
+    """
+
+    def __init__(self) -> None:
+        self._event = Event()
+
+    def install(self, signum: int = signal.SIGHUP) -> None:
+        """Install handler of signal that requests reload.
+
+        Parameters
+        ----------
+        signum : int, default=signal.SIGHUP
+            Signal number
+
+        Raises
+        ------
+        ValueError
+            If method is called not from the main thread of the main
+            interpreter
+        """
+        signal.signal(signum, lambda *_: self.request())
+
+    def request(self) -> None:
+        """Request reload."""
+        self._event.set()
+
+    def consume(self) -> bool:
+        """Check whether reload is requested and reset the request.
+
+        Returns
+        -------
+        bool
+            Whether reload is requested
+        """
+        if not self._event.is_set():
+            return False
+
+        self._event.clear()
+        return True
+
+    def wait(self, timeout: float | None = None) -> bool:
+        """Wait for reload request and reset it.
+
+        Parameters
+        ----------
+        timeout : float | None, default=None
+            Timeout (in seconds) of waiting, not limited if value is
+            `None`
+
+        Returns
+        -------
+        bool
+            Whether reload is requested
+        """
+        if not self._event.wait(timeout):
+            return False
+
+        self._event.clear()
+        return True
+
+
+def validate_configs(
+    plugins: Mapping[K, PluginInfo],
+    configs: Mapping[K, Any]
+) -> dict[K, BaseModel]:
+    """Validate raw configs of plugins through their config models.
+
+    Parameters
+    ----------
+    plugins : Mapping[K, PluginInfo]
+        Information of plugins by their keys
+
+    configs : Mapping[K, Any]
+        Raw configs of plugins by their keys (e.g. parsed from file)
+
+    Returns
+    -------
+    dict[K, BaseModel]
+        Validated configs
+
+    Raises
+    ------
+    PluginConfigurationError
+        If plugin of some config is unknown or config is invalid
+    """
+    validated: dict[K, BaseModel] = dict()
+
+    for key, config in configs.items():
+        if key not in plugins:
+            raise PluginConfigurationError(
+                'Plugin of config is unknown',
+                context=dict(plugin_key=key)
+            )
+
+        plugin_info = plugins[key]
+        try:
+            validated[key] = TypeAdapter(
+                plugin_info.config_cls
+            ).validate_python(config)
+        except ValidationError as e:
+            raise PluginConfigurationError(
+                'Bad plugin configuration structure',
+                context=dict(
+                    plugin_key=key,
+                    plugin_name=plugin_info.name,
+                    reason=str(e)
+                )
+            ) from None
+
+    return validated
+
+
+def _plan_staging(
+    slots: Mapping[K, PluginSlot[Plugin]],
+    plugins: Mapping[K, PluginInfo],
+    configs: Mapping[K, Any]
+) -> tuple[dict[K, BaseModel], ReloadPlan[K]]:
+    """Validate new configs of running plugins and plan reload.
+
+    Parameters
+    ----------
+    slots : Mapping[K, PluginSlot[Plugin]]
+        Slots of running plugins by their keys
+
+    plugins : Mapping[K, PluginInfo]
+        Information of plugins by their keys
+
+    configs : Mapping[K, Any]
+        New raw configs of plugins by their keys
+
+    Returns
+    -------
+    tuple[dict[K, BaseModel], ReloadPlan[K]]
+        Validated configs and plan of reload
+
+    Raises
+    ------
+    PluginConfigurationError
+        If some new config is invalid
+    """
+    validated = validate_configs(plugins, configs)
+
+    plan = plan_reload(
+        current={key: slot.plugin.config for key, slot in slots.items()},
+        new=validated
+    )
+
+    return validated, plan
+
+
+def stage_reload(
+    slots: Mapping[K, PluginSlot[Plugin]],
+    plugins: Mapping[K, PluginInfo],
+    configs: Mapping[K, Any],
+    params: Mapping[K, PluginParams],
+    prepare: Callable[[Plugin], None] | None = None,
+    finalize: Callable[[Plugin], None] | None = None
+) -> ReloadPlan[K]:
+    """Validate new configs of running plugins and stage replacements
+    of plugins with changed configs in their slots.
+
+    Parameters
+    ----------
+    slots : Mapping[K, PluginSlot[Plugin]]
+        Slots of running plugins by their keys
+
+    plugins : Mapping[K, PluginInfo]
+        Information of plugins by their keys, it must cover all keys
+        of new configs
+
+    configs : Mapping[K, Any]
+        New raw configs of plugins by their keys
+
+    params : Mapping[K, PluginParams]
+        Parameters for new instances of plugins by their keys
+
+    prepare : Callable[[Plugin], None] | None, default=None
+        Callback that initializes new instance before it is staged
+
+    finalize : Callable[[Plugin], None] | None, default=None
+        Callback that finalizes instance that is created or staged
+        but not applied
+
+    Returns
+    -------
+    ReloadPlan[K]
+        Plan of reload, added and removed plugins are expected to be
+        handled by caller since they change topology of pipeline
+
+    Raises
+    ------
+    PluginConfigurationError
+        If some new config is invalid or new instance cannot be
+        initialized, nothing is staged in this case
+
+    Notes
+    -----
+    All configs are validated and all new instances are initialized
+    before staging, so reload is applied either to all changed plugins
+    or to none of them. Staged instances are swapped in by stages
+    between batches (see `PluginSlot`). For plugins with asynchronous
+    initialization (e.g. output plugins) use `astage_reload`.
+    """
+    validated, plan = _plan_staging(slots, plugins, configs)
+
+    replacements: dict[K, Plugin] = dict()
+    try:
+        for key in plan.changed:
+            plugin = plugins[key].cls(
+                config=validated[key],
+                params=params[key]
+            )
+            if prepare is not None:
+                prepare(plugin)
+
+            replacements[key] = plugin
+    except Exception:
+        if finalize is not None:
+            for plugin in replacements.values():
+                finalize(plugin)
+        raise
+
+    for key, plugin in replacements.items():
+        discarded = slots[key].stage(plugin)
+        if discarded is not None and finalize is not None:
+            finalize(discarded)
+
+    return plan
+
+
+async def astage_reload(
+    slots: Mapping[K, PluginSlot[Plugin]],
+    plugins: Mapping[K, PluginInfo],
+    configs: Mapping[K, Any],
+    params: Mapping[K, PluginParams],
+    prepare: Callable[[Plugin], Awaitable[None]] | None = None,
+    finalize: Callable[[Plugin], Awaitable[None]] | None = None
+) -> ReloadPlan[K]:
+    """Asynchronous variant of `stage_reload` for plugins that are
+    initialized and finalized asynchronously (e.g. output plugins that
+    are opened and warmed up before staging).
+
+    Parameters
+    ----------
+    slots : Mapping[K, PluginSlot[Plugin]]
+        Slots of running plugins by their keys
+
+    plugins : Mapping[K, PluginInfo]
+        Information of plugins by their keys, it must cover all keys
+        of new configs
+
+    configs : Mapping[K, Any]
+        New raw configs of plugins by their keys
+
+    params : Mapping[K, PluginParams]
+        Parameters for new instances of plugins by their keys
+
+    prepare : Callable[[Plugin], Awaitable[None]] | None, default=None
+        Coroutine function that initializes new instance before it is
+        staged (e.g. warms up output plugin)
+
+    finalize : Callable[[Plugin], Awaitable[None]] | None, default=None
+        Coroutine function that finalizes instance that is created or
+        staged but not applied (e.g. closes output plugin)
+
+    Returns
+    -------
+    ReloadPlan[K]
+        Plan of reload, added and removed plugins are expected to be
+        handled by caller since they change topology of pipeline
+
+    Raises
+    ------
+    PluginConfigurationError
+        If some new config is invalid or new instance cannot be
+        initialized, nothing is staged in this case
+
+    PluginRuntimeError
+        If new instance fails to be prepared, nothing is staged in
+        this case
+    """
+    validated, plan = _plan_staging(slots, plugins, configs)
+
+    replacements: dict[K, Plugin] = dict()
+    try:
+        for key in plan.changed:
+            plugin = plugins[key].cls(
+                config=validated[key],
+                params=params[key]
+            )
+            replacements[key] = plugin
+
+            if prepare is not None:
+                await prepare(plugin)
+    except BaseException:
+        if finalize is not None:
+            for plugin in replacements.values():
+                await finalize(plugin)
+        raise
+
+    for key, plugin in replacements.items():
+        discarded = slots[key].stage(plugin)
+        if discarded is not None and finalize is not None:
+            await finalize(discarded)
+
+    return plan
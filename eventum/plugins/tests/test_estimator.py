@@ -0,0 +1,104 @@
+import pytest
+
+from eventum.plugins.estimator import (StageEstimate, benchmark_producing,
+                                       estimate_capacity, estimate_input_rate)
+from eventum.plugins.event.base.config import EventPluginConfig
+from eventum.plugins.event.base.plugin import (EventPlugin, EventPluginParams,
+                                               ProduceParams)
+from eventum.plugins.input.plugins.cron.config import CronInputPluginConfig
+from eventum.plugins.input.plugins.time_patterns.config import \
+    TimePatternConfig
+from eventum.plugins.input.plugins.timer.config import TimerInputPluginConfig
+from eventum.plugins.output.fields import RoutingConfig
+
+
+class FakeEventPluginConfig(EventPluginConfig, frozen=True):
+    pass
+
+
+class FakeEventPlugin(
+    EventPlugin[FakeEventPluginConfig, EventPluginParams],
+    register=False
+):
+    def produce(self, params: ProduceParams) -> list[str]:
+        return [event for event, _ in self.produce_with_aliases(params)]
+
+    def produce_with_aliases(
+        self,
+        params: ProduceParams
+    ) -> list[tuple[str, str | None]]:
+        return [('a' * 10, 'short'), ('b' * 100, 'long')]
+
+
+def make_time_pattern(direction: str) -> TimePatternConfig:
+    return TimePatternConfig.model_validate({
+        'label': 'test',
+        'oscillator': {
+            'period': 1,
+            'unit': 'minutes',
+            'start': 'now',
+            'end': 'never'
+        },
+        'multiplier': {'ratio': 600},
+        'randomizer': {'deviation': 0.5, 'direction': direction},
+        'spreader': {
+            'distribution': 'uniform',
+            'parameters': {'low': 0, 'high': 1}
+        }
+    })
+
+
+def test_estimate_timer_rate():
+    config = TimerInputPluginConfig(seconds=2, count=10)
+    assert estimate_input_rate(config) == 5
+
+
+def test_estimate_cron_rate():
+    config = CronInputPluginConfig(
+        expression='*/5 * * * *',
+        count=30,
+        start='now',
+        end='never'
+    )
+    assert estimate_input_rate(config) == pytest.approx(0.1)
+
+
+def test_estimate_time_patterns_rate():
+    assert estimate_input_rate(make_time_pattern('mixed')) == 10
+    assert estimate_input_rate(make_time_pattern('decrease')) == 7.5
+    assert estimate_input_rate(
+        [make_time_pattern('mixed'), make_time_pattern('increase')]
+    ) == 22.5
+
+
+def test_estimate_unsupported_rate():
+    with pytest.raises(ValueError):
+        estimate_input_rate([1, 2])
+
+
+def test_capacity_report():
+    plugin = FakeEventPlugin(config=FakeEventPluginConfig(), params={'id': 1})
+    benchmark = benchmark_producing(plugin, count=100)
+
+    assert benchmark.events_per_call == 2
+    assert benchmark.sizes['short'].mean == 10
+    assert benchmark.sizes['long'].p95 == 100
+    assert benchmark.mean_size == 55
+
+    report = estimate_capacity(
+        timestamps_rate=10,
+        producing=benchmark,
+        outputs={
+            'all': None,
+            'long': RoutingConfig(template_aliases=('long', ))
+        },
+        stages=[
+            StageEstimate(name='output', required_rate=20, capacity=1)
+        ]
+    )
+
+    assert report.events_rate == 20
+    assert report.output_bytes_rate == {'all': 1100, 'long': 1000}
+    assert report.bottleneck is not None
+    assert report.bottleneck.name == 'output'
+    assert 'Bottleneck: output' in report.format()
@@ -0,0 +1,201 @@
+import os
+import signal
+
+import pytest
+from pydantic import HttpUrl
+from pytz import timezone
+
+from eventum.plugins.exceptions import PluginConfigurationError
+from eventum.plugins.input.plugins.static.config import StaticInputPluginConfig
+from eventum.plugins.input.plugins.static.plugin import StaticInputPlugin
+from eventum.plugins.loader import load_input_plugin, load_output_plugin
+from eventum.plugins.output.plugins.null.config import NullOutputPluginConfig
+from eventum.plugins.output.plugins.null.plugin import NullOutputPlugin
+from eventum.plugins.output.plugins.opensearch.config import \
+    OpensearchOutputPluginConfig
+from eventum.plugins.reload import (PluginSlot, ReloadPlan, ReloadSignal,
+                                    astage_reload, plan_reload, stage_reload)
+
+pytest_plugins = ('pytest_asyncio',)
+
+
+def make_config(index: str) -> OpensearchOutputPluginConfig:
+    return OpensearchOutputPluginConfig(
+        hosts=[HttpUrl('https://localhost:9200')],
+        username='admin',
+        password='pass',
+        index=index
+    )
+
+
+def test_plan_reload():
+    current = {
+        1: make_config('first'),
+        2: make_config('second'),
+        3: make_config('third'),
+    }
+    new = {
+        1: make_config('first'),
+        2: make_config('changed'),
+        4: make_config('fourth'),
+    }
+
+    plan = plan_reload(current, new)
+
+    assert plan == ReloadPlan(
+        unchanged=(1, ),
+        changed=(2, ),
+        added=(4, ),
+        removed=(3, )
+    )
+    assert not plan.is_empty
+    assert plan_reload(current, current).is_empty
+
+
+def test_plugin_slot():
+    slot = PluginSlot('first')
+
+    assert slot.swap_staged() is None
+    assert slot.plugin == 'first'
+
+    assert slot.stage('second') is None
+    assert slot.stage('third') == 'second'
+    assert slot.has_staged
+    assert slot.plugin == 'first'
+
+    assert slot.swap_staged() == 'first'
+    assert slot.plugin == 'third'
+    assert not slot.has_staged
+
+
+def test_reload_signal():
+    reload_signal = ReloadSignal()
+    previous_handler = signal.getsignal(signal.SIGHUP)
+
+    try:
+        reload_signal.install()
+        assert not reload_signal.consume()
+
+        os.kill(os.getpid(), signal.SIGHUP)
+
+        assert reload_signal.wait(timeout=1)
+        assert not reload_signal.consume()
+    finally:
+        signal.signal(signal.SIGHUP, previous_handler)
+
+
+def test_stage_reload():
+    params = {
+        key: {'id': key, 'live_mode': False, 'timezone': timezone('UTC')}
+        for key in (1, 2)
+    }
+    slots = {
+        key: PluginSlot(
+            StaticInputPlugin(
+                config=StaticInputPluginConfig(count=key),
+                params=params[key]
+            )
+        )
+        for key in (1, 2)
+    }
+    plugins = {key: load_input_plugin('static') for key in (1, 2)}
+    prepared = []
+    finalized = []
+
+    with pytest.raises(PluginConfigurationError):
+        stage_reload(
+            slots=slots,
+            plugins=plugins,
+            configs={1: {'count': 1}, 2: {'count': 0}},
+            params=params,
+        )
+
+    assert not slots[2].has_staged
+
+    plan = stage_reload(
+        slots=slots,
+        plugins=plugins,
+        configs={1: {'count': 1}, 2: {'count': 5}},
+        params=params,
+        prepare=prepared.append,
+        finalize=finalized.append
+    )
+
+    assert plan == ReloadPlan(
+        unchanged=(1, ), changed=(2, ), added=(), removed=()
+    )
+    assert not slots[1].has_staged
+    assert slots[2].has_staged
+    assert finalized == []
+
+    replaced = slots[2].swap_staged()
+
+    assert replaced is not None and replaced.config.count == 2
+    assert slots[2].plugin is prepared[0]
+    assert slots[2].plugin.config.count == 5
+
+
+@pytest.mark.asyncio
+async def test_astage_reload():
+    params = {key: {'id': key} for key in (1, 2, 3)}
+    slots = {
+        key: PluginSlot(
+            NullOutputPlugin(
+                config=NullOutputPluginConfig(),
+                params=params[key]
+            )
+        )
+        for key in (1, 2, 3)
+    }
+    plugins = {key: load_output_plugin('null') for key in (1, 2, 3)}
+    finalized = []
+
+    async def finalize(plugin):
+        await plugin.close()
+        finalized.append(plugin)
+
+    async def failing_prepare(plugin):
+        await plugin.open()
+        if plugin.id == 3:
+            raise RuntimeError('cannot open')
+
+    with pytest.raises(RuntimeError):
+        await astage_reload(
+            slots=slots,
+            plugins=plugins,
+            configs={key: {'formatting': True} for key in (1, 2, 3)},
+            params=params,
+            prepare=failing_prepare,
+            finalize=finalize
+        )
+
+    assert not any(slot.has_staged for slot in slots.values())
+    assert len(finalized) == 3
+
+    finalized.clear()
+
+    async def prepare(plugin):
+        await plugin.open()
+        await plugin.warm_up()
+
+    plan = await astage_reload(
+        slots=slots,
+        plugins=plugins,
+        configs={1: {}, 2: {'formatting': True}, 3: {}},
+        params=params,
+        prepare=prepare,
+        finalize=finalize
+    )
+
+    assert plan == ReloadPlan(
+        unchanged=(1, 3), changed=(2, ), added=(), removed=()
+    )
+    assert slots[2].has_staged
+    assert finalized == []
+
+    slots[2].swap_staged()
+
+    assert slots[2].plugin.config.formatting
+    assert await slots[2].plugin.write(['event']) == 1
+
+    await slots[2].plugin.close()